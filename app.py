@@ -3,7 +3,8 @@ import time
 from pathlib import Path
 
 import streamlit as st
-from converter import ReadmeToWordConverter
+
+from readme2word.converter import ReadmeToWordConverter
 
 
 def load_custom_css(theme="light"):
@@ -285,6 +286,14 @@ def create_stats_display(stats):
     )
 
 
+@st.cache_resource
+def warm_up_converter():
+    """Load the Markdown parser and document template once per process"""
+    converter = ReadmeToWordConverter()
+    converter.set_debug_mode(False)
+    return converter.warmup()
+
+
 def main():
     st.set_page_config(
         page_title="README to Word Converter",
@@ -311,7 +320,9 @@ def main():
     # Features
     create_feature_cards()
 
-    # Initialize converter
+    # Initialize converter. readme2word-web warms the shared parser and
+    # template before serving; this covers `streamlit run app.py`
+    warm_up_converter()
     converter = ReadmeToWordConverter()
 
     # Sidebar
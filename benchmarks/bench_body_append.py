@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark appending blocks to a document body
+
+Adds the same mix of headings and paragraphs through
+python-docx's Document methods and through BodyBuilder, for documents of
+increasing size. The time per block stays flat for BodyBuilder while it
+grows with the document for python-docx, which scans the body for its
+final section properties on every append.
+
+Usage:
+    python benchmarks/bench_body_append.py
+    python benchmarks/bench_body_append.py --blocks 1000 10000 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, List
+
+from docx import Document
+
+# Add parent directory to path to import readme2word
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from readme2word.body import BodyBuilder  # noqa: E402
+
+
+def add_blocks(target: Any, count: int) -> None:
+    """Add count blocks: mostly paragraphs, with a heading every tenth block"""
+    for n in range(count):
+        if n % 10 == 0:
+            target.add_heading(f"Section {n}", 2)
+        else:
+            target.add_paragraph(f"Paragraph {n} of the generated document.")
+
+
+def time_append(count: int, builder: bool) -> float:
+    """Wall time in seconds to add count blocks to a new document"""
+    doc = Document()
+    start = time.perf_counter()
+    add_blocks(BodyBuilder(doc) if builder else doc, count)
+    return time.perf_counter() - start
+
+
+def run_benchmark(sizes: List[int]) -> None:
+    """Time both append paths for each document size"""
+    print(
+        f"{'blocks':>8} {'BodyBuilder':>12} {'per block':>10} "
+        f"{'Document':>10} {'per block':>10}"
+    )
+    for count in sizes:
+        fast = time_append(count, builder=True)
+        slow = time_append(count, builder=False)
+        print(
+            f"{count:8d} {fast:11.3f}s {fast / count * 1e6:8.1f}us "
+            f"{slow:9.3f}s {slow / count * 1e6:8.1f}us"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--blocks",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 20000, 50000],
+        help="Document sizes to build, in blocks (default: 1000 5000 20000 50000)",
+    )
+    args = parser.parse_args()
+    run_benchmark(args.blocks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark the BeautifulSoup parser backends on large generated documents
+
+Generates markdown documents of increasing size, converts each to HTML once
+and times how long every installed parser takes to build the tree the
+converter walks.
+
+Usage:
+    python benchmarks/bench_html_parsers.py
+    python benchmarks/bench_html_parsers.py --sections 500 2000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import markdown
+
+# Add parent directory to path to import readme2word
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from readme2word.parsers import (  # noqa: E402
+    HTML_PARSERS,
+    available_html_parsers,
+    get_default_html_parser,
+    parse_html_blocks,
+)
+from readme2word.resources import MARKDOWN_EXTENSIONS  # noqa: E402
+
+SECTION = """## Section {n}
+
+Paragraph {n} with **bold**, *italic*, `inline code` and a [link](https://example.com/{n}).
+
+- First item {n}
+- Second item with `code`
+  - Nested item
+
+| Name | Value | Notes |
+|------|-------|-------|
+| alpha | {n} | first |
+| beta | {n} | second |
+
+```python
+def section_{n}():
+    return {n}
+```
+
+> Quote for section {n}
+
+"""
+
+
+def generate_document(sections: int) -> str:
+    """Markdown document with the given number of mixed-content sections"""
+    return "# Benchmark\n\n" + "".join(SECTION.format(n=n) for n in range(sections))
+
+
+def time_parser(html: str, parser: str, repeat: int) -> float:
+    """Best wall time in seconds to parse html with parser"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_html_blocks(html, parser)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes: List[int], repeat: int) -> Dict[int, Dict[str, float]]:
+    """Time every installed parser for each document size"""
+    parsers = available_html_parsers()
+    results: Dict[int, Dict[str, float]] = {}
+    for sections in sizes:
+        md = markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+        html = md.convert(generate_document(sections))
+        results[sections] = {
+            parser: time_parser(html, parser, repeat) for parser in parsers
+        }
+        size_kb = len(html.encode("utf-8")) / 1024
+        timings = "  ".join(
+            f"{parser}={seconds * 1000:8.1f}ms"
+            for parser, seconds in results[sections].items()
+        )
+        print(f"{sections:6d} sections {size_kb:9.0f} KB HTML  {timings}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sections",
+        type=int,
+        nargs="+",
+        default=[100, 500, 2000],
+        help="Document sizes to generate, in sections (default: 100 500 2000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per parser and size; the best time is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    missing = [name for name in HTML_PARSERS if name not in available_html_parsers()]
+    print(f"Default parser: {get_default_html_parser()}")
+    if missing:
+        print(f"Not installed: {', '.join(missing)}")
+    print()
+    run_benchmark(args.sections, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
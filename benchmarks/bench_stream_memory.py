@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of the docx and stream output backends
+
+Builds documents of increasing size from generated sections (a heading,
+paragraphs, a small table and, every hundred sections, a distinct image)
+with each backend, in a fresh process per run, and reports the peak
+resident memory of that process. The docx backend grows with the
+document; the stream backend stays flat.
+
+Usage:
+    python benchmarks/bench_stream_memory.py
+    python benchmarks/bench_stream_memory.py --sections 1000 10000 50000
+"""
+
+import argparse
+import io
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from docx.shared import Inches
+from PIL import Image
+
+# Add parent directory to path to import readme2word
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from readme2word.body import BodyBuilder  # noqa: E402
+from readme2word.resources import ConversionResources  # noqa: E402
+from readme2word.streaming import OUTPUT_BACKENDS, StreamingBodyBuilder  # noqa: E402
+from readme2word.tables import build_table  # noqa: E402
+
+
+def make_image(n: int) -> io.BytesIO:
+    """A distinct 800x600 PNG"""
+    buffer = io.BytesIO()
+    Image.effect_noise((800, 600), 40 + n % 50).save(buffer, "PNG")
+    buffer.seek(0)
+    return buffer
+
+
+def build(backend: str, sections: int, scratch: Path) -> None:
+    """Write a generated document with the given backend"""
+    doc = ConversionResources().new_document()
+    output = scratch / f"{backend}.docx"
+    if backend == "stream":
+        body: BodyBuilder = StreamingBodyBuilder(doc, output, scratch)
+    else:
+        body = BodyBuilder(doc)
+    for n in range(sections):
+        body.add_heading(f"Section {n}", 2)
+        for line in range(3):
+            body.add_paragraph(f"Paragraph {line} of section {n}, with some text.")
+        build_table(body, [[("Key", True), ("Value", True)], [(str(n), False)] * 2])
+        if n % 100 == 0:
+            body.add_picture(make_image(n), width=Inches(4))
+    body.save(output)
+
+
+def run_child(backend: str, sections: int) -> None:
+    """Build one document and print seconds, peak RSS in MB and file size"""
+    with tempfile.TemporaryDirectory() as scratch:
+        start = time.perf_counter()
+        build(backend, sections, Path(scratch))
+        seconds = time.perf_counter() - start
+        size = (Path(scratch) / f"{backend}.docx").stat().st_size
+    # ru_maxrss is in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{seconds:.3f} {peak_mb:.1f} {size / 1024 / 1024:.1f}")
+
+
+def run_benchmark(sizes: List[int]) -> None:
+    """Measure every backend for each document size in a fresh process"""
+    print(
+        f"{'sections':>9} {'backend':>8} {'seconds':>9} {'peak RSS':>10} {'output':>9}"
+    )
+    for sections in sizes:
+        for backend in OUTPUT_BACKENDS:
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", backend, str(sections)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            seconds, peak_mb, size_mb = result.stdout.split()
+            print(
+                f"{sections:9d} {backend:>8} {float(seconds):8.2f}s "
+                f"{float(peak_mb):8.1f}MB {float(size_mb):7.1f}MB"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sections",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 20000],
+        help="Document sizes to build, in sections (default: 1000 5000 20000)",
+    )
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.child[0], int(args.child[1]))
+    else:
+        run_benchmark(args.sections)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark table construction on large generated tables
+
+Times build_table() on tables of increasing size and, for sizes small
+enough to finish, the cell-by-cell python-docx loop it replaced. The
+time per row stays flat for build_table() while it grows with the table
+for the cell-by-cell loop.
+
+Usage:
+    python benchmarks/bench_tables.py
+    python benchmarks/bench_tables.py --rows 1000 10000 50000 --legacy-max-rows 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from docx import Document
+
+# Add parent directory to path to import readme2word
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from readme2word.tables import TableCell, build_table  # noqa: E402
+
+COLUMNS = ("Endpoint", "Method", "Status", "Description")
+
+
+def generate_rows(count: int) -> List[List[TableCell]]:
+    """A header row followed by count API-reference style rows"""
+    rows = [[(name, True) for name in COLUMNS]]
+    for n in range(count):
+        rows.append(
+            [
+                (f"/api/v1/resource/{n}", False),
+                ("GET" if n % 2 else "POST", False),
+                (str(200 + n % 5), False),
+                (f"Operation {n} on the resource", False),
+            ]
+        )
+    return rows
+
+
+def build_cell_by_cell(doc: Document, rows: List[List[TableCell]]) -> None:
+    """The previous construction: add_table, then fill each cell()"""
+    cols = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=cols)
+    table.style = "Table Grid"
+    for i, row in enumerate(rows):
+        for j, (text, header) in enumerate(row):
+            table.cell(i, j).text = text
+            if header:
+                for paragraph in table.cell(i, j).paragraphs:
+                    for run in paragraph.runs:
+                        run.bold = True
+
+
+def time_build(build: Callable, rows: List[List[TableCell]]) -> float:
+    """Wall time in seconds to build rows into a new document"""
+    doc = Document()
+    start = time.perf_counter()
+    build(doc, rows)
+    return time.perf_counter() - start
+
+
+def run_benchmark(sizes: List[int], legacy_max_rows: int) -> None:
+    """Time both builders for each table size"""
+    print(
+        f"{'rows':>8} {'build_table':>12} {'per row':>10} {'cell()':>10} {'per row':>10}"
+    )
+    for count in sizes:
+        rows = generate_rows(count)
+        fast = time_build(build_table, rows)
+        line = f"{count:8d} {fast:11.3f}s {fast / count * 1e6:8.1f}us"
+        if count <= legacy_max_rows:
+            slow = time_build(build_cell_by_cell, rows)
+            line += f" {slow:9.3f}s {slow / count * 1e6:8.1f}us"
+        else:
+            line += f" {'skipped':>10}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100, 200, 1000, 10000, 50000],
+        help="Table sizes to build, in rows (default: 100 200 1000 10000 50000)",
+    )
+    parser.add_argument(
+        "--legacy-max-rows",
+        type=int,
+        default=200,
+        help="Largest table to build cell by cell (default: 200)",
+    )
+    args = parser.parse_args()
+    run_benchmark(args.rows, args.legacy_max_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,15 +16,61 @@ __email__ = "vishal@example.com"
 __license__ = "MIT"
 __description__ = "Convert README.md files to professional Word documents with Mermaid diagram support"
 
-from .cli import main as cli_main
-
 # Main imports
+from .bundle import DiagramBundle
+from .cache import (
+    DiagramCache,
+    NegativeCache,
+    get_default_cache,
+    get_default_negative_cache,
+)
+from .cli import main as cli_main
 from .converter import ReadmeToWordConverter
+from .diskcache import SQLiteDiagramCache
+from .highlight import CodeHighlighter, get_default_highlighter
+from .postprocess import optimize_png
+from .prerender import prerender_diagrams
+from .renderers import (
+    CodeBlockRenderer,
+    DiagramRenderer,
+    DiagramRenderError,
+    MermaidInkRenderer,
+    create_renderer,
+)
+from .resources import ConversionResources, get_default_resources
+from .singleflight import SingleFlight, get_default_singleflight
+from .transport import DiagramTransport, get_default_transport
+from .validation import ValidationIssue, validate_mermaid
 from .web import main as web_main
+from .workspace import ConversionWorkspace
 
 # Package metadata
 __all__ = [
     "ReadmeToWordConverter",
+    "DiagramCache",
+    "get_default_cache",
+    "NegativeCache",
+    "get_default_negative_cache",
+    "SQLiteDiagramCache",
+    "DiagramBundle",
+    "prerender_diagrams",
+    "optimize_png",
+    "validate_mermaid",
+    "ValidationIssue",
+    "DiagramTransport",
+    "get_default_transport",
+    "DiagramRenderer",
+    "DiagramRenderError",
+    "MermaidInkRenderer",
+    "CodeBlockRenderer",
+    "create_renderer",
+    "ConversionWorkspace",
+    "ConversionResources",
+    "get_default_resources",
+    "CodeHighlighter",
+    "get_default_highlighter",
+    "SingleFlight",
+    "get_default_singleflight",
     "cli_main",
     "web_main",
     "__version__",
@@ -0,0 +1,142 @@
+"""
+Append-only document body builder for README to Word Converter
+
+python-docx adds every paragraph and table in front of the body's final
+``w:sectPr``, which it finds by scanning the body's children, so building
+a document block by block takes quadratic time. BodyBuilder finds the
+``w:sectPr`` once and inserts in front of it directly. It offers the
+``add_*`` methods of python-docx's ``Document`` and produces the same XML.
+
+Resolving a style name walks every style in the document, which costs
+more than the append itself, so each name is resolved once per document.
+"""
+
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Union
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
+from docx.oxml.table import CT_Tbl
+from docx.shared import Emu, Inches, Length
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from .oxml import append_run
+from .svg import attach_svg
+
+
+class BodyBuilder:
+    """Appends block content to the end of a document's body in constant time
+
+    Content added through the document itself while a builder is in use
+    is placed correctly too; the builder only remembers the body's final
+    ``w:sectPr``, which never moves.
+    """
+
+    def __init__(self, document: Any):
+        self.document = document
+        self._body = document.element.body
+        self._sect_pr = self._body.sectPr
+        # Proxy python-docx uses as the parent of top-level blocks
+        self._parent = document._body
+        self._block_width: Optional[Length] = None
+        self._style_ids: Dict[str, Optional[str]] = {}
+
+    @property
+    def block_width(self) -> Length:
+        """Space between the margins of the last section, as python-docx computes it"""
+        if self._block_width is None:
+            section = self.document.sections[-1]
+            page_width = section.page_width or Inches(8.5)
+            left_margin = section.left_margin or Inches(1)
+            right_margin = section.right_margin or Inches(1)
+            self._block_width = Emu(page_width - left_margin - right_margin)
+        return self._block_width
+
+    @property
+    def part(self) -> Any:
+        """The document part, for relationships to images and other parts"""
+        return self.document.part
+
+    def append(self, element: Any) -> None:
+        """Append a block-level element (``w:p``, ``w:tbl``) to the body"""
+        if self._sect_pr is not None:
+            self._sect_pr.addprevious(element)
+        else:
+            self._body.append(element)
+
+    def set_style(self, paragraph: Paragraph, style: Any) -> None:
+        """Set a paragraph's style like ``paragraph.style = style``
+
+        Raises KeyError for unknown style names, as python-docx does.
+        """
+        if not isinstance(style, str):
+            paragraph.style = style
+            return
+        try:
+            style_id = self._style_ids[style]
+        except KeyError:
+            style_id = self.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+            self._style_ids[style] = style_id
+        paragraph._p.style = style_id
+
+    def add_paragraph(self, text: str = "", style: Optional[Any] = None) -> Paragraph:
+        """Add a paragraph with text in a single run and the given style"""
+        p = OxmlElement("w:p")
+        self.append(p)
+        if text:
+            append_run(p, text)
+        paragraph = Paragraph(p, self._parent)
+        if style is not None:
+            self.set_style(paragraph, style)
+        return paragraph
+
+    def add_heading(self, text: str = "", level: int = 1) -> Paragraph:
+        """Add a heading paragraph; level 0 is the document title"""
+        if not 0 <= level <= 9:
+            raise ValueError("level must be in range 0-9, got %d" % level)
+        style = "Title" if level == 0 else "Heading %d" % level
+        return self.add_paragraph(text, style)
+
+    def add_page_break(self) -> Paragraph:
+        """Add a paragraph holding only a page break"""
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+
+    def add_picture(
+        self,
+        image: Union[str, IO[bytes]],
+        width: Optional[Length] = None,
+        height: Optional[Length] = None,
+    ) -> Any:
+        """Add a picture in its own paragraph and return its inline shape"""
+        run = self.add_paragraph().add_run()
+        return run.add_picture(image, width, height)
+
+    def attach_svg(self, picture: Any, svg_data: bytes) -> str:
+        """Add svg_data as the vector form of a picture added by add_picture"""
+        return attach_svg(self.document, picture, svg_data)
+
+    def add_table(self, rows: int, cols: int, style: Optional[Any] = None) -> Table:
+        """Add a table with columns sharing the width between the margins"""
+        tbl = CT_Tbl.new_tbl(rows, cols, self.block_width)
+        self.append(tbl)
+        table = Table(tbl, self._parent)
+        table.style = style
+        return table
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the document to path"""
+        self.document.save(str(path))
+
+    def discard(self) -> None:
+        """Abandon the document; nothing is written until save()"""
+
+
+def as_body_builder(doc: Any) -> BodyBuilder:
+    """doc itself if it is a BodyBuilder, else a builder for the document"""
+    if isinstance(doc, BodyBuilder):
+        return doc
+    return BodyBuilder(doc)
@@ -0,0 +1,124 @@
+"""
+Portable diagram bundles for README to Word Converter
+
+A bundle is a zip file holding pre-rendered diagram images keyed by the
+same content hash the diagram cache uses, plus a ``manifest.json``
+describing them. Bundles are written by ``readme2word prerender`` and let
+``convert(offline=True)`` embed diagrams without any network access.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+class DiagramBundle:
+    """Read-only at conversion time map of diagram keys to PNG bytes"""
+
+    def __init__(self):
+        self._images: Dict[str, bytes] = {}
+        self._themes: Dict[str, str] = {}
+        self._formats: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        key: str,
+        image_data: bytes,
+        theme: str = "default",
+        image_format: str = "png",
+    ) -> None:
+        """Add a rendered diagram under its cache key"""
+        with self._lock:
+            self._images[key] = image_data
+            self._themes[key] = theme
+            self._formats[key] = image_format
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the image stored under key, if any"""
+        with self._lock:
+            return self._images.get(key)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._images)
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._images
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the bundle as a zip file, replacing any existing file atomically"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            images = dict(self._images)
+            themes = dict(self._themes)
+            formats = dict(self._formats)
+
+        manifest = {
+            "version": BUNDLE_FORMAT_VERSION,
+            "diagrams": {
+                key: {
+                    "file": f"diagrams/{key}.{formats[key]}",
+                    "theme": themes[key],
+                    "format": formats[key],
+                    "bytes": len(data),
+                }
+                for key, data in sorted(images.items())
+            },
+        }
+
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                with zipfile.ZipFile(handle, "w") as archive:
+                    archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+                    for key, entry in manifest["diagrams"].items():
+                        # PNGs are already compressed; SVG markup is not
+                        compression = (
+                            zipfile.ZIP_DEFLATED
+                            if entry["format"] == "svg"
+                            else zipfile.ZIP_STORED
+                        )
+                        archive.writestr(entry["file"], images[key], compression)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DiagramBundle":
+        """Read a bundle written by ``save``"""
+        bundle = cls()
+        try:
+            with zipfile.ZipFile(path) as archive:
+                manifest = json.loads(archive.read(MANIFEST_NAME))
+                version = manifest.get("version")
+                if version != BUNDLE_FORMAT_VERSION:
+                    raise ValueError(
+                        f"Unsupported diagram bundle version {version!r} in {path}"
+                    )
+                for key, entry in manifest["diagrams"].items():
+                    bundle.add(
+                        key,
+                        archive.read(entry["file"]),
+                        entry.get("theme", "default"),
+                        entry.get("format", "png"),
+                    )
+        except (zipfile.BadZipFile, KeyError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid diagram bundle {path}: {e}") from e
+        return bundle
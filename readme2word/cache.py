@@ -0,0 +1,282 @@
+"""
+Diagram cache for README to Word Converter
+
+This module provides a bounded, thread-safe LRU cache for rendered Mermaid
+diagrams. Entries are keyed by a hash of the normalized diagram source and
+theme, so the same diagram is only fetched from the renderer once per process.
+
+The memory cache can be backed by a persistent store (see ``diskcache``) so
+diagrams survive restarts and are shared between processes.
+
+It also provides a negative cache that remembers diagrams which failed to
+render, so known-bad diagrams fall back to code blocks without a network call.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .diskcache import create_disk_cache_from_env
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+DEFAULT_NEGATIVE_TTL = 300.0  # seconds
+DEFAULT_TRANSIENT_NEGATIVE_TTL = 30.0  # seconds
+DEFAULT_NEGATIVE_MAX_ENTRIES = 1024
+
+
+def normalize_diagram_source(source: str) -> str:
+    """Normalize Mermaid source so cosmetic whitespace changes share a key."""
+    lines = source.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def diagram_cache_key(source: str, theme: str = "default", **options: Any) -> str:
+    """Build a content-addressed cache key from diagram source, theme and options.
+
+    Render options that change the image (such as its width) are part of the
+    key; options set to None are ignored so keys without them stay stable.
+    """
+    digest = hashlib.sha256()
+    digest.update(normalize_diagram_source(source).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(theme.encode("utf-8"))
+    for name, value in sorted(options.items()):
+        if value is not None:
+            digest.update(f"\0{name}={value}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DiagramCache:
+    """Bounded LRU cache mapping diagram keys to rendered image bytes
+
+    An optional ``backing`` cache (such as ``SQLiteDiagramCache``) is
+    consulted on memory misses and receives every stored entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backing: Optional[Any] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.backing = backing
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for key, or None on a miss"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        if self.backing is None:
+            return None
+        data = self.backing.get(key)
+        if data is not None:
+            # Promote so later lookups stay in memory
+            self._store(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store bytes for key, evicting least recently used entries"""
+        self._store(key, data)
+        if self.backing is not None:
+            self.backing.put(key, data)
+
+    def _store(self, key: str, data: bytes) -> None:
+        """Store bytes in memory only"""
+        size = len(data)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= len(previous)
+
+            self._entries[key] = data
+            self._current_bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._current_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all in-memory entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and current size"""
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+        if self.backing is not None:
+            stats["backing"] = self.backing.get_stats()
+        return stats
+
+
+class NegativeCache:
+    """Remember failed diagram renders for a limited time
+
+    Each entry records the error class of the failure. Definitive failures
+    (such as the renderer rejecting the diagram) are kept for ``ttl``
+    seconds; transient ones (timeouts, connection errors, 5xx responses)
+    only for ``transient_ttl`` seconds so an upstream blip heals quickly.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_NEGATIVE_TTL,
+        transient_ttl: float = DEFAULT_TRANSIENT_NEGATIVE_TTL,
+        max_entries: int = DEFAULT_NEGATIVE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.transient_ttl = transient_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stores = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the remembered error class for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            error_class, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self.hits += 1
+            return error_class
+
+    def put(self, key: str, error_class: str, transient: bool = False) -> None:
+        """Remember that key failed with error_class"""
+        ttl = self.transient_ttl if transient else self.ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (error_class, self._clock() + ttl)
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, key: str) -> None:
+        """Drop any remembered failure for key"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.stores = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get negative cache counters and settings"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stores": self.stores,
+                "ttl": self.ttl,
+                "transient_ttl": self.transient_ttl,
+            }
+
+
+_default_cache: Optional[DiagramCache] = None
+_default_negative_cache: Optional[NegativeCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> DiagramCache:
+    """Get the process-wide diagram cache shared by all converters.
+
+    Limits can be set with the ``README2WORD_CACHE_MAX_ENTRIES`` and
+    ``README2WORD_CACHE_MAX_BYTES`` environment variables. Setting
+    ``README2WORD_DISK_CACHE`` to a file path backs it with a persistent
+    SQLite cache.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DiagramCache(
+                max_entries=int(
+                    os.environ.get("README2WORD_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+                ),
+                max_bytes=int(
+                    os.environ.get("README2WORD_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+                ),
+                backing=create_disk_cache_from_env(),
+            )
+        return _default_cache
+
+
+def get_default_negative_cache() -> NegativeCache:
+    """Get the process-wide negative cache shared by all converters.
+
+    TTLs can be set with the ``README2WORD_NEGATIVE_CACHE_TTL`` and
+    ``README2WORD_NEGATIVE_CACHE_TRANSIENT_TTL`` environment variables.
+    """
+    global _default_negative_cache
+    with _default_cache_lock:
+        if _default_negative_cache is None:
+            _default_negative_cache = NegativeCache(
+                ttl=float(
+                    os.environ.get(
+                        "README2WORD_NEGATIVE_CACHE_TTL", DEFAULT_NEGATIVE_TTL
+                    )
+                ),
+                transient_ttl=float(
+                    os.environ.get(
+                        "README2WORD_NEGATIVE_CACHE_TRANSIENT_TTL",
+                        DEFAULT_TRANSIENT_NEGATIVE_TTL,
+                    )
+                ),
+            )
+        return _default_negative_cache
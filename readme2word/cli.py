@@ -9,10 +9,16 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from . import __description__, __version__
-from .converter import ReadmeToWordConverter
+from .converter import DIAGRAM_FORMATS, ENGINES, ReadmeToWordConverter
+from .highlight import CODE_MODES
+from .parsers import HTML_PARSERS
+from .prerender import prerender_diagrams
+from .renderers import RENDERER_CHOICES, DiagramRenderer, create_renderer
+from .streaming import OUTPUT_BACKENDS
+from .tables import TABLE_LAYOUTS
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -27,6 +33,12 @@ Examples:
   readme2word README.md -o report.docx     # Convert with custom output name
   readme2word README.md --debug            # Enable debug mode
   readme2word README.md --theme dark       # Use dark theme for diagrams
+  readme2word README.md --jobs 4           # Render diagrams 4 at a time
+  readme2word README.md --diagram-budget 10 # Spend at most 10s on diagrams
+  readme2word README.md --renderer custom --renderer-url http://mermaid:3000
+  readme2word prerender docs/ -o diagrams.zip  # Pre-render diagrams to a bundle
+  readme2word README.md --bundle diagrams.zip --offline  # No network access
+  readme2word README.md --optimize-diagrams  # Smaller, trimmed diagram images
   readme2word --web                        # Launch web interface
 
 For more information, visit: https://github.com/vishalm/readme2readall
@@ -49,6 +61,117 @@ For more information, visit: https://github.com/vishalm/readme2readall
         help="Mermaid diagram theme (default: default)",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of Mermaid diagrams to render concurrently (default: 1)",
+    )
+
+    parser.add_argument(
+        "--diagram-format",
+        choices=DIAGRAM_FORMATS,
+        default=None,
+        help="Embed diagrams as PNG, or as SVG vector images with a small PNG "
+        "fallback (default: $README2WORD_DIAGRAM_FORMAT or png)",
+    )
+
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=None,
+        help="Resolution to fetch diagrams at for their 6 inch embedded width; "
+        "0 keeps the renderer's size (default: $README2WORD_DIAGRAM_DPI or 150)",
+    )
+
+    parser.add_argument(
+        "--optimize-diagrams",
+        action="store_true",
+        default=None,
+        help="Trim margins, palette-quantize and recompress diagram PNGs "
+        "(default: $README2WORD_OPTIMIZE_DIAGRAMS or off)",
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=None,
+        help="Convert via an HTML round trip, or walk the Markdown tree "
+        "directly with 'ast' (default: $README2WORD_ENGINE or html)",
+    )
+
+    parser.add_argument(
+        "--html-parser",
+        choices=HTML_PARSERS,
+        default=None,
+        help="BeautifulSoup parser for generated HTML "
+        "(default: $README2WORD_HTML_PARSER or the fastest installed)",
+    )
+
+    parser.add_argument(
+        "--code-mode",
+        choices=CODE_MODES,
+        default=None,
+        help="Write code blocks as plain text, or syntax-highlight blocks "
+        "that name a language (default: $README2WORD_CODE_MODE or fast)",
+    )
+
+    parser.add_argument(
+        "--table-layout",
+        choices=TABLE_LAYOUTS,
+        default=None,
+        help="Let Word size table columns, or fix them from their content so "
+        "huge tables open quickly (default: $README2WORD_TABLE_LAYOUT or autofit)",
+    )
+
+    parser.add_argument(
+        "--output-backend",
+        choices=OUTPUT_BACKENDS,
+        default=None,
+        help="Build the document in memory, or stream it to the output file "
+        "to keep memory flat for huge documents "
+        "(default: $README2WORD_OUTPUT_BACKEND or docx)",
+    )
+
+    parser.add_argument(
+        "--diagram-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Total time to spend rendering diagrams; the rest stay code blocks "
+        "(default: $README2WORD_DIAGRAM_BUDGET_SECONDS or unlimited)",
+    )
+
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERER_CHOICES,
+        default=None,
+        help="Diagram renderer backend; 'none' keeps diagrams as code blocks "
+        "(default: $README2WORD_RENDERER or mermaid-ink)",
+    )
+
+    parser.add_argument(
+        "--renderer-url",
+        type=str,
+        default=None,
+        help="Base URL of a mermaid.ink compatible renderer for --renderer custom "
+        "(default: $README2WORD_RENDERER_URL)",
+    )
+
+    parser.add_argument(
+        "--bundle",
+        type=str,
+        default=None,
+        help="Diagram bundle written by 'readme2word prerender' to take images from",
+    )
+
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never render diagrams over the network; use the bundle and caches only",
+    )
+
     parser.add_argument(
         "--debug", action="store_true", help="Enable debug mode with verbose logging"
     )
@@ -70,6 +193,130 @@ For more information, visit: https://github.com/vishalm/readme2readall
     return parser
 
 
+def create_prerender_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the prerender command."""
+    parser = argparse.ArgumentParser(
+        prog="readme2word prerender",
+        description="Render every unique Mermaid diagram in a tree of markdown "
+        "files into a portable diagram bundle",
+    )
+
+    parser.add_argument(
+        "directory", type=str, help="Markdown file or directory to scan recursively"
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="diagrams.zip",
+        help="Bundle file to write (default: diagrams.zip)",
+    )
+
+    parser.add_argument(
+        "--theme",
+        choices=["default", "neutral", "dark", "forest"],
+        default="default",
+        help="Mermaid diagram theme (default: default)",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="Number of diagrams to render concurrently (default: 4)",
+    )
+
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERER_CHOICES,
+        default=None,
+        help="Diagram renderer backend (default: $README2WORD_RENDERER or mermaid-ink)",
+    )
+
+    parser.add_argument(
+        "--renderer-url",
+        type=str,
+        default=None,
+        help="Base URL of a mermaid.ink compatible renderer for --renderer custom",
+    )
+
+    parser.add_argument(
+        "--diagram-format",
+        choices=DIAGRAM_FORMATS,
+        default=None,
+        help="Also bundle SVG forms with 'svg' (default: $README2WORD_DIAGRAM_FORMAT "
+        "or png)",
+    )
+
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=None,
+        help="Diagram resolution; must match the DPI used when converting "
+        "(default: $README2WORD_DIAGRAM_DPI or 150)",
+    )
+
+    parser.add_argument(
+        "--optimize-diagrams",
+        action="store_true",
+        default=None,
+        help="Trim margins, palette-quantize and recompress diagram PNGs "
+        "(default: $README2WORD_OPTIMIZE_DIAGRAMS or off)",
+    )
+
+    parser.add_argument(
+        "--debug", action="store_true", help="Enable debug mode with verbose logging"
+    )
+
+    return parser
+
+
+def prerender_main(argv: List[str]) -> None:
+    """Entry point for ``readme2word prerender``."""
+    args = create_prerender_parser().parse_args(argv)
+
+    if not Path(args.directory).exists():
+        print(f"Error: '{args.directory}' does not exist.", file=sys.stderr)
+        sys.exit(1)
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        renderer = create_renderer(args.renderer, args.renderer_url)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    converter = ReadmeToWordConverter(
+        renderer=renderer,
+        diagram_dpi=args.dpi,
+        diagram_format=args.diagram_format,
+        optimize_diagrams=args.optimize_diagrams,
+    )
+    converter.set_debug_mode(args.debug)
+
+    print(f"Pre-rendering diagrams under '{args.directory}'...")
+    stats = prerender_diagrams(
+        args.directory,
+        args.output,
+        theme=args.theme,
+        max_workers=args.jobs,
+        converter=converter,
+    )
+
+    print(
+        f"✅ Rendered {stats['rendered']} of {stats['diagrams']} unique diagrams "
+        f"from {stats['files']} file(s)"
+    )
+    print(f"📦 Bundle: {stats['bundle']}")
+    if stats["failed"]:
+        print(f"⚠️  {stats['failed']} diagram(s) could not be rendered")
+
+
 def validate_input_file(file_path: str) -> Path:
     """Validate that the input file exists and is readable."""
     path = Path(file_path)
@@ -105,7 +352,25 @@ def generate_output_filename(input_path: Path, output: Optional[str]) -> str:
 
 
 def convert_file(
-    input_path: Path, output_filename: str, theme: str, debug: bool, include_toc: bool
+    input_path: Path,
+    output_filename: str,
+    *,
+    theme: str,
+    debug: bool,
+    include_toc: bool,
+    jobs: int = 1,
+    renderer: Optional[DiagramRenderer] = None,
+    diagram_budget: Optional[float] = None,
+    bundle: Optional[str] = None,
+    offline: bool = False,
+    dpi: Optional[int] = None,
+    diagram_format: Optional[str] = None,
+    optimize_diagrams: Optional[bool] = None,
+    engine: Optional[str] = None,
+    html_parser: Optional[str] = None,
+    code_mode: Optional[str] = None,
+    table_layout: Optional[str] = None,
+    output_backend: Optional[str] = None,
 ) -> bool:
     """Convert a single file and return success status."""
     try:
@@ -114,7 +379,17 @@ def convert_file(
             content = f.read()
 
         # Initialize converter
-        converter = ReadmeToWordConverter()
+        converter = ReadmeToWordConverter(
+            renderer=renderer,
+            diagram_dpi=dpi,
+            diagram_format=diagram_format,
+            optimize_diagrams=optimize_diagrams,
+            engine=engine,
+            html_parser=html_parser,
+            code_mode=code_mode,
+            table_layout=table_layout,
+            output_backend=output_backend,
+        )
         if debug:
             converter.set_debug_mode(True)
 
@@ -126,6 +401,10 @@ def convert_file(
             output_filename=output_filename,
             include_toc=include_toc,
             diagram_style=theme,
+            max_diagram_workers=jobs,
+            diagram_budget_seconds=diagram_budget,
+            diagram_bundle=bundle,
+            offline=offline,
         )
 
         if actual_output_path:
@@ -172,6 +451,10 @@ def launch_web_interface() -> None:
 
 def main() -> None:
     """Main CLI entry point."""
+    if len(sys.argv) > 1 and sys.argv[1] == "prerender":
+        prerender_main(sys.argv[2:])
+        return
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -204,10 +487,49 @@ def main() -> None:
             print("Conversion cancelled.")
             sys.exit(0)
 
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.dpi is not None and args.dpi < 0:
+        print("Error: --dpi must not be negative", file=sys.stderr)
+        sys.exit(1)
+
+    if args.bundle and not Path(args.bundle).is_file():
+        print(f"Error: Diagram bundle '{args.bundle}' does not exist.", file=sys.stderr)
+        sys.exit(1)
+
+    if args.diagram_budget is not None and args.diagram_budget < 0:
+        print("Error: --diagram-budget must not be negative", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        renderer = create_renderer(args.renderer, args.renderer_url)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     # Perform conversion
     include_toc = not args.no_toc
     success = convert_file(
-        input_path, output_filename, args.theme, args.debug, include_toc
+        input_path,
+        output_filename,
+        theme=args.theme,
+        debug=args.debug,
+        include_toc=include_toc,
+        jobs=args.jobs,
+        renderer=renderer,
+        diagram_budget=args.diagram_budget,
+        bundle=args.bundle,
+        offline=args.offline,
+        dpi=args.dpi,
+        diagram_format=args.diagram_format,
+        optimize_diagrams=args.optimize_diagrams,
+        engine=args.engine,
+        html_parser=args.html_parser,
+        code_mode=args.code_mode,
+        table_layout=args.table_layout,
+        output_backend=args.output_backend,
     )
 
     # Exit with appropriate code
@@ -1,31 +1,338 @@
-import base64
+import functools
+import io
 import os
+import queue
 import re
 import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-import markdown
 import requests
 from bs4 import BeautifulSoup
 from docx import Document
-from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt
 from PIL import Image
 
+from .body import BodyBuilder
+from .bundle import DiagramBundle
+from .cache import (
+    DiagramCache,
+    NegativeCache,
+    diagram_cache_key,
+    get_default_cache,
+    get_default_negative_cache,
+)
+from .highlight import (
+    CODE_MODES,
+    CodeHighlighter,
+    add_code_lines,
+    code_language,
+    get_default_highlighter,
+)
+from .mdtree import iter_markdown_blocks
+from .parsers import parse_html_blocks, resolve_html_parser
+from .postprocess import optimize_png
+from .renderers import DiagramRenderer, DiagramRenderError, create_renderer
+from .resources import (
+    ConversionResources,
+    apply_document_styles,
+    get_default_resources,
+)
+from .singleflight import SingleFlight, get_default_singleflight
+from .streaming import OUTPUT_BACKENDS, StreamingBodyBuilder
+from .svg import has_html_labels, verify_svg
+from .tables import TABLE_LAYOUTS, build_table
+from .transport import DiagramTransport
+from .validation import validate_mermaid
+from .workspace import ConversionWorkspace
+
+# Rendered diagrams are embedded this wide
+DIAGRAM_WIDTH_INCHES = 6
+DEFAULT_DIAGRAM_DPI = 150
+# Resolution of the PNG fallback stored next to SVG diagrams
+SVG_FALLBACK_DPI = 72
+DIAGRAM_FORMATS = ("png", "svg")
+# "html" renders markdown to HTML and parses it back; "ast" walks the
+# Markdown element tree directly
+ENGINES = ("html", "ast")
+
+# Fenced ```mermaid blocks, tolerant of surrounding whitespace
+MERMAID_BLOCK_PATTERN = re.compile(r"```mermaid\s*\n(.*?)\n\s*```", re.DOTALL)
+
+# Returned by budgeted render jobs that started after the deadline
+_OVER_BUDGET = object()
+
+
+def _run_on_daemon_threads(
+    calls: List[Callable[[], Any]], max_workers: int
+) -> List[Future]:
+    """Run calls on up to max_workers daemon threads; a Future for each
+
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined when
+    the interpreter exits, so abandoned calls cannot hold up the process.
+    Cancelling a future before its call starts skips the call.
+    """
+    futures: List[Future] = [Future() for _ in calls]
+    queued: "queue.SimpleQueue[Tuple[Future, Callable[[], Any]]]" = queue.SimpleQueue()
+    for item in zip(futures, calls):
+        queued.put(item)
+
+    def work() -> None:
+        while True:
+            try:
+                future, call = queued.get_nowait()
+            except queue.Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+
+    for _ in range(min(max(1, max_workers), len(calls))):
+        threading.Thread(target=work, name="readme2word-diagram", daemon=True).start()
+    return futures
+
 
 class ReadmeToWordConverter:
-    def __init__(self):
-        self.stats = {
+    def __init__(
+        self,
+        diagram_cache: Optional[DiagramCache] = None,
+        transport: Optional[DiagramTransport] = None,
+        renderer: Optional[DiagramRenderer] = None,
+        singleflight: Optional[SingleFlight] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        validate_diagrams: bool = True,
+        diagram_dpi: Optional[int] = None,
+        diagram_format: Optional[str] = None,
+        optimize_diagrams: Optional[bool] = None,
+        engine: Optional[str] = None,
+        html_parser: Optional[str] = None,
+        resources: Optional[ConversionResources] = None,
+        code_mode: Optional[str] = None,
+        highlighter: Optional[CodeHighlighter] = None,
+        table_layout: Optional[str] = None,
+        output_backend: Optional[str] = None,
+    ):
+        # Per-conversion state is thread-local so one converter can serve
+        # several concurrent conversions
+        self._local = threading.local()
+        self._last_stats: Optional[Dict[str, Any]] = None
+        self._stats_lock = threading.Lock()
+        self.debug_mode = True  # Enable debug output
+        # Rendered diagrams are shared by every converter in the process
+        self.diagram_cache = (
+            diagram_cache if diagram_cache is not None else get_default_cache()
+        )
+        # Diagram backend; selected from the environment unless injected
+        self.renderer = (
+            renderer if renderer is not None else create_renderer(transport=transport)
+        )
+        # Coalesces identical in-flight renders across converters and sessions
+        self.singleflight = (
+            singleflight if singleflight is not None else get_default_singleflight()
+        )
+        # Recently failed diagrams fall back to code blocks without a render
+        self.negative_cache = (
+            negative_cache
+            if negative_cache is not None
+            else get_default_negative_cache()
+        )
+        # Reject obviously broken diagrams locally before calling the renderer
+        self.validate_diagrams = validate_diagrams
+        # Diagrams are fetched at this resolution for their embedded size;
+        # 0 keeps the renderer's natural size
+        self.diagram_dpi = (
+            diagram_dpi
+            if diagram_dpi is not None
+            else int(os.environ.get("README2WORD_DIAGRAM_DPI", DEFAULT_DIAGRAM_DPI))
+        )
+        # "svg" embeds diagrams as vector images with a small PNG fallback;
+        # each diagram is then fetched twice, once per format
+        self.diagram_format = diagram_format or os.environ.get(
+            "README2WORD_DIAGRAM_FORMAT", "png"
+        )
+        if self.diagram_format not in DIAGRAM_FORMATS:
+            raise ValueError(
+                f"Unknown diagram format '{self.diagram_format}'. "
+                f"Choose from: {', '.join(DIAGRAM_FORMATS)}"
+            )
+        # Trim, palette-quantize and recompress rendered PNGs; convert() can
+        # override this per conversion
+        self.optimize_diagrams = (
+            optimize_diagrams
+            if optimize_diagrams is not None
+            else os.environ.get("README2WORD_OPTIMIZE_DIAGRAMS", "").lower()
+            in ("1", "true", "yes")
+        )
+        # How parsed markdown reaches the element handlers
+        self.engine = engine or os.environ.get("README2WORD_ENGINE", "html")
+        if self.engine not in ENGINES:
+            raise ValueError(
+                f"Unknown engine '{self.engine}'. Choose from: {', '.join(ENGINES)}"
+            )
+        # BeautifulSoup backend for generated HTML; the fastest installed
+        # one unless configured
+        self.html_parser = resolve_html_parser(html_parser)
+        # Markdown parsers and the styled document template, built once per
+        # process and reused by every conversion
+        self.resources = resources if resources is not None else get_default_resources()
+        # "fast" writes code blocks as plain text; "highlight" colors fenced
+        # blocks that name a language
+        self.code_mode = code_mode or os.environ.get("README2WORD_CODE_MODE", "fast")
+        if self.code_mode not in CODE_MODES:
+            raise ValueError(
+                f"Unknown code mode '{self.code_mode}'. "
+                f"Choose from: {', '.join(CODE_MODES)}"
+            )
+        # Lexer and token style caches are shared by every converter
+        self.highlighter = (
+            highlighter if highlighter is not None else get_default_highlighter()
+        )
+        # "autofit" leaves column widths to Word; "fixed" sizes them from the
+        # content so huge tables open without being measured
+        self.table_layout = table_layout or os.environ.get(
+            "README2WORD_TABLE_LAYOUT", "autofit"
+        )
+        if self.table_layout not in TABLE_LAYOUTS:
+            raise ValueError(
+                f"Unknown table layout '{self.table_layout}'. "
+                f"Choose from: {', '.join(TABLE_LAYOUTS)}"
+            )
+        # "docx" builds the document in memory and saves it at the end;
+        # "stream" writes blocks and images to the output file as they are
+        # added, so memory use does not grow with the document
+        self.output_backend = output_backend or os.environ.get(
+            "README2WORD_OUTPUT_BACKEND", "docx"
+        )
+        if self.output_backend not in OUTPUT_BACKENDS:
+            raise ValueError(
+                f"Unknown output backend '{self.output_backend}'. "
+                f"Choose from: {', '.join(OUTPUT_BACKENDS)}"
+            )
+
+    @property
+    def diagram_width(self) -> Optional[int]:
+        """Pixel width PNG diagrams are fetched at, or None for natural size
+
+        In SVG mode the PNG is only a fallback and is kept small.
+        """
+        dpi = self.diagram_dpi
+        if self.diagram_format == "svg":
+            dpi = min(dpi, SVG_FALLBACK_DPI) if dpi > 0 else SVG_FALLBACK_DPI
+        if dpi <= 0:
+            return None
+        return round(DIAGRAM_WIDTH_INCHES * dpi)
+
+    def _diagram_key(
+        self, mermaid_code: str, style: str, image_format: str = "png"
+    ) -> str:
+        """Cache key for a diagram rendered with this converter's options"""
+        if image_format == "svg":
+            return diagram_cache_key(mermaid_code, style, format="svg")
+        return diagram_cache_key(
+            mermaid_code,
+            style,
+            width=self.diagram_width,
+            optimized=True if self._optimize else None,
+        )
+
+    def _new_stats(self) -> Dict[str, Any]:
+        """Create a fresh statistics dictionary"""
+        return {
             "headings": 0,
             "tables": 0,
             "code_blocks": 0,
             "mermaid_diagrams": 0,
             "images": 0,
+            "diagram_cache_hits": 0,
+            "duplicate_diagrams_skipped": 0,
+            "coalesced_renders": 0,
+            "negative_cache_hits": 0,
+            "diagram_budget_remaining": None,
+            "diagrams_over_budget": 0,
+            "bundle_hits": 0,
+            "offline_misses": 0,
+            "invalid_diagrams": 0,
+            "validation_errors": [],
+            "vector_diagrams": 0,
+            "svg_renders": 0,
+            "svg_html_label_fallbacks": 0,
+            "optimized_diagrams": 0,
+            "diagram_bytes_saved": 0,
+            "highlighted_code_blocks": 0,
+        }
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Statistics of the current (or last) conversion on this thread
+
+        Threads that have not converted anything count into a dictionary of
+        their own, never into another thread's conversion.
+        """
+        stats = getattr(self._local, "stats", None)
+        if stats is None:
+            stats = self._local.stats = self._new_stats()
+        return stats
+
+    @stats.setter
+    def stats(self, value: Dict[str, Any]) -> None:
+        self._local.stats = value
+
+    @property
+    def mermaid_counter(self) -> int:
+        """Number of diagrams numbered so far in the current conversion"""
+        return getattr(self._local, "mermaid_counter", 0)
+
+    @mermaid_counter.setter
+    def mermaid_counter(self, value: int) -> None:
+        self._local.mermaid_counter = value
+
+    @property
+    def _workspace(self) -> ConversionWorkspace:
+        """Workspace of the current conversion on this thread"""
+        workspace = getattr(self._local, "workspace", None)
+        if workspace is None or workspace.closed:
+            # Helpers called outside convert() get a standalone workspace
+            workspace = self._local.workspace = ConversionWorkspace()
+        return workspace
+
+    @property
+    def _bundle(self) -> Optional[DiagramBundle]:
+        """Pre-rendered diagram bundle used by the current conversion"""
+        return getattr(self._local, "bundle", None)
+
+    @property
+    def _offline(self) -> bool:
+        """True when the current conversion must not render diagrams"""
+        return getattr(self._local, "offline", False)
+
+    @property
+    def _optimize(self) -> bool:
+        """True when the current conversion post-processes PNG diagrams"""
+        optimize = getattr(self._local, "optimize", None)
+        return self.optimize_diagrams if optimize is None else optimize
+
+    def _conversion_context(self) -> Dict[str, Any]:
+        """Snapshot of the current conversion's thread-local state"""
+        return {
+            "stats": self.stats,
+            "workspace": self._workspace,
+            "bundle": self._bundle,
+            "offline": self._offline,
+            "optimize": self._optimize,
         }
-        self.mermaid_counter = 0
-        self.debug_mode = True  # Enable debug output
+
+    def _bind_conversion(self, context: Dict[str, Any]) -> None:
+        """Attach a worker thread to an in-progress conversion"""
+        for name, value in context.items():
+            setattr(self._local, name, value)
 
     def convert(
         self,
@@ -33,82 +340,158 @@ class ReadmeToWordConverter:
         output_filename: str,
         include_toc: bool = True,
         diagram_style: str = "default",
+        max_diagram_workers: int = 1,
+        diagram_budget_seconds: Optional[float] = None,
+        diagram_bundle: Optional[Union[str, Path, DiagramBundle]] = None,
+        offline: bool = False,
+        optimize_diagrams: Optional[bool] = None,
     ) -> str:
-        """Convert README content to Word document"""
-        # Reset stats
-        self.stats = {k: 0 for k in self.stats.keys()}
+        """Convert README content to Word document
+
+        Set ``max_diagram_workers`` above 1 to render Mermaid diagrams
+        concurrently on a bounded thread pool. ``diagram_budget_seconds``
+        caps the time spent on diagrams for the whole document; diagrams
+        not rendered in time fall back to code blocks. It defaults to
+        ``README2WORD_DIAGRAM_BUDGET_SECONDS`` when set.
+
+        ``diagram_bundle`` (a ``DiagramBundle`` or the path of one written by
+        ``readme2word prerender``) supplies pre-rendered diagrams. With
+        ``offline=True`` diagrams come only from the bundle and caches and the
+        renderer is never called; anything missing stays a code block.
+
+        ``optimize_diagrams`` overrides the converter's setting for this
+        conversion: rendered PNGs are trimmed, palette-quantized and
+        recompressed, and the bytes saved are reported in the stats.
+        """
+        if diagram_budget_seconds is None:
+            env_budget = os.environ.get("README2WORD_DIAGRAM_BUDGET_SECONDS")
+            diagram_budget_seconds = float(env_budget) if env_budget else None
+
+        # Reset stats and give this conversion its own scratch workspace
+        self.stats = self._new_stats()
+        self._local.converted = True
         self.mermaid_counter = 0
+        workspace = ConversionWorkspace()
+        self._local.workspace = workspace
+        if isinstance(diagram_bundle, (str, Path)):
+            diagram_bundle = DiagramBundle.load(diagram_bundle)
+        self._local.bundle = diagram_bundle
+        self._local.offline = offline
+        self._local.optimize = optimize_diagrams
+        body: Optional[BodyBuilder] = None
 
-        if self.debug_mode:
-            print(f"🔍 Starting conversion with diagram style: {diagram_style}")
-            print(f"📝 Content length: {len(readme_content)} characters")
-
-        # Create new document
-        doc = Document()
-
-        # Set up document styles
-        self._setup_document_styles(doc)
+        try:
+            if self.debug_mode:
+                print(f"🔍 Starting conversion with diagram style: {diagram_style}")
+                print(f"📝 Content length: {len(readme_content)} characters")
 
-        # Add title
-        title = self._extract_title(readme_content)
-        if title:
-            doc.add_heading(title, 0)
+            # Check if filename already has .docx extension to avoid double extension
+            if output_filename.endswith(".docx"):
+                output_path = Path(output_filename)
+            else:
+                output_path = Path(f"{output_filename}.docx")
 
-        # Add table of contents placeholder if requested
-        if include_toc:
-            self._add_table_of_contents(doc)
+            # Create parent directories if they don't exist
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Process mermaid diagrams first (convert to images)
-        if self.debug_mode:
-            mermaid_count = len(
-                re.findall(r"```mermaid\n(.*?)\n```", readme_content, re.DOTALL)
-            )
-            print(f"🎨 Found {mermaid_count} Mermaid diagrams to convert")
+            # Start from a copy of the template with styles already set up
+            doc = self.resources.new_document()
+            # Blocks are appended through a builder that keeps its place at
+            # the end of the body instead of searching for it every time
+            if self.output_backend == "stream":
+                body = StreamingBodyBuilder(doc, output_path, workspace.scratch_dir)
+            else:
+                body = BodyBuilder(doc)
 
-        content_with_images = self._process_mermaid_diagrams(
-            readme_content, diagram_style
-        )
+            # Add title
+            title = self._extract_title(readme_content)
+            if title:
+                body.add_heading(title, 0)
 
-        # Convert markdown to HTML
-        md = markdown.Markdown(extensions=["tables", "fenced_code", "codehilite"])
-        html_content = md.convert(content_with_images)
+            # Add table of contents placeholder if requested
+            if include_toc:
+                self._add_table_of_contents(body)
 
-        # Parse HTML and convert to Word
-        soup = BeautifulSoup(html_content, "html.parser")
-        self._convert_html_to_word(soup, doc)
+            # Process mermaid diagrams first (convert to images)
+            if self.debug_mode:
+                mermaid_count = len(MERMAID_BLOCK_PATTERN.findall(readme_content))
+                print(f"🎨 Found {mermaid_count} Mermaid diagrams to convert")
+
+            content_with_images = self._process_mermaid_diagrams(
+                readme_content,
+                diagram_style,
+                max_workers=max_diagram_workers,
+                budget_seconds=diagram_budget_seconds,
+            )
 
-        # Save document
-        # Check if filename already has .docx extension to avoid double extension
-        if output_filename.endswith(".docx"):
-            output_path = Path(output_filename)
-        else:
-            output_path = Path(f"{output_filename}.docx")
+            with self.resources.borrow_markdown() as md:
+                if self.engine == "ast":
+                    # Walk the Markdown element tree without an HTML round trip
+                    self._convert_blocks_to_word(
+                        iter_markdown_blocks(md, content_with_images, self.html_parser),
+                        body,
+                    )
+                else:
+                    # Convert markdown to HTML
+                    html_content = md.convert(content_with_images)
 
-        # Create parent directories if they don't exist
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Parse HTML and convert to Word
+                    self._convert_blocks_to_word(
+                        parse_html_blocks(html_content, self.html_parser), body
+                    )
 
-        doc.save(str(output_path))
+            # Save document
+            body.save(output_path)
 
+            if self.debug_mode:
+                print(f"✅ Document saved to: {output_path}")
+                print(f"📊 Final stats: {self.stats}")
+
+            return str(output_path)
+        finally:
+            # A failed streaming conversion leaves no partial file behind
+            if body is not None:
+                body.discard()
+            # Rendered diagrams are embedded now; release them and scratch files
+            workspace.close()
+            self._local.workspace = None
+            self._local.bundle = None
+            self._local.offline = False
+            self._local.optimize = None
+            self._last_stats = self.stats.copy()
+
+    def warmup(self) -> float:
+        """Load the Markdown parser and document template ahead of time
+
+        Returns the seconds spent. Servers call this at startup (or from a
+        readiness check) so the first request does not pay for it.
+        """
+        seconds = self.resources.warmup()
         if self.debug_mode:
-            print(f"✅ Document saved to: {output_path}")
-            print(f"📊 Final stats: {self.stats}")
+            print(f"🔥 Converter warmed up in {seconds:.3f}s")
+        return seconds
 
-        return str(output_path)
+    def render_diagram(
+        self,
+        mermaid_code: str,
+        style: str = "default",
+        image_format: str = "png",
+        diagram_number: Optional[int] = None,
+    ) -> Tuple[str, Optional[bytes]]:
+        """Render one Mermaid diagram with this converter's options
+
+        Returns the key convert() looks the diagram up by (in the caches and
+        in diagram bundles) and the rendered bytes, or None if it could not
+        be rendered. Safe to call from several threads at once; counters go
+        to the calling thread's stats.
+        """
+        code = mermaid_code.strip()
+        key = self._diagram_key(code, style, image_format)
+        return key, self._mermaid_to_image(code, style, diagram_number, image_format)
 
     def _setup_document_styles(self, doc: Document) -> None:
         """Set up custom styles for the document"""
-        styles = doc.styles
-
-        # Code block style
-        try:
-            code_style = styles.add_style("Code Block", WD_STYLE_TYPE.PARAGRAPH)
-            code_style.font.name = "Consolas"
-            code_style.font.size = Pt(9)
-            code_style.paragraph_format.left_indent = Inches(0.5)
-            code_style.paragraph_format.space_before = Pt(6)
-            code_style.paragraph_format.space_after = Pt(6)
-        except BaseException:
-            pass  # Style might already exist
+        apply_document_styles(doc)
 
     def _extract_title(self, content: str) -> str:
         """Extract the main title from README content"""
@@ -118,7 +501,7 @@ class ReadmeToWordConverter:
                 return line.strip()[2:].strip()
         return ""
 
-    def _add_table_of_contents(self, doc: Document) -> None:
+    def _add_table_of_contents(self, doc: BodyBuilder) -> None:
         """Add a table of contents placeholder"""
         doc.add_heading("Table of Contents", 1)
         p = doc.add_paragraph()
@@ -128,39 +511,86 @@ class ReadmeToWordConverter:
         p.italic = True
         doc.add_page_break()
 
-    def _process_mermaid_diagrams(self, content: str, style: str = "default") -> str:
-        """Convert Mermaid diagrams to images using mermaid.ink API"""
-        # Improved regex pattern to handle various whitespace scenarios
-        mermaid_pattern = r"```mermaid\s*\n(.*?)\n\s*```"
+    def _process_mermaid_diagrams(
+        self,
+        content: str,
+        style: str = "default",
+        max_workers: int = 1,
+        budget_seconds: Optional[float] = None,
+    ) -> str:
+        """Convert Mermaid diagrams to images using mermaid.ink API
+
+        All fenced mermaid blocks are collected first, identical diagrams are
+        reduced to a single render, the renders run (concurrently when
+        ``max_workers`` is greater than 1, within ``budget_seconds`` when
+        given) and the results are spliced back into the content in
+        document order.
+        """
+        # Start the clock before any diagram work
+        deadline = (
+            time.monotonic() + budget_seconds if budget_seconds is not None else None
+        )
 
-        def replace_mermaid(match):
-            mermaid_code = match.group(1).strip()
+        matches = list(MERMAID_BLOCK_PATTERN.finditer(content))
+
+        # Number diagrams in document order before any rendering starts
+        jobs = []
+        for match in matches:
+            self.mermaid_counter += 1
+            code = match.group(1).strip()
+            jobs.append((self.mermaid_counter, code, self._diagram_key(code, style)))
+
+        # Identical diagrams in one document are rendered only once
+        unique_jobs: Dict[str, Tuple[int, str]] = {}
+        for number, code, key in jobs:
+            unique_jobs.setdefault(key, (number, code))
+        duplicates = len(jobs) - len(unique_jobs)
+        if duplicates:
+            self._increment_stat("duplicate_diagrams_skipped", duplicates)
             if self.debug_mode:
-                print(f"🎨 Processing Mermaid diagram {self.mermaid_counter + 1}:")
-                print(f"   Code preview: {mermaid_code[:50]}...")
+                print(f"♻️  Skipping {duplicates} duplicate diagram render(s)")
 
-            try:
-                # Create image from mermaid code
-                image_path = self._mermaid_to_image(mermaid_code, style)
-                if image_path:
-                    self.stats["mermaid_diagrams"] += 1
-                    if self.debug_mode:
-                        print(f"   ✅ Successfully converted to: {image_path}")
-                    # Return markdown image syntax with absolute path
-                    return (
-                        f"\n![Mermaid Diagram {self.mermaid_counter}]({image_path})\n"
-                    )
-                else:
-                    if self.debug_mode:
-                        print(f"   ❌ Failed to convert, falling back to code block")
-                    # Fallback to code block if conversion fails
-                    return f"\n```\n{mermaid_code}\n```\n"
-            except Exception as e:
-                if self.debug_mode:
-                    print(f"   ❌ Exception during conversion: {e}")
-                return f"\n```\n{mermaid_code}\n```\n"
+        render_items = list(unique_jobs.items())
+        if deadline is not None:
+            sources = self._render_within_budget(
+                render_items, style, max_workers, deadline
+            )
+        elif max_workers > 1 and len(render_items) > 1:
+            if self.debug_mode:
+                print(
+                    f"⚡ Rendering {len(render_items)} diagrams with {max_workers} workers"
+                )
+            context = self._conversion_context()
+
+            def render_job(item: Tuple[str, Tuple[int, str]]) -> Optional[str]:
+                self._bind_conversion(context)
+                number, code = item[1]
+                return self._render_mermaid_block(number, code, style)
 
-        result = re.sub(mermaid_pattern, replace_mermaid, content, flags=re.DOTALL)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                sources = list(executor.map(render_job, render_items))
+        else:
+            sources = [
+                self._render_mermaid_block(number, code, style)
+                for _, (number, code) in render_items
+            ]
+        image_sources = {key: src for (key, _), src in zip(render_items, sources)}
+
+        # Splice rendered blocks back in document order
+        pieces = []
+        last_end = 0
+        for match, (number, code, key) in zip(matches, jobs):
+            pieces.append(content[last_end : match.start()])
+            image_src = image_sources[key]
+            if image_src:
+                self._increment_stat("mermaid_diagrams")
+                pieces.append(f"\n![Mermaid Diagram {number}]({image_src})\n")
+            else:
+                # Fallback to code block if conversion fails
+                pieces.append(f"\n```\n{code}\n```\n")
+            last_end = match.end()
+        pieces.append(content[last_end:])
+        result = "".join(pieces)
 
         if self.debug_mode:
             print(
@@ -169,115 +599,381 @@ class ReadmeToWordConverter:
 
         return result
 
-    def _mermaid_to_image(
-        self, mermaid_code: str, style: str = "default"
-    ) -> Optional[str]:
-        """Convert mermaid code to image using mermaid.ink API"""
-        try:
-            self.mermaid_counter += 1
+    def _render_within_budget(
+        self,
+        render_items: List[Tuple[str, Tuple[int, str]]],
+        style: str,
+        max_workers: int,
+        deadline: float,
+    ) -> List[Optional[str]]:
+        """Render diagrams on worker threads until the deadline passes
+
+        Diagrams found in the bundle or the cache are used at once, whatever
+        the time; only renders count against the budget. Renders still
+        running at the deadline are abandoned (their results still reach the
+        shared cache) and jobs that have not started yet are skipped. The
+        workers are daemon threads, so neither the caller nor process exit
+        waits for abandoned renders. Each job counts into its own stats,
+        which are merged only if it finishes in time.
+        """
+        sources: List[Optional[str]] = [None] * len(render_items)
+        pending = []
+        for index, (_, (number, code)) in enumerate(render_items):
+            image_data, svg_data = self._diagram_images(
+                number, code, style, local_only=True
+            )
+            if image_data and (svg_data or self.diagram_format != "svg"):
+                sources[index] = self._embed_diagram(number, image_data, svg_data)
+            else:
+                pending.append((index, number, code, image_data))
 
+        context = self._conversion_context()
+
+        def render_job(number: int, code: str, image_data: Optional[bytes]) -> Any:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return _OVER_BUDGET
+            # Abandoned jobs must not write to the conversion's state
+            job_stats = self._new_stats()
+            self._bind_conversion(dict(context, stats=job_stats, workspace=None))
             if self.debug_mode:
-                print(f"   🌐 Calling Mermaid API for diagram {self.mermaid_counter}")
+                print(f"⏱️  {remaining:.2f}s of diagram budget left")
+                print(f"🎨 Processing Mermaid diagram {number}:")
+            return self._diagram_images(number, code, style, image_data), job_stats
+
+        futures = _run_on_daemon_threads(
+            [
+                functools.partial(render_job, number, code, image_data)
+                for _, number, code, image_data in pending
+            ],
+            max_workers,
+        )
+        over_budget = 0
+        try:
+            for future, (index, number, code, image_data) in zip(futures, pending):
+                remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    outcome = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    outcome = _OVER_BUDGET
+                if outcome is not _OVER_BUDGET:
+                    images, job_stats = outcome
+                    self._merge_stats(job_stats)
+                elif image_data:
+                    # The cached PNG goes in without a rendered SVG form
+                    images = self._diagram_images(
+                        number, code, style, image_data, local_only=True
+                    )
+                else:
+                    over_budget += 1
+                    continue
+                sources[index] = self._embed_diagram(number, *images)
+        finally:
+            # Jobs that have not started are dropped
+            for future in futures:
+                future.cancel()
+
+        remaining = round(max(0.0, deadline - time.monotonic()), 3)
+        self.stats["diagram_budget_remaining"] = remaining
+        if over_budget:
+            self._increment_stat("diagrams_over_budget", over_budget)
+        if self.debug_mode:
+            print(f"⏱️  Diagram budget: {remaining:.2f}s remaining")
+            if over_budget:
+                print(f"⏱️  Budget spent; {over_budget} diagram(s) kept as code blocks")
+        return sources
 
-            # Clean and encode mermaid code
-            cleaned_code = mermaid_code.strip()
-            encoded = base64.urlsafe_b64encode(cleaned_code.encode("utf-8")).decode(
-                "ascii"
-            )
+    def _render_mermaid_block(
+        self, diagram_number: int, mermaid_code: str, style: str
+    ) -> Optional[str]:
+        """Render a single Mermaid block and return its in-memory image source"""
+        if self.debug_mode:
+            print(f"🎨 Processing Mermaid diagram {diagram_number}:")
+            print(f"   Code preview: {mermaid_code[:50]}...")
 
-            # Get image from mermaid.ink with proper theme mapping
-            theme_map = {
-                "default": "default",
-                "neutral": "neutral",
-                "dark": "dark",
-                "forest": "forest",
-            }
-            actual_theme = theme_map.get(style, "default")
+        image_data, svg_data = self._diagram_images(diagram_number, mermaid_code, style)
+        return self._embed_diagram(diagram_number, image_data, svg_data)
 
-            url = f"https://mermaid.ink/img/{encoded}?theme={actual_theme}"
+    def _diagram_images(
+        self,
+        diagram_number: int,
+        mermaid_code: str,
+        style: str,
+        image_data: Optional[bytes] = None,
+        local_only: bool = False,
+    ) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """PNG and, in svg mode, SVG bytes of a diagram; no PNG on failure
+
+        ``image_data`` is a PNG already at hand. With ``local_only`` only the
+        bundle and the cache are consulted; nothing is rendered.
+        """
+        try:
+            if image_data is None:
+                image_data = self._mermaid_to_image(
+                    mermaid_code, style, diagram_number, local_only=local_only
+                )
+            svg_data = None
+            if image_data and self.diagram_format == "svg":
+                # The PNG above is the fallback; a failed SVG keeps it alone
+                svg_data = self._mermaid_to_image(
+                    mermaid_code,
+                    style,
+                    diagram_number,
+                    image_format="svg",
+                    local_only=local_only,
+                )
+            return image_data, svg_data
+        except Exception as e:
+            if self.debug_mode:
+                print(f"   ❌ Exception during conversion: {e}")
+            return None, None
 
+    def _embed_diagram(
+        self,
+        diagram_number: int,
+        image_data: Optional[bytes],
+        svg_data: Optional[bytes],
+    ) -> Optional[str]:
+        """Keep rendered images in the workspace and return their image source"""
+        if not image_data:
             if self.debug_mode:
-                print(f"   📡 API URL: {url[:80]}...")
+                print(f"   ❌ Failed to convert, falling back to code block")
+            return None
+        # Keep the image in memory; _convert_image embeds it by src
+        image_src = self._workspace.add_image(diagram_number, image_data, svg_data)
+        if self.debug_mode:
+            print(
+                f"   ✅ Successfully converted to: {image_src} ({len(image_data)} bytes)"
+            )
+        return image_src
+
+    def _merge_stats(self, stats: Dict[str, Any]) -> None:
+        """Add counters collected on another thread to the current conversion"""
+        with self._stats_lock:
+            for name, value in stats.items():
+                if isinstance(value, list):
+                    self.stats[name].extend(value)
+                elif value:
+                    self.stats[name] += value
+
+    def _increment_stat(self, name: str, amount: int = 1) -> None:
+        """Increment a statistics counter safely from worker threads"""
+        with self._stats_lock:
+            self.stats[name] += amount
 
-            # Make request with better error handling
-            headers = {"User-Agent": "README-to-Word-Converter/1.0"}
-            response = requests.get(url, timeout=15, headers=headers)
+    def _mermaid_to_image(
+        self,
+        mermaid_code: str,
+        style: str = "default",
+        diagram_number: Optional[int] = None,
+        image_format: str = "png",
+        local_only: bool = False,
+    ) -> Optional[bytes]:
+        """Convert mermaid code to PNG (or SVG) bytes using the configured renderer
+
+        With ``local_only`` only the bundle and the cache are consulted.
+        """
+        cache_key = self._diagram_key(mermaid_code, style, image_format)
+        try:
+            if diagram_number is None:
+                self.mermaid_counter += 1
+                diagram_number = self.mermaid_counter
 
-            if self.debug_mode:
-                print(
-                    f"   📊 Response: {response.status_code}, Content-Type: {response.headers.get('content-type', 'unknown')}"
-                )
+            if not self.renderer.renders_images:
+                if self.debug_mode:
+                    print(f"   📝 Renderer '{self.renderer.name}' keeps code blocks")
+                return None
 
-            if response.status_code == 200:
-                # Verify it's actually an image
-                content_type = response.headers.get("content-type", "")
-                if "image" not in content_type:
+            # Pre-rendered diagrams from a bundle need no rendering at all
+            bundle = self._bundle
+            if bundle is not None:
+                bundled = bundle.get(cache_key)
+                if bundled is not None:
                     if self.debug_mode:
-                        print(f"   ⚠️  Warning: Expected image but got {content_type}")
-                        print(f"   Response preview: {response.text[:100]}...")
-                    return None
+                        print(f"   📦 Bundle hit for diagram {diagram_number}")
+                    self._increment_stat("bundle_hits")
+                    return bundled
 
-                # Save image with absolute path
-                output_dir = Path("images")
-                output_dir.mkdir(parents=True, exist_ok=True)
-                image_path = output_dir / f"mermaid_{self.mermaid_counter}.png"
+            # Serve repeat diagrams from the shared cache (already verified PNG)
+            cached = self.diagram_cache.get(cache_key)
+            if cached is not None:
+                if self.debug_mode:
+                    print(f"   ♻️  Cache hit for diagram {diagram_number}")
+                self._increment_stat("diagram_cache_hits")
+                return cached
 
-                # Convert to PNG if needed
-                try:
-                    # Save the response content
-                    with open(image_path, "wb") as f:
-                        f.write(response.content)
-
-                    # Verify the image can be opened
-                    with Image.open(image_path) as img:
-                        # Convert to PNG if it's not already
-                        if img.format != "PNG":
-                            png_path = image_path.with_suffix(".png")
-                            img.save(png_path, "PNG")
-                            if png_path != image_path:
-                                image_path.unlink()  # Remove original
-                                image_path = png_path
+            if local_only:
+                return None
 
+            if self.validate_diagrams:
+                issue = validate_mermaid(mermaid_code)
+                if issue is not None:
                     if self.debug_mode:
-                        print(
-                            f"   💾 Image saved: {image_path} ({image_path.stat().st_size} bytes)"
+                        print(f"   🚫 Diagram {diagram_number} rejected: {issue}")
+                    with self._stats_lock:
+                        self.stats["invalid_diagrams"] += 1
+                        self.stats["validation_errors"].append(
+                            f"Diagram {diagram_number}: {issue} ({issue.reason})"
                         )
+                    return None
 
-                    # Return absolute path for better compatibility
-                    return str(image_path.resolve())
+            # Diagrams that failed recently are not sent to the renderer again
+            failure = self.negative_cache.get(cache_key)
+            if failure is not None:
+                if self.debug_mode:
+                    print(
+                        f"   🚫 Diagram {diagram_number} failed recently ({failure}), "
+                        "keeping code block"
+                    )
+                self._increment_stat("negative_cache_hits")
+                return None
 
-                except Exception as img_error:
-                    if self.debug_mode:
-                        print(f"   ❌ Image processing error: {img_error}")
-                    return None
-            else:
+            if self._offline:
                 if self.debug_mode:
                     print(
-                        f"   ❌ API Error {response.status_code}: {response.text[:200]}"
+                        f"   📴 Diagram {diagram_number} not in bundle, keeping code block"
                     )
+                self._increment_stat("offline_misses")
                 return None
 
+            if self.debug_mode:
+                print(
+                    f"   🌐 Rendering diagram {diagram_number} with {self.renderer.describe()}"
+                )
+
+            # Concurrent requests for the same diagram share one render
+            image_data, shared = self.singleflight.do(
+                cache_key,
+                lambda: self._fetch_diagram_image(
+                    mermaid_code, style, cache_key, image_format
+                ),
+            )
+            if shared:
+                self._increment_stat("coalesced_renders")
+                if self.debug_mode:
+                    print(
+                        f"   🔗 Shared an in-flight render for diagram {diagram_number}"
+                    )
+            return image_data
+
+        except DiagramRenderError as e:
+            if self.debug_mode:
+                print(f"   ❌ {e}")
+            self.negative_cache.put(cache_key, e.error_class, e.transient)
+            return None
         except requests.exceptions.Timeout:
             if self.debug_mode:
                 print(f"   ⏰ Timeout error - API took too long to respond")
+            self.negative_cache.put(cache_key, "timeout", transient=True)
             return None
         except requests.exceptions.ConnectionError:
             if self.debug_mode:
                 print(f"   🌐 Connection error - Check internet connection")
+            self.negative_cache.put(cache_key, "connection_error", transient=True)
             return None
         except Exception as e:
             if self.debug_mode:
                 print(f"   ❌ Unexpected error: {e}")
+            self.negative_cache.put(cache_key, type(e).__name__, transient=True)
             return None
 
-    def _convert_html_to_word(self, soup: BeautifulSoup, doc: Document) -> None:
+    def _fetch_diagram_image(
+        self,
+        mermaid_code: str,
+        style: str,
+        cache_key: str,
+        image_format: str = "png",
+    ) -> Optional[bytes]:
+        """Render a diagram, verify it and store the result in the shared cache"""
+        width = self.diagram_width if image_format == "png" else None
+        if image_format == "svg":
+            # The SVG is a second fetch on top of the PNG fallback
+            self._increment_stat("svg_renders")
+        image_data = self.renderer.render(
+            mermaid_code, style, width=width, image_format=image_format
+        )
+        if not image_data:
+            return None
+
+        if image_format == "svg":
+            verified = verify_svg(image_data)
+            if verified and has_html_labels(verified):
+                # Word would draw the shapes without their labels
+                if self.debug_mode:
+                    print("   ⚠️  SVG uses HTML labels, keeping the PNG only")
+                self._increment_stat("svg_html_label_fallbacks")
+                self.negative_cache.put(cache_key, "html_labels")
+                return None
+        else:
+            verified = self._prepare_diagram_image(image_data, max_width=width)
+            if verified and self._optimize:
+                verified = self._optimize_diagram_image(verified)
+        if verified:
+            self.diagram_cache.put(cache_key, verified)
+        else:
+            self.negative_cache.put(cache_key, "invalid_image")
+        return verified
+
+    def _optimize_diagram_image(self, image_data: bytes) -> bytes:
+        """Post-process a verified PNG and record the bytes saved"""
+        try:
+            optimized = optimize_png(image_data)
+        except Exception as e:
+            if self.debug_mode:
+                print(f"   ⚠️  Diagram optimization failed, keeping original: {e}")
+            return image_data
+
+        saved = len(image_data) - len(optimized)
+        with self._stats_lock:
+            self.stats["optimized_diagrams"] += 1
+            self.stats["diagram_bytes_saved"] += saved
+        if self.debug_mode:
+            print(
+                f"   🗜️  Optimized diagram: {len(image_data)} -> {len(optimized)} bytes"
+            )
+        return optimized
+
+    def _prepare_diagram_image(
+        self, image_data: bytes, max_width: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Verify rendered bytes form an image and return them as PNG
+
+        Images wider than ``max_width`` (renderers that ignore the requested
+        width) are scaled down so they are not stored oversized.
+        """
+        try:
+            with Image.open(io.BytesIO(image_data)) as img:
+                if max_width and img.width > max_width:
+                    height = max(1, round(img.height * max_width / img.width))
+                    buffer = io.BytesIO()
+                    img.resize((max_width, height), Image.LANCZOS).save(buffer, "PNG")
+                    return buffer.getvalue()
+
+                if img.format == "PNG":
+                    return image_data
+
+                # Convert to PNG if it's not already
+                buffer = io.BytesIO()
+                img.save(buffer, "PNG")
+                return buffer.getvalue()
+
+        except Exception as img_error:
+            if self.debug_mode:
+                print(f"   ❌ Image processing error: {img_error}")
+            return None
+
+    def _convert_html_to_word(self, soup: BeautifulSoup, doc: BodyBuilder) -> None:
         """Convert HTML elements to Word document elements"""
-        for element in soup.children:
+        self._convert_blocks_to_word(soup.children, doc)
+
+    def _convert_blocks_to_word(self, blocks: Iterable[Any], doc: BodyBuilder) -> None:
+        """Convert top-level elements (soup tags or tree nodes) to Word"""
+        for element in blocks:
             if hasattr(element, "name"):
                 self._process_element(element, doc)
 
     def _process_element(
-        self, element: Any, doc: Document, parent_paragraph: Any = None
+        self, element: Any, doc: BodyBuilder, parent_paragraph: Any = None
     ) -> None:
         """Process individual HTML elements"""
         if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
@@ -305,8 +1001,7 @@ class ReadmeToWordConverter:
             self._convert_list(element, doc)
 
         elif element.name == "blockquote":
-            p = doc.add_paragraph(element.get_text().strip())
-            p.style = "Quote"
+            doc.add_paragraph(element.get_text().strip(), "Quote")
 
         elif element.name in ["div", "span"]:
             # Process children of container elements
@@ -315,7 +1010,7 @@ class ReadmeToWordConverter:
                     self._process_element(child, doc)
 
     def _process_paragraph_with_mixed_content(
-        self, element: Any, doc: Document
+        self, element: Any, doc: BodyBuilder
     ) -> None:
         """Process paragraph content that may contain both text and images in sequence"""
         # Check if paragraph contains images
@@ -382,38 +1077,37 @@ class ReadmeToWordConverter:
         else:
             paragraph.add_run(content.get_text())
 
-    def _convert_table(self, table_element: Any, doc: Document) -> None:
+    def _convert_table(self, table_element: Any, doc: BodyBuilder) -> None:
         """Convert HTML table to Word table"""
         rows = table_element.find_all("tr")
         if not rows:
             return
 
-        # Count columns
-        max_cols = max(len(row.find_all(["td", "th"])) for row in rows)
-
-        # Create Word table
-        word_table = doc.add_table(rows=len(rows), cols=max_cols)
-        word_table.style = "Table Grid"
-
-        for i, row in enumerate(rows):
-            cells = row.find_all(["td", "th"])
-            for j, cell in enumerate(cells):
-                if j < max_cols:
-                    word_table.cell(i, j).text = cell.get_text().strip()
-                    # Make header row bold
-                    if cell.name == "th":
-                        for paragraph in word_table.cell(i, j).paragraphs:
-                            for run in paragraph.runs:
-                                run.bold = True
+        # Headers are bolded as the rows are built
+        build_table(
+            doc,
+            [
+                [(cell.get_text().strip(), cell.name == "th") for cell in cells]
+                for cells in (row.find_all(["td", "th"]) for row in rows)
+            ],
+            layout=self.table_layout,
+        )
 
         self.stats["tables"] += 1
 
-    def _convert_code_block(self, code_element: Any, doc: Document) -> None:
+    def _convert_code_block(self, code_element: Any, doc: BodyBuilder) -> None:
         """Convert code block to Word"""
         code_text = code_element.get_text()
-        p = doc.add_paragraph(code_text)
+        p = doc.add_paragraph()
+        language = (
+            code_language(code_element) if self.code_mode == "highlight" else None
+        )
+        if language and self.highlighter.highlight(p, code_text, language):
+            self.stats["highlighted_code_blocks"] += 1
+        else:
+            add_code_lines(p, code_text)
         try:
-            p.style = "Code Block"
+            doc.set_style(p, "Code Block")
         except BaseException:
             # Fallback if custom style not available
             p.style = "No Spacing"
@@ -423,7 +1117,7 @@ class ReadmeToWordConverter:
 
         self.stats["code_blocks"] += 1
 
-    def _convert_image(self, img_element: Any, doc: Document) -> None:
+    def _convert_image(self, img_element: Any, doc: BodyBuilder) -> None:
         """Convert image to Word"""
         try:
             src = img_element.get("src", "")
@@ -431,6 +1125,19 @@ class ReadmeToWordConverter:
                 print(f"🖼️  Processing image: {src}")
 
             if src:
+                # Rendered diagrams are embedded straight from memory
+                image_data = self._workspace.get_image(src)
+                if image_data is not None:
+                    if self.debug_mode:
+                        print(f"   ✅ Image in memory: {src} ({len(image_data)} bytes)")
+                    self._add_picture(
+                        img_element,
+                        doc,
+                        lambda: io.BytesIO(image_data),
+                        svg_data=self._workspace.get_svg(src),
+                    )
+                    return
+
                 # Handle both relative and absolute paths
                 image_path = Path(src)
 
@@ -443,40 +1150,7 @@ class ReadmeToWordConverter:
                         print(
                             f"   ✅ Image found: {image_path} ({image_path.stat().st_size} bytes)"
                         )
-
-                    # Add image to document with reasonable size
-                    try:
-                        # Try to add with 6 inch width, but handle oversized
-                        # images
-                        doc.add_picture(str(image_path), width=Inches(6))
-                        self.stats["images"] += 1
-
-                        # Add caption if alt text exists
-                        alt_text = img_element.get("alt", "")
-                        if alt_text:
-                            p = doc.add_paragraph(alt_text)
-                            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            p.italic = True
-
-                        if self.debug_mode:
-                            print(f"   ✅ Image successfully added to document")
-
-                    except Exception as img_add_error:
-                        if self.debug_mode:
-                            print(
-                                f"   ❌ Error adding image to document: {img_add_error}"
-                            )
-                        # Try with smaller size
-                        try:
-                            doc.add_picture(str(image_path), width=Inches(4))
-                            self.stats["images"] += 1
-                            if self.debug_mode:
-                                print(f"   ✅ Image added with smaller size")
-                        except BaseException:
-                            if self.debug_mode:
-                                print(
-                                    f"   ❌ Failed to add image even with smaller size"
-                                )
+                    self._add_picture(img_element, doc, lambda: str(image_path))
                 else:
                     if self.debug_mode:
                         print(f"   ❌ Image file not found: {image_path}")
@@ -488,18 +1162,68 @@ class ReadmeToWordConverter:
             if self.debug_mode:
                 print(f"   ❌ Error processing image: {e}")
 
-    def _convert_list(self, list_element: Any, doc: Document) -> None:
+    def _add_picture(
+        self,
+        img_element: Any,
+        doc: BodyBuilder,
+        open_image: Callable[[], Union[str, IO[bytes]]],
+        svg_data: Optional[bytes] = None,
+    ) -> None:
+        """Add an image to the document, retrying at a smaller size on failure
+
+        With ``svg_data`` the picture is embedded as a vector image and the
+        raster image becomes the fallback for older Word versions.
+        """
+        # Add image to document with reasonable size
+        try:
+            # Try to add with 6 inch width, but handle oversized images
+            picture = doc.add_picture(open_image(), width=Inches(DIAGRAM_WIDTH_INCHES))
+            self.stats["images"] += 1
+            if svg_data is not None:
+                doc.attach_svg(picture, svg_data)
+                self.stats["vector_diagrams"] += 1
+
+            # Add caption if alt text exists
+            alt_text = img_element.get("alt", "")
+            if alt_text:
+                p = doc.add_paragraph(alt_text)
+                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                p.italic = True
+
+            if self.debug_mode:
+                print(f"   ✅ Image successfully added to document")
+
+        except Exception as img_add_error:
+            if self.debug_mode:
+                print(f"   ❌ Error adding image to document: {img_add_error}")
+            # Try with smaller size
+            try:
+                doc.add_picture(open_image(), width=Inches(4))
+                self.stats["images"] += 1
+                if self.debug_mode:
+                    print(f"   ✅ Image added with smaller size")
+            except BaseException:
+                if self.debug_mode:
+                    print(f"   ❌ Failed to add image even with smaller size")
+
+    def _convert_list(self, list_element: Any, doc: BodyBuilder) -> None:
         """Convert HTML list to Word list"""
         items = list_element.find_all("li")
         for item in items:
-            p = doc.add_paragraph(item.get_text().strip())
             if list_element.name == "ul":
-                p.style = "List Bullet"
+                style = "List Bullet"
             else:  # ol
-                p.style = "List Number"
+                style = "List Number"
+            doc.add_paragraph(item.get_text().strip(), style)
 
     def get_conversion_stats(self) -> Dict[str, int]:
-        """Get statistics about the conversion"""
+        """Get statistics about the conversion
+
+        Threads that have not converted anything get the stats of the most
+        recently finished conversion on any thread.
+        """
+        if not getattr(self._local, "converted", False) and self._last_stats:
+            return self._last_stats.copy()
         return self.stats.copy()
 
     def set_debug_mode(self, enabled: bool) -> None:
@@ -520,9 +1244,9 @@ class ReadmeToWordConverter:
         print(f"📝 Test code: {test_code[:50]}...")
 
         try:
-            image_path = self._mermaid_to_image(test_code, "default")
-            if image_path and Path(image_path).exists():
-                print(f"✅ Test successful! Image saved to: {image_path}")
+            image_data = self._mermaid_to_image(test_code, "default")
+            if image_data:
+                print(f"✅ Test successful! Rendered {len(image_data)} bytes")
                 return True
             else:
                 print("❌ Test failed - no image generated")
@@ -0,0 +1,269 @@
+"""
+Persistent diagram cache for README to Word Converter
+
+This module provides a SQLite-backed diagram cache that survives restarts
+and can be shared by several processes on the same host. The database runs
+in WAL mode so readers never block on writers. WAL relies on shared memory,
+so the file must be on a local disk and must not be shared across hosts,
+for example by pods on different nodes mounting one network volume.
+Entries expire after a TTL and the oldest entries are evicted once the
+total size limit is exceeded.
+
+Cache failures are never fatal: a database that cannot be opened, read or
+written behaves like an empty cache.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+DEFAULT_DISK_TTL = 7 * 24 * 60 * 60.0  # 7 days
+DEFAULT_DISK_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+DEFAULT_BUSY_TIMEOUT = 5.0  # seconds
+# Reads refresh an entry's access time at most this often
+ACCESS_TOUCH_INTERVAL = 60.0  # seconds
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS diagrams (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS diagrams_accessed_at ON diagrams (accessed_at)"
+
+
+class SQLiteDiagramCache:
+    """Diagram cache stored in a SQLite database file
+
+    Each thread uses its own connection, so one instance can be shared by
+    every converter in a process while other processes on the same host
+    open the same file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = DEFAULT_DISK_TTL,
+        max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        # False when the database could not be opened; the cache then
+        # stores nothing and every lookup is a miss
+        self.available = True
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(_SCHEMA)
+                conn.execute(_INDEX)
+        except (sqlite3.Error, OSError):
+            self.available = False
+            self.errors += 1
+            self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.path), timeout=self.busy_timeout, isolation_level=None
+            )
+            self._local.conn = conn
+            # WAL lets readers proceed while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for key, or None on a miss or expired entry"""
+        if not self.available:
+            self._count("misses")
+            return None
+        now = self._clock()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT data, created_at, accessed_at FROM diagrams WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (self.ttl > 0 and row[1] + self.ttl <= now):
+                self._count("misses")
+                return None
+            if now - row[2] >= ACCESS_TOUCH_INTERVAL:
+                self._touch(conn, key, now)
+        except sqlite3.Error:
+            self._count("errors")
+            return None
+
+        self._count("hits")
+        return bytes(row[0])
+
+    def _touch(self, conn: sqlite3.Connection, key: str, now: float) -> None:
+        """Refresh the access time, skipping it if the database is busy"""
+        try:
+            conn.execute(
+                "UPDATE diagrams SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        except sqlite3.OperationalError:
+            pass
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store bytes for key, then evict expired and oldest entries"""
+        size = len(data)
+        if not self.available or size > self.max_bytes:
+            return
+
+        now = self._clock()
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO diagrams "
+                    "(key, data, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, sqlite3.Binary(data), size, now, now),
+                )
+                evicted = self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            self._count("errors")
+            return
+
+        if evicted:
+            self._count("evictions", evicted)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """Delete expired entries and the least recently used over the limit"""
+        evicted = 0
+        if self.ttl > 0:
+            evicted += conn.execute(
+                "DELETE FROM diagrams WHERE created_at <= ?", (now - self.ttl,)
+            ).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM diagrams").fetchone()
+        excess = total[0] - self.max_bytes
+        if excess > 0:
+            freed = 0
+            victims = []
+            for key, size in conn.execute(
+                "SELECT key, size FROM diagrams ORDER BY accessed_at"
+            ):
+                victims.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM diagrams WHERE key = ?", victims)
+            evicted += len(victims)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        if self.available:
+            try:
+                self._connect().execute("DELETE FROM diagrams")
+            except sqlite3.Error:
+                self._count("errors")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.errors = 0
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _totals(self) -> Dict[str, int]:
+        if not self.available:
+            return {"entries": 0, "bytes": 0}
+        try:
+            entries, size = (
+                self._connect()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM diagrams")
+                .fetchone()
+            )
+        except sqlite3.Error:
+            entries, size = 0, 0
+        return {"entries": entries, "bytes": size}
+
+    def __len__(self) -> int:
+        return self._totals()["entries"]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def get_stats(self) -> Dict[str, Union[int, float, str]]:
+        """Get cache counters, settings and current size"""
+        stats: Dict[str, Union[int, float, str]] = {
+            "path": str(self.path),
+            "available": self.available,
+        }
+        stats.update(self._totals())
+        with self._lock:
+            stats.update(
+                {
+                    "max_bytes": self.max_bytes,
+                    "ttl": self.ttl,
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "errors": self.errors,
+                }
+            )
+        return stats
+
+
+def create_disk_cache_from_env() -> Optional[SQLiteDiagramCache]:
+    """Open the disk cache named by ``README2WORD_DISK_CACHE``, if any.
+
+    ``README2WORD_DISK_CACHE_TTL`` and ``README2WORD_DISK_CACHE_MAX_BYTES``
+    override the expiry time and size limit. Returns None, leaving the
+    diagram cache memory-only, when the database cannot be opened.
+    """
+    path = os.environ.get("README2WORD_DISK_CACHE")
+    if not path:
+        return None
+    cache = SQLiteDiagramCache(
+        path,
+        ttl=float(os.environ.get("README2WORD_DISK_CACHE_TTL", DEFAULT_DISK_TTL)),
+        max_bytes=int(
+            os.environ.get("README2WORD_DISK_CACHE_MAX_BYTES", DEFAULT_DISK_MAX_BYTES)
+        ),
+    )
+    if not cache.available:
+        print(
+            f"Warning: cannot open disk cache '{path}', caching diagrams in memory only",
+            file=sys.stderr,
+        )
+        return None
+    return cache
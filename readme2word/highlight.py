@@ -0,0 +1,201 @@
+"""
+Code block rendering for README to Word Converter
+
+Code blocks are written in one of two modes:
+
+- ``fast`` writes the code as plain text and never runs Pygments.
+- ``highlight`` tokenizes blocks whose fence names a language with Pygments
+  and writes each token as a colored run. Lexers and the run properties of
+  each token type are cached, so a document with many blocks in the same
+  language pays for them once.
+
+Pygments is optional; without it ``highlight`` behaves like ``fast``.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from lxml import etree
+
+from .oxml import W_BR, append_run
+
+try:
+    from pygments.lexers import get_lexer_by_name
+    from pygments.styles import get_style_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # pragma: no cover - exercised when Pygments is absent
+    get_lexer_by_name = None
+
+HAS_PYGMENTS = get_lexer_by_name is not None
+
+CODE_MODES = ("fast", "highlight")
+DEFAULT_CODE_STYLE = "default"
+
+# Blocks with more lines than this get one run per line instead of a
+# single run holding the whole block
+LARGE_CODE_BLOCK_LINES = 200
+
+
+def code_language(code_element: Any) -> Optional[str]:
+    """Language named on a fenced block (``class="language-x"``), if any
+
+    Works for the ``pre`` or ``code`` element, as a soup tag or tree node.
+    """
+    candidates = [code_element]
+    if code_element.name != "code":
+        candidates = code_element.find_all("code")[:1]
+    for element in candidates:
+        classes = element.get("class") or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        for name in classes:
+            if name.startswith("language-"):
+                return name[len("language-") :] or None
+    return None
+
+
+def _append_lines(p: Any, text: str, properties: Any = None) -> None:
+    """Append text as one run per line, each but the last ending in a break"""
+    lines = text.split("\n")
+    last = len(lines) - 1
+    for index, line in enumerate(lines):
+        if index == last and not line:
+            break
+        r = append_run(p, line, properties)
+        if index < last:
+            etree.SubElement(r, W_BR)
+
+
+def add_code_lines(paragraph: Any, code_text: str) -> None:
+    """Write plain code into a paragraph
+
+    Large blocks get a run per line, separated by breaks, so no single run
+    holds the whole block.
+    """
+    if not code_text:
+        return
+    if code_text.count("\n") < LARGE_CODE_BLOCK_LINES:
+        paragraph.add_run(code_text)
+        return
+    _append_lines(paragraph._p, code_text)
+
+
+def _build_run_properties(
+    bold: bool, italic: bool, color: Optional[str], underline: bool
+) -> Any:
+    """A ``w:rPr`` element with children in the order the schema requires"""
+    properties = OxmlElement("w:rPr")
+    if bold:
+        properties.append(OxmlElement("w:b"))
+    if italic:
+        properties.append(OxmlElement("w:i"))
+    if color:
+        color_element = OxmlElement("w:color")
+        color_element.set(qn("w:val"), color.upper())
+        properties.append(color_element)
+    if underline:
+        underline_element = OxmlElement("w:u")
+        underline_element.set(qn("w:val"), "single")
+        properties.append(underline_element)
+    return properties
+
+
+class CodeHighlighter:
+    """Turns Pygments tokens into formatted docx runs"""
+
+    def __init__(self, style: str = DEFAULT_CODE_STYLE):
+        self.style_name = style
+        self._style: Any = None
+        self._lexers: Dict[str, Any] = {}
+        self._run_properties: Dict[Any, Any] = {}
+        self._by_signature: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def lexer(self, language: str) -> Optional[Any]:
+        """Cached Pygments lexer for a language name; None if unknown"""
+        if not HAS_PYGMENTS:
+            return None
+        key = language.lower()
+        try:
+            return self._lexers[key]
+        except KeyError:
+            pass
+        try:
+            # Keep blank lines exactly as written, like fast mode does
+            lexer = get_lexer_by_name(key, stripnl=False, ensurenl=False)
+        except ClassNotFound:
+            lexer = None
+        with self._lock:
+            self._lexers[key] = lexer
+        return lexer
+
+    def run_properties(self, token_type: Any) -> Optional[Any]:
+        """Cached ``w:rPr`` template for a token type; None for plain text"""
+        try:
+            return self._run_properties[token_type]
+        except KeyError:
+            pass
+        if self._style is None:
+            self._style = get_style_by_name(self.style_name)
+        style = self._style.style_for_token(token_type)
+        signature = (style["bold"], style["italic"], style["color"], style["underline"])
+
+        with self._lock:
+            # Token types that look the same share one template, so their
+            # text can be merged into one run
+            properties = self._by_signature.get(signature)
+            if properties is None and any(signature):
+                properties = self._by_signature[signature] = _build_run_properties(
+                    *signature
+                )
+            self._run_properties[token_type] = properties
+        return properties
+
+    def _spans(self, lexer: Any, code_text: str) -> List[Tuple[Any, str]]:
+        """Token text grouped into spans that share run properties"""
+        spans: List[Tuple[Any, str]] = []
+        current: Any = None
+        parts: List[str] = []
+        for token_type, value in lexer.get_tokens(code_text):
+            if parts and value.isspace():
+                # Color and weight do not show on whitespace; keep the run going
+                parts.append(value)
+                continue
+            properties = self.run_properties(token_type)
+            if parts and properties is not current:
+                spans.append((current, "".join(parts)))
+                parts = []
+            current = properties
+            parts.append(value)
+        if parts:
+            spans.append((current, "".join(parts)))
+        return spans
+
+    def highlight(self, paragraph: Any, code_text: str, language: str) -> bool:
+        """Write code_text into paragraph as highlighted runs
+
+        Returns False, leaving the paragraph untouched, when no lexer is
+        available for the language.
+        """
+        lexer = self.lexer(language)
+        if lexer is None:
+            return False
+        p = paragraph._p
+        for properties, text in self._spans(lexer, code_text):
+            _append_lines(p, text, properties)
+        return True
+
+
+_default_highlighter: Optional[CodeHighlighter] = None
+_default_highlighter_lock = threading.Lock()
+
+
+def get_default_highlighter() -> CodeHighlighter:
+    """Get the process-wide highlighter, and its caches, shared by all converters"""
+    global _default_highlighter
+    with _default_highlighter_lock:
+        if _default_highlighter is None:
+            _default_highlighter = CodeHighlighter()
+        return _default_highlighter
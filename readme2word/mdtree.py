@@ -0,0 +1,129 @@
+"""
+Markdown element tree access for README to Word Converter
+
+Python-Markdown parses a document into an ElementTree before serializing
+it to HTML. The "ast" conversion engine stops at that tree and hands its
+elements straight to the converter's element handlers, skipping HTML
+serialization and the BeautifulSoup re-parse of the whole document.
+
+``TreeNode`` gives tree elements the small part of the BeautifulSoup Tag
+API the handlers use, so both engines share one set of handlers and
+produce the same document.
+"""
+
+from typing import Any, Iterator, List, Optional, Union
+from xml.etree.ElementTree import Element
+
+import markdown
+from markdown import util
+
+from .parsers import parse_html_blocks
+
+# Marks stashed raw HTML, entities and escapes inside tree text
+_PLACEHOLDER_MARK = util.STX
+
+
+class TreeNode:
+    """BeautifulSoup-like view of a Markdown ElementTree element"""
+
+    __slots__ = ("element",)
+
+    def __init__(self, element: Element):
+        self.element = element
+
+    @property
+    def name(self) -> str:
+        return self.element.tag
+
+    @property
+    def children(self) -> Iterator[Union[str, "TreeNode"]]:
+        """Text and child elements in document order"""
+        element = self.element
+        if element.text:
+            yield element.text
+        for child in element:
+            yield TreeNode(child)
+            if child.tail:
+                yield child.tail
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.element.get(key, default)
+
+    def get_text(self) -> str:
+        return "".join(self.element.itertext())
+
+    def find_all(self, name: Union[str, List[str]]) -> List["TreeNode"]:
+        """Descendant elements with the given tag name(s)"""
+        names = {name} if isinstance(name, str) else set(name)
+        root = self.element
+        return [
+            TreeNode(element)
+            for element in root.iter()
+            if element is not root and element.tag in names
+        ]
+
+    def __repr__(self) -> str:
+        return f"TreeNode(<{self.element.tag}>)"
+
+
+def parse_markdown_tree(md: markdown.Markdown, source: str) -> Optional[Element]:
+    """Run Python-Markdown up to its processed element tree
+
+    These are the steps ``Markdown.convert`` takes before serializing. The
+    root element wraps the document's top-level blocks; None is returned
+    for a blank document.
+    """
+    if not source.strip():
+        return None
+
+    lines = source.split("\n")
+    for preprocessor in md.preprocessors:
+        lines = preprocessor.run(lines)
+    root = md.parser.parseDocument(lines).getroot()
+    for treeprocessor in md.treeprocessors:
+        new_root = treeprocessor.run(root)
+        if new_root is not None:
+            root = new_root
+    return root
+
+
+def _has_placeholders(element: Element) -> bool:
+    """True if an element's subtree refers to stashed content"""
+    for node in element.iter():
+        if node.text and _PLACEHOLDER_MARK in node.text:
+            return True
+        if node is not element and node.tail and _PLACEHOLDER_MARK in node.tail:
+            return True
+        for value in node.attrib.values():
+            if _PLACEHOLDER_MARK in value:
+                return True
+    return False
+
+
+def _html_fragment(
+    md: markdown.Markdown, element: Element, html_parser: str
+) -> List[Any]:
+    """Serialize one block and parse it back, as the html engine would"""
+    html = md.serializer(element)
+    for postprocessor in md.postprocessors:
+        html = postprocessor.run(html)
+    return parse_html_blocks(html, html_parser)
+
+
+def iter_markdown_blocks(
+    md: markdown.Markdown, source: str, html_parser: str = "html.parser"
+) -> Iterator[Any]:
+    """Yield the top-level blocks of source for the element handlers
+
+    Blocks that hold stashed raw HTML (fenced code, inline HTML, entities)
+    only exist as HTML text, so just those blocks are serialized and parsed;
+    every other block is yielded as a ``TreeNode``.
+    """
+    root = parse_markdown_tree(md, source)
+    if root is None:
+        return
+    for element in root:
+        if _has_placeholders(element):
+            yield from _html_fragment(md, element, html_parser)
+        else:
+            yield TreeNode(element)
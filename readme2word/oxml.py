@@ -0,0 +1,50 @@
+"""
+Direct WordprocessingML builders for README to Word Converter
+
+python-docx creates every element through its proxy objects, which is
+fine for a few runs but dominates conversion time for huge tables and
+code blocks. These helpers append the same XML straight to the lxml tree.
+"""
+
+import copy
+import re
+from typing import Any
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+W_R = qn("w:r")
+W_T = qn("w:t")
+W_TAB = qn("w:tab")
+W_BR = qn("w:br")
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Characters python-docx turns into elements rather than text
+_SPECIAL_CHARS = re.compile(r"([\t\r\n])")
+
+
+def append_run(parent: Any, text: str, properties: Any = None) -> Any:
+    """Append a ``w:r`` holding text and return it
+
+    Produces the same XML as python-docx's ``add_run(text)``: tabs become
+    ``w:tab``, carriage returns and newlines ``w:br``. ``properties`` is a
+    ``w:rPr`` template that is copied into the run.
+    """
+    r = etree.SubElement(parent, W_R)
+    if properties is not None:
+        r.append(copy.deepcopy(properties))
+    if "\t" in text or "\n" in text or "\r" in text:
+        pieces = _SPECIAL_CHARS.split(text)
+    else:
+        pieces = [text]
+    for piece in pieces:
+        if piece == "\t":
+            etree.SubElement(r, W_TAB)
+        elif piece in ("\r", "\n"):
+            etree.SubElement(r, W_BR)
+        elif piece:
+            t = etree.SubElement(r, W_T)
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(XML_SPACE, "preserve")
+    return r
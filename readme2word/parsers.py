@@ -0,0 +1,89 @@
+"""
+HTML parser backends for README to Word Converter
+
+BeautifulSoup can build its tree with the pure-Python ``html.parser``, the
+C-based ``lxml`` or the browser-grade ``html5lib``. For the HTML Markdown
+generates they give the converter the same tree and differ only in speed.
+
+Raw HTML in a README may be malformed, and each parser repairs it in its
+own way. ``lxml`` and ``html5lib`` close an open ``<td>`` when the next one
+starts, as browsers do; ``html.parser`` nests the next cell inside it, so
+the first cell's text includes the second's. ``html.parser`` also splits
+text around stray end tags such as ``</div>``, which changes where runs
+break.
+
+The default is the fastest one installed: ``lxml``, which python-docx
+already requires. Earlier versions always used ``html.parser``; set
+``README2WORD_HTML_PARSER=html.parser`` to keep their output for such
+documents.
+"""
+
+import importlib.util
+import os
+from typing import Any, List, Optional
+
+from bs4 import BeautifulSoup
+
+HTML_PARSERS = ("lxml", "html.parser", "html5lib")
+
+# Candidates for the default, fastest first; html.parser is always present
+_DEFAULT_PREFERENCE = ("lxml", "html.parser")
+
+# Module each parser needs beyond BeautifulSoup itself
+_PARSER_MODULES = {"lxml": "lxml", "html5lib": "html5lib"}
+
+
+def html_parser_available(name: str) -> bool:
+    """True if the named parser can be used in this environment"""
+    module = _PARSER_MODULES.get(name)
+    if module is None:
+        return name in HTML_PARSERS
+    return importlib.util.find_spec(module) is not None
+
+
+def available_html_parsers() -> List[str]:
+    """Installed parsers, in HTML_PARSERS order"""
+    return [name for name in HTML_PARSERS if html_parser_available(name)]
+
+
+def get_default_html_parser() -> str:
+    """``README2WORD_HTML_PARSER`` if set, else the fastest installed parser"""
+    name = os.environ.get("README2WORD_HTML_PARSER")
+    if name:
+        return name
+    for candidate in _DEFAULT_PREFERENCE:
+        if html_parser_available(candidate):
+            return candidate
+    return "html.parser"
+
+
+def resolve_html_parser(name: Optional[str] = None) -> str:
+    """Validate a parser name, falling back to the default for None
+
+    Raises ValueError for unknown parsers and for ones that are not
+    installed.
+    """
+    name = name or get_default_html_parser()
+    if name not in HTML_PARSERS:
+        raise ValueError(
+            f"Unknown HTML parser '{name}'. Choose from: {', '.join(HTML_PARSERS)}"
+        )
+    if not html_parser_available(name):
+        raise ValueError(
+            f"HTML parser '{name}' is not installed (pip install {_PARSER_MODULES[name]})"
+        )
+    return name
+
+
+def parse_html_blocks(html: str, parser: str = "html.parser") -> List[Any]:
+    """Parse an HTML fragment and return its top-level nodes
+
+    ``lxml`` and ``html5lib`` wrap fragments in ``<html><body>``; the
+    body's children are returned so every parser yields the same nodes.
+    """
+    soup = BeautifulSoup(html, parser)
+    if parser != "html.parser":
+        if soup.body is None:
+            return []
+        return list(soup.body.children)
+    return list(soup.children)
@@ -0,0 +1,154 @@
+"""
+Diagram image post-processing for README to Word Converter
+
+Rendered diagrams arrive as 24/32-bit PNGs with wide uniform margins,
+although they only use a handful of flat colors. ``optimize_png`` trims the
+margins, moves the image to an adaptive palette and re-encodes it with
+PNG optimization. NumPy (the ``images`` extra) speeds up the pixel scans;
+without it the same steps run on Pillow alone.
+"""
+
+import io
+from typing import Any, Optional, Tuple
+
+from PIL import Image, ImageChops
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Pixels within this distance of the corner color count as background
+DEFAULT_TRIM_TOLERANCE = 8
+# Margin left around the trimmed diagram, in pixels
+DEFAULT_TRIM_PADDING = 8
+DEFAULT_MAX_COLORS = 256
+
+Box = Tuple[int, int, int, int]
+
+
+def _content_bbox_numpy(img: Image.Image, tolerance: int) -> Optional[Box]:
+    """Bounding box of pixels that differ from the top-left color"""
+    pixels = np.asarray(img, dtype=np.int16)
+    if pixels.ndim == 2:
+        pixels = pixels[:, :, np.newaxis]
+    distance = np.abs(pixels - pixels[0, 0]).max(axis=2)
+    content = distance > tolerance
+    rows = np.flatnonzero(content.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(content.any(axis=0))
+    return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+
+def _content_bbox_pillow(img: Image.Image, tolerance: int) -> Optional[Box]:
+    """Pillow-only fallback for _content_bbox_numpy"""
+    background = Image.new(img.mode, img.size, img.getpixel((0, 0)))
+    difference = ImageChops.difference(img, background)
+    bands = difference.split()
+    distance = bands[0]
+    for band in bands[1:]:
+        distance = ImageChops.lighter(distance, band)
+    return distance.point(lambda value: 255 if value > tolerance else 0).getbbox()
+
+
+def content_bbox(
+    img: Image.Image, tolerance: int = DEFAULT_TRIM_TOLERANCE
+) -> Optional[Box]:
+    """Return the box around everything that is not border background
+
+    The background is the color of the top-left pixel. Returns None for an
+    image that is background only.
+    """
+    if img.mode not in ("RGB", "RGBA", "L", "LA"):
+        img = img.convert("RGBA")
+    if HAS_NUMPY:
+        return _content_bbox_numpy(img, tolerance)
+    return _content_bbox_pillow(img, tolerance)
+
+
+def trim_image(
+    img: Image.Image,
+    tolerance: int = DEFAULT_TRIM_TOLERANCE,
+    padding: int = DEFAULT_TRIM_PADDING,
+) -> Image.Image:
+    """Crop uniform borders, keeping ``padding`` pixels around the content"""
+    box = content_bbox(img, tolerance)
+    if box is None:
+        return img
+    left, top, right, bottom = box
+    box = (
+        max(0, left - padding),
+        max(0, top - padding),
+        min(img.width, right + padding),
+        min(img.height, bottom + padding),
+    )
+    if box == (0, 0, img.width, img.height):
+        return img
+    return img.crop(box)
+
+
+def _count_colors(img: Image.Image, limit: int) -> Optional[int]:
+    """Number of distinct colors, or None when there are more than limit"""
+    if HAS_NUMPY:
+        pixels = np.asarray(img)
+        if pixels.ndim == 2:
+            pixels = pixels[:, :, np.newaxis]
+        # Pack each pixel into one integer so np.unique works on a flat array
+        packed = np.zeros(pixels.shape[:2], dtype=np.uint32)
+        for channel in range(pixels.shape[2]):
+            packed = (packed << 8) | pixels[:, :, channel]
+        count = np.unique(packed).size
+        return count if count <= limit else None
+    colors = img.getcolors(maxcolors=limit)
+    return len(colors) if colors is not None else None
+
+
+def quantize_image(
+    img: Image.Image, max_colors: int = DEFAULT_MAX_COLORS
+) -> Image.Image:
+    """Move the image to a palette of at most max_colors adaptive colors
+
+    Images that already fit in the palette are converted losslessly.
+    """
+    if img.mode == "P":
+        return img
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    if img.mode == "RGBA" and img.getextrema()[3][0] == 255:
+        # Fully opaque: the alpha channel only costs bytes
+        img = img.convert("RGB")
+
+    method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else None
+    count = _count_colors(img, max_colors)
+    colors = count if count is not None else max_colors
+    return img.quantize(colors=colors, method=method, dither=Image.Dither.NONE)
+
+
+def optimize_png(
+    image_data: bytes,
+    trim: bool = True,
+    max_colors: int = DEFAULT_MAX_COLORS,
+    tolerance: int = DEFAULT_TRIM_TOLERANCE,
+    padding: int = DEFAULT_TRIM_PADDING,
+) -> bytes:
+    """Trim, quantize and re-encode a PNG diagram
+
+    Returns the smaller of the optimized and the original bytes, so the
+    result is never larger than the input. ``max_colors=0`` skips
+    quantization.
+    """
+    with Image.open(io.BytesIO(image_data)) as img:
+        img.load()
+        result: Any = img
+        if trim:
+            result = trim_image(result, tolerance, padding)
+        if max_colors:
+            result = quantize_image(result, max_colors)
+        buffer = io.BytesIO()
+        result.save(buffer, "PNG", optimize=True)
+
+    optimized = buffer.getvalue()
+    return optimized if len(optimized) < len(image_data) else image_data
@@ -0,0 +1,103 @@
+"""
+Diagram prerendering for README to Word Converter
+
+Scans a tree of markdown files, renders every unique Mermaid block
+concurrently and writes the results to a portable diagram bundle. The
+bundle can then be used by ``convert(offline=True)`` in jobs that must not
+touch the network.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .bundle import DiagramBundle
+from .cache import diagram_cache_key
+from .converter import MERMAID_BLOCK_PATTERN, ReadmeToWordConverter
+
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+
+
+def find_markdown_files(root: Union[str, Path]) -> List[Path]:
+    """Return markdown files under root (or root itself if it is a file)"""
+    root = Path(root)
+    if root.is_file():
+        return [root]
+    return sorted(
+        path
+        for path in root.rglob("*")
+        if path.is_file() and path.suffix.lower() in MARKDOWN_SUFFIXES
+    )
+
+
+def collect_diagrams(
+    files: List[Path],
+    theme: str = "default",
+    key: Callable[[str, str], str] = diagram_cache_key,
+) -> Dict[str, str]:
+    """Map cache keys to Mermaid source for every unique block in files"""
+    diagrams: Dict[str, str] = {}
+    for path in files:
+        content = path.read_text(encoding="utf-8", errors="replace")
+        for match in MERMAID_BLOCK_PATTERN.finditer(content):
+            code = match.group(1).strip()
+            diagrams.setdefault(key(code, theme), code)
+    return diagrams
+
+
+def prerender_diagrams(
+    root: Union[str, Path],
+    output: Union[str, Path],
+    theme: str = "default",
+    max_workers: int = 4,
+    converter: Optional[ReadmeToWordConverter] = None,
+) -> Dict[str, Any]:
+    """Render every unique diagram under root and save them as a bundle
+
+    Rendering goes through the converter, so the shared diagram caches are
+    warmed as a side effect. Returns statistics about the run.
+    """
+    if converter is None:
+        converter = ReadmeToWordConverter()
+        converter.set_debug_mode(False)
+
+    files = find_markdown_files(root)
+    diagrams = collect_diagrams(files, theme)
+    items = list(enumerate(diagrams.values(), start=1))
+
+    def render_job(item: Tuple[int, str]) -> Tuple[List[Tuple[str, bytes, str]], int]:
+        number, code = item
+        hits_before = converter.stats["diagram_cache_hits"]
+        rendered: List[Tuple[str, bytes, str]] = []
+        # Keys come from the converter, so they include its render options
+        # and match what convert() looks up
+        key, png_data = converter.render_diagram(code, theme, diagram_number=number)
+        if png_data:
+            rendered.append((key, png_data, "png"))
+            if converter.diagram_format == "svg":
+                svg_key, svg_data = converter.render_diagram(
+                    code, theme, image_format="svg", diagram_number=number
+                )
+                if svg_data:
+                    rendered.append((svg_key, svg_data, "svg"))
+        return rendered, converter.stats["diagram_cache_hits"] - hits_before
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        outcomes = list(executor.map(render_job, items))
+    results = [rendered for rendered, _ in outcomes]
+
+    bundle = DiagramBundle()
+    for rendered in results:
+        for key, image_data, image_format in rendered:
+            bundle.add(key, image_data, theme, image_format)
+    bundle_path = bundle.save(output)
+    rendered_count = sum(1 for rendered in results if rendered)
+
+    return {
+        "files": len(files),
+        "diagrams": len(items),
+        "rendered": rendered_count,
+        "failed": len(items) - rendered_count,
+        "cache_hits": sum(hits for _, hits in outcomes),
+        "bundle": str(bundle_path),
+    }
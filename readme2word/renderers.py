@@ -0,0 +1,265 @@
+"""
+Diagram renderer backends
+
+This module defines the renderer interface used by the converter to turn
+Mermaid source into image bytes, plus the built-in backends:
+
+- ``mermaid-ink``: the public https://mermaid.ink service
+- ``custom``: a self-hosted mermaid.ink compatible service at any base URL
+- ``none``: a no-op renderer that leaves every diagram as a code block
+
+The backend can be chosen explicitly or through the ``README2WORD_RENDERER``
+and ``README2WORD_RENDERER_URL`` environment variables.
+
+Diagram source travels in the URL either as plain base64 or in the
+deflate-compressed ``pako:`` form understood by mermaid.ink and
+mermaid.live; by default whichever is shorter is used.
+"""
+
+import base64
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from .transport import RETRYABLE_STATUS_CODES, DiagramTransport, get_default_transport
+
+MERMAID_INK_URL = "https://mermaid.ink"
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024  # 10 MB
+STREAM_CHUNK_SIZE = 64 * 1024
+RENDERER_CHOICES = ("mermaid-ink", "custom", "none")
+ENCODING_CHOICES = ("auto", "base64", "pako")
+
+# Themes understood by mermaid.ink; anything else falls back to default
+SUPPORTED_THEMES = ("default", "neutral", "dark", "forest")
+
+
+class DiagramRenderError(Exception):
+    """Raised when a renderer backend fails to produce an image
+
+    ``error_class`` is a short machine readable reason and ``transient``
+    marks failures that may succeed if retried later.
+    """
+
+    def __init__(
+        self, message: str, error_class: str = "render_error", transient: bool = False
+    ):
+        super().__init__(message)
+        self.error_class = error_class
+        self.transient = transient
+
+
+class DiagramRenderer(ABC):
+    """Interface for turning Mermaid source into image bytes"""
+
+    name = "base"
+    # False for backends that intentionally never produce images
+    renders_images = True
+
+    @abstractmethod
+    def render(
+        self,
+        source: str,
+        theme: str = "default",
+        width: Optional[int] = None,
+        image_format: str = "png",
+    ) -> Optional[bytes]:
+        """Render Mermaid source and return the image bytes.
+
+        ``width`` asks for an image of that many pixels across, when the
+        backend supports it. ``image_format`` is "png" for a raster image
+        or "svg" for SVG markup. Raises DiagramRenderError (or a requests
+        exception) on failure.
+        """
+
+    def describe(self) -> str:
+        """Human readable description for debug output"""
+        return self.name
+
+
+class MermaidInkRenderer(DiagramRenderer):
+    """Renderer for mermaid.ink and compatible self-hosted services"""
+
+    name = "mermaid-ink"
+
+    def __init__(
+        self,
+        base_url: str = MERMAID_INK_URL,
+        transport: Optional[DiagramTransport] = None,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        encoding: str = "auto",
+    ):
+        if encoding not in ENCODING_CHOICES:
+            raise ValueError(
+                f"Unknown diagram encoding '{encoding}'. "
+                f"Choose from: {', '.join(ENCODING_CHOICES)}"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.max_response_bytes = max_response_bytes
+        self.encoding = encoding
+        self.transport = transport if transport is not None else get_default_transport()
+
+    @staticmethod
+    def encode_base64(source: str) -> str:
+        """Encode source as URL-safe base64"""
+        return base64.urlsafe_b64encode(source.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def encode_pako(source: str, theme: str = "default") -> str:
+        """Encode source in the deflate-compressed ``pako:`` form"""
+        state = json.dumps({"code": source, "mermaid": {"theme": theme}})
+        compressed = zlib.compress(state.encode("utf-8"), 9)
+        encoded = base64.urlsafe_b64encode(compressed).decode("ascii")
+        return "pako:" + encoded.rstrip("=")
+
+    def encode_source(self, source: str, theme: str = "default") -> str:
+        """Encode source for the URL path using the configured encoding"""
+        source = source.strip()
+        if self.encoding == "base64":
+            return self.encode_base64(source)
+        if self.encoding == "pako":
+            return self.encode_pako(source, theme)
+        return min(self.encode_base64(source), self.encode_pako(source, theme), key=len)
+
+    def build_url(
+        self,
+        source: str,
+        theme: str = "default",
+        width: Optional[int] = None,
+        image_format: str = "png",
+    ) -> str:
+        """Build the image URL for the given source, theme and pixel width"""
+        actual_theme = theme if theme in SUPPORTED_THEMES else "default"
+        encoded = self.encode_source(source, actual_theme)
+        endpoint = "svg" if image_format == "svg" else "img"
+        url = f"{self.base_url}/{endpoint}/{encoded}?theme={actual_theme}"
+        if width:
+            url += f"&width={width}"
+        return url
+
+    def render(
+        self,
+        source: str,
+        theme: str = "default",
+        width: Optional[int] = None,
+        image_format: str = "png",
+    ) -> Optional[bytes]:
+        """Fetch the rendered diagram image"""
+        response = self.transport.get(
+            self.build_url(source, theme, width, image_format), stream=True
+        )
+        try:
+            if response.status_code != 200:
+                raise DiagramRenderError(
+                    f"API Error {response.status_code}: {self._preview(response, 200)}",
+                    error_class=f"http_{response.status_code}",
+                    transient=response.status_code in RETRYABLE_STATUS_CODES,
+                )
+
+            # Verify it's actually an image
+            content_type = response.headers.get("content-type", "")
+            if "image" not in content_type:
+                raise DiagramRenderError(
+                    f"Expected image but got {content_type}: {self._preview(response, 100)}",
+                    error_class="unexpected_content_type",
+                )
+
+            return self._read_body(response)
+        finally:
+            response.close()
+
+    def _read_body(self, response: Any) -> bytes:
+        """Stream the response body, refusing anything over the byte cap"""
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > self.max_response_bytes:
+            raise DiagramRenderError(
+                f"Response of {declared} bytes exceeds the "
+                f"{self.max_response_bytes} byte limit",
+                error_class="response_too_large",
+            )
+
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_response_bytes:
+                raise DiagramRenderError(
+                    f"Response exceeds the {self.max_response_bytes} byte limit",
+                    error_class="response_too_large",
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _preview(response: Any, limit: int) -> str:
+        """Read at most ``limit`` bytes of an error body for diagnostics"""
+        chunk = next(response.iter_content(chunk_size=limit), b"")
+        return chunk[:limit].decode("utf-8", errors="replace")
+
+    def describe(self) -> str:
+        return f"{self.name} ({self.base_url})"
+
+
+class CodeBlockRenderer(DiagramRenderer):
+    """No-op renderer that keeps every diagram as a code block"""
+
+    name = "none"
+    renders_images = False
+
+    def render(
+        self,
+        source: str,
+        theme: str = "default",
+        width: Optional[int] = None,
+        image_format: str = "png",
+    ) -> Optional[bytes]:
+        return None
+
+
+def create_renderer(
+    name: Optional[str] = None,
+    base_url: Optional[str] = None,
+    transport: Optional[DiagramTransport] = None,
+) -> DiagramRenderer:
+    """Create a renderer by name, falling back to environment configuration
+
+    ``README2WORD_MAX_DIAGRAM_BYTES`` caps how much a single diagram
+    response may stream and ``README2WORD_DIAGRAM_ENCODING`` selects the
+    URL encoding (auto, base64 or pako).
+    """
+    name = name or os.environ.get("README2WORD_RENDERER")
+    base_url = base_url or os.environ.get("README2WORD_RENDERER_URL")
+    max_response_bytes = int(
+        os.environ.get("README2WORD_MAX_DIAGRAM_BYTES", DEFAULT_MAX_RESPONSE_BYTES)
+    )
+    encoding = os.environ.get("README2WORD_DIAGRAM_ENCODING", "auto")
+    if not name:
+        name = "custom" if base_url else "mermaid-ink"
+
+    if name == "mermaid-ink":
+        return MermaidInkRenderer(
+            transport=transport,
+            max_response_bytes=max_response_bytes,
+            encoding=encoding,
+        )
+    if name == "custom":
+        if not base_url:
+            raise ValueError(
+                "The custom renderer needs a base URL "
+                "(--renderer-url or README2WORD_RENDERER_URL)"
+            )
+        renderer = MermaidInkRenderer(
+            base_url=base_url,
+            transport=transport,
+            max_response_bytes=max_response_bytes,
+            encoding=encoding,
+        )
+        renderer.name = "custom"
+        return renderer
+    if name == "none":
+        return CodeBlockRenderer()
+
+    raise ValueError(
+        f"Unknown diagram renderer '{name}'. Choose from: {', '.join(RENDERER_CHOICES)}"
+    )
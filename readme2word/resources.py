@@ -0,0 +1,144 @@
+"""
+Warm conversion resources for README to Word Converter
+
+Building a Markdown parser with its extensions, loading the python-docx
+default template from disk and registering the converter's styles cost
+more than converting a small README. Long-running processes keep one set
+of these resources: conversions borrow a Markdown instance from a shared
+pool, reset between conversions, and every conversion starts from a copy
+of a template whose styles are already applied.
+"""
+
+import copy
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Sequence
+
+import markdown
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.shared import Inches, Pt
+
+# Code blocks are highlighted by the converter itself (see highlight.py),
+# so codehilite is not needed
+MARKDOWN_EXTENSIONS = ("tables", "fenced_code")
+
+# Converted by warmup() so the parser's block and inline processors are loaded
+_WARMUP_SOURCE = """# Warmup
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+```
+print("warm")
+```
+"""
+
+
+def apply_document_styles(doc: Document) -> None:
+    """Add the converter's custom styles to a document"""
+    styles = doc.styles
+
+    # Code block style
+    try:
+        code_style = styles.add_style("Code Block", WD_STYLE_TYPE.PARAGRAPH)
+        code_style.font.name = "Consolas"
+        code_style.font.size = Pt(9)
+        code_style.paragraph_format.left_indent = Inches(0.5)
+        code_style.paragraph_format.space_before = Pt(6)
+        code_style.paragraph_format.space_after = Pt(6)
+    except BaseException:
+        pass  # Style might already exist
+
+
+class ConversionResources:
+    """Reusable Markdown parsers and a styled document template
+
+    Markdown instances are not thread-safe, so each conversion borrows one
+    from a pool and returns it afterwards. Instances are not tied to a
+    thread: servers that run every request on a new thread (as Streamlit
+    does) still get the instance warmup() prepared. The template is built
+    once and deep-copied for every document, which skips reading the
+    default template from disk and re-adding styles.
+    """
+
+    def __init__(
+        self,
+        extensions: Sequence[str] = MARKDOWN_EXTENSIONS,
+        setup: Callable[[Document], None] = apply_document_styles,
+    ):
+        self.extensions = list(extensions)
+        self._setup = setup
+        self._template: Optional[Document] = None
+        self._lock = threading.Lock()
+        self._idle_markdown: List[markdown.Markdown] = []
+        self._warm = threading.Event()
+
+    @contextmanager
+    def borrow_markdown(self) -> Iterator[markdown.Markdown]:
+        """Lend a Markdown instance ready for a document, then take it back
+
+        Idle instances are reused; a new one is built only when every
+        instance is in use by another conversion.
+        """
+        with self._lock:
+            md = self._idle_markdown.pop() if self._idle_markdown else None
+        if md is None:
+            md = markdown.Markdown(extensions=self.extensions)
+        try:
+            yield md
+        finally:
+            md.reset()
+            with self._lock:
+                self._idle_markdown.append(md)
+
+    def new_document(self) -> Document:
+        """A fresh copy of the styled template"""
+        template = self._template
+        if template is None:
+            with self._lock:
+                if self._template is None:
+                    template = Document()
+                    self._setup(template)
+                    self._template = template
+                template = self._template
+        return copy.deepcopy(template)
+
+    @property
+    def is_warm(self) -> bool:
+        """True once warmup() has completed"""
+        return self._warm.is_set()
+
+    def warmup(self) -> float:
+        """Load everything a conversion needs and return the seconds spent
+
+        Builds the template and a pooled Markdown instance and runs a small
+        document through them; any thread's next conversion reuses both.
+        Safe to call repeatedly and from several threads; later calls return
+        almost immediately.
+        """
+        start = time.perf_counter()
+        self.new_document()
+        with self.borrow_markdown() as md:
+            md.convert(_WARMUP_SOURCE)
+        self._warm.set()
+        return time.perf_counter() - start
+
+    def wait_until_warm(self, timeout: Optional[float] = None) -> bool:
+        """Block until another thread's warmup() finishes; False on timeout"""
+        return self._warm.wait(timeout)
+
+
+_default_resources: Optional[ConversionResources] = None
+_default_resources_lock = threading.Lock()
+
+
+def get_default_resources() -> ConversionResources:
+    """Get the process-wide conversion resources shared by all converters"""
+    global _default_resources
+    with _default_resources_lock:
+        if _default_resources is None:
+            _default_resources = ConversionResources()
+        return _default_resources
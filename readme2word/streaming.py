@@ -0,0 +1,298 @@
+"""
+Streaming .docx output for README to Word Converter
+
+python-docx keeps the whole document tree, and every image, in memory
+until ``Document.save()``. StreamingBodyBuilder writes each block into
+``word/document.xml`` inside the output zip as soon as the next block is
+started, and spools images to the conversion's scratch directory until
+they are copied into the zip in chunks. The memory used for the output
+stays the same however large the document grows.
+
+The styled template supplies every other part (styles, numbering,
+settings, properties); those are written when the stream is opened.
+Relationship ids, media names and shape ids follow python-docx's
+numbering, so the document matches the one ``Document.save()`` writes.
+"""
+
+import hashlib
+import os
+import shutil
+import zipfile
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from docx.image.image import Image
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.oxml import CT_Relationships, CT_Types
+from docx.opc.packuri import PackURI
+from docx.oxml.shape import CT_Inline
+from docx.shape import InlineShape
+from docx.shared import Emu, Length
+from lxml import etree
+
+from .body import BodyBuilder
+from .svg import SVG_CONTENT_TYPE, SVG_PARTNAME_TEMPLATE, add_svg_blip
+
+OUTPUT_BACKENDS = ("docx", "stream")
+
+# Media are added after [Content_Types].xml is written, so every image
+# type the converter can embed gets a default content type up front
+MEDIA_CONTENT_TYPES = {
+    "bmp": CT.BMP,
+    "gif": CT.GIF,
+    "jpeg": CT.JPEG,
+    "jpg": CT.JPEG,
+    "png": CT.PNG,
+    "svg": SVG_CONTENT_TYPE,
+    "tif": CT.TIFF,
+    "tiff": CT.TIFF,
+}
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+_IMAGE_PARTNAME_TEMPLATE = "/word/media/image%d.%s"
+
+
+class _EmbeddedImage(NamedTuple):
+    """What later pictures of an already spooled image need to know"""
+
+    rel_id: str
+    filename: str
+    width: Length
+    height: Length
+
+    def scaled_dimensions(
+        self, width: Optional[Length], height: Optional[Length]
+    ) -> Tuple[Length, Length]:
+        """Display size, scaled like python-docx's Image.scaled_dimensions()"""
+        if width is None and height is None:
+            return self.width, self.height
+        if width is None:
+            width = Emu(round(self.width * (float(height) / float(self.height))))
+        if height is None:
+            height = Emu(round(self.height * (float(width) / float(self.width))))
+        return Emu(width), Emu(height)
+
+
+class StreamingBodyBuilder(BodyBuilder):
+    """Appends blocks straight to a .docx file instead of the document tree
+
+    A block is written once the next one is started (or on save()), so
+    it can still be filled in after it is added, as with BodyBuilder. The
+    output is written to a temporary file next to ``path`` and moved into
+    place by save(); discard() removes it.
+    """
+
+    def __init__(self, document: Any, path: Union[str, Path], spool_dir: Path):
+        super().__init__(document)
+        self.path = Path(path)
+        self._spool_dir = Path(spool_dir)
+        self._partial = self.path.with_name(f".{self.path.name}.part")
+        self._document_part = document.part
+        self._rel_ids = set(self._document_part.rels.keys())
+        self._rels: List[Tuple[str, str]] = []
+        self._media: List[Tuple[str, Path]] = []
+        # Like python-docx, repeats of an image reuse the first one's part
+        self._images: Dict[str, _EmbeddedImage] = {}
+        self._svg_rels: Dict[str, str] = {}
+        self._svg_partnames: List[str] = []
+        self._pending: Any = None
+        self._last_shape_id = max(
+            (
+                int(value)
+                for value in document.element.xpath("//@id")
+                if value.isdigit()
+            ),
+            default=0,
+        )
+        self.closed = False
+
+        self._stack = ExitStack()
+        self._zip = zipfile.ZipFile(self._partial, "w", zipfile.ZIP_DEFLATED)
+        try:
+            self._write_package_parts()
+            self._open_document()
+        except BaseException:
+            self.discard()
+            raise
+
+    def _write_package_parts(self) -> None:
+        """Write every part of the template except the main document"""
+        package = self._document_part.package
+        parts = list(package.iter_parts())
+        self._zip.writestr("[Content_Types].xml", self._content_types(parts))
+        self._zip.writestr("_rels/.rels", package.rels.xml)
+        for part in parts:
+            if part is self._document_part:
+                continue
+            self._zip.writestr(part.partname.membername, part.blob)
+            if len(part.rels):
+                self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+    @staticmethod
+    def _content_types(parts: List[Any]) -> bytes:
+        """[Content_Types].xml for the template parts and any embedded media"""
+        defaults = {"rels": CT.OPC_RELATIONSHIPS, "xml": CT.XML}
+        defaults.update(MEDIA_CONTENT_TYPES)
+        types = CT_Types.new()
+        for ext in sorted(defaults):
+            types.add_default(ext, defaults[ext])
+        for part in sorted(parts, key=lambda part: part.partname):
+            if defaults.get(part.partname.ext.lower()) != part.content_type:
+                types.add_override(part.partname, part.content_type)
+        return etree.tostring(types, encoding="UTF-8", standalone=True)
+
+    def _open_document(self) -> None:
+        """Start word/document.xml and write what precedes the new blocks"""
+        handle = self._stack.enter_context(
+            self._zip.open(
+                self._document_part.partname.membername, "w", force_zip64=True
+            )
+        )
+        self._xf = self._stack.enter_context(etree.xmlfile(handle, encoding="UTF-8"))
+        self._xf.write_declaration(standalone=True)
+        root = self.document.element
+        self._stack.enter_context(
+            self._xf.element(root.tag, dict(root.attrib), nsmap=root.nsmap)
+        )
+        for child in root:
+            if child is self._body:
+                break
+            self._xf.write(child)
+        self._stack.enter_context(
+            self._xf.element(self._body.tag, dict(self._body.attrib))
+        )
+        self._write_body_content()
+
+    def _write(self, element: Any) -> None:
+        """Move a finished block from the tree to the output"""
+        self._body.remove(element)
+        self._xf.write(element)
+
+    def _write_body_content(self) -> None:
+        """Write the blocks still in the tree, e.g. added through the document"""
+        for child in list(self._body):
+            if child is not self._sect_pr:
+                self._write(child)
+
+    def _flush(self) -> None:
+        """Write the block added last; it is complete once another starts"""
+        if self._pending is not None:
+            self._write(self._pending)
+            self._pending = None
+
+    def append(self, element: Any) -> None:
+        """Add a block-level element, writing out the previous one"""
+        if self.closed:
+            raise ValueError(f"Streaming output to {self.path} is already closed")
+        self._flush()
+        super().append(element)
+        self._pending = element
+
+    def _relate(self, target: str) -> str:
+        """Add an image relationship from the document part, python-docx style"""
+        for n in range(1, len(self._rel_ids) + 2):
+            rel_id = "rId%d" % n
+            if rel_id not in self._rel_ids:
+                break
+        self._rel_ids.add(rel_id)
+        self._rels.append((rel_id, target))
+        return rel_id
+
+    def _spool(self, partname: str, data: bytes) -> None:
+        """Keep media on disk until the document part is finished"""
+        path = self._spool_dir / f"media-{len(self._media)}{Path(partname).suffix}"
+        path.write_bytes(data)
+        self._media.append((partname, path))
+
+    def add_picture(
+        self,
+        image: Union[str, IO[bytes]],
+        width: Optional[Length] = None,
+        height: Optional[Length] = None,
+    ) -> Any:
+        """Add a picture in its own paragraph and return its inline shape"""
+        picture = Image.from_file(image)
+        embedded = self._images.get(picture.sha1)
+        if embedded is None:
+            if picture.ext.lower() not in MEDIA_CONTENT_TYPES:
+                raise ValueError(f"Unsupported image type '{picture.ext}'")
+            partname = _IMAGE_PARTNAME_TEMPLATE % (len(self._images) + 1, picture.ext)
+            self._spool(partname, picture.blob)
+            embedded = self._images[picture.sha1] = _EmbeddedImage(
+                self._relate(PackURI(partname).relative_ref("/word")),
+                picture.filename,
+                picture.width,
+                picture.height,
+            )
+
+        cx, cy = embedded.scaled_dimensions(width, height)
+        self._last_shape_id += 1
+        inline = CT_Inline.new_pic_inline(
+            self._last_shape_id, embedded.rel_id, embedded.filename, cx, cy
+        )
+        run = self.add_paragraph().add_run()
+        run._r.add_drawing(inline)
+        return InlineShape(inline)
+
+    def attach_svg(self, picture: Any, svg_data: bytes) -> str:
+        """Add svg_data as the vector form of a picture added by add_picture"""
+        digest = hashlib.sha1(svg_data).hexdigest()
+        rel_id = self._svg_rels.get(digest)
+        if rel_id is None:
+            partname = SVG_PARTNAME_TEMPLATE % (len(self._svg_partnames) + 1)
+            self._svg_partnames.append(partname)
+            self._spool(partname, svg_data)
+            rel_id = self._svg_rels[digest] = self._relate(
+                PackURI(partname).relative_ref("/word")
+            )
+        add_svg_blip(picture, rel_id)
+        return rel_id
+
+    def _document_rels(self) -> str:
+        """Relationships of the document part: the template's plus the media"""
+        rels = CT_Relationships.new()
+        for rel in self._document_part.rels.values():
+            rels.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
+        for rel_id, target in self._rels:
+            rels.add_rel(rel_id, RT.IMAGE, target, False)
+        return rels.xml
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Finish the document and move it to path, given when it was opened"""
+        if Path(path) != self.path:
+            raise ValueError(f"Streaming output goes to {self.path}, not {path}")
+        self._flush()
+        self._write_body_content()
+        if self._sect_pr is not None:
+            self._xf.write(self._sect_pr)
+        self._stack.close()
+
+        for partname, spool_path in self._media:
+            with open(spool_path, "rb") as source, self._zip.open(
+                PackURI(partname).membername, "w", force_zip64=True
+            ) as target:
+                shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+            spool_path.unlink()
+        self._zip.writestr(
+            self._document_part.partname.rels_uri.membername, self._document_rels()
+        )
+        self._zip.close()
+        os.replace(self._partial, self.path)
+        self.closed = True
+
+    def discard(self) -> None:
+        """Abandon the output, removing the partly written file"""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._stack.close()
+        except Exception:
+            pass  # The stream is being thrown away
+        self._zip.close()
+        self._partial.unlink(missing_ok=True)
+        for _, spool_path in self._media:
+            spool_path.unlink(missing_ok=True)
@@ -0,0 +1,93 @@
+"""
+SVG diagram support for README to Word Converter
+
+Word 2016 and later can display SVG pictures. A picture keeps its raster
+image as the main ``a:blip`` and names the SVG part in an ``asvg:svgBlip``
+extension; older Word versions ignore the extension and show the raster
+fallback.
+
+Word does not draw ``foreignObject`` elements, which Mermaid uses for HTML
+labels in flowchart, state and class diagrams; such SVGs would show shapes
+without text, so they are not embedded.
+"""
+
+from typing import Any, Optional
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import Part
+from docx.oxml.ns import qn
+from lxml import etree
+
+SVG_CONTENT_TYPE = "image/svg+xml"
+SVG_PARTNAME_TEMPLATE = "/word/media/diagram%d.svg"
+SVG_BLIP_EXTENSION_URI = "{96DAC541-7B7A-43D3-8B79-37D633B846F1}"
+SVG_BLIP_NAMESPACE = "http://schemas.microsoft.com/office/drawing/2016/SVG/main"
+
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+
+
+def verify_svg(data: bytes) -> Optional[bytes]:
+    """Return data if it is a well-formed SVG document, else None"""
+    try:
+        root = etree.fromstring(data, _PARSER)
+    except etree.XMLSyntaxError:
+        return None
+    if etree.QName(root).localname != "svg":
+        return None
+    return data
+
+
+def has_html_labels(data: bytes) -> bool:
+    """True if the SVG holds ``foreignObject`` content that Word cannot draw"""
+    try:
+        root = etree.fromstring(data, _PARSER)
+    except etree.XMLSyntaxError:
+        return False
+    return bool(root.xpath("//*[local-name()='foreignObject']"))
+
+
+def _find_svg_rel(document_part: Any, svg_data: bytes) -> Optional[str]:
+    """Relationship id of an SVG part already holding svg_data, if any"""
+    for rel in document_part.rels.values():
+        if rel.is_external or rel.reltype != RT.IMAGE:
+            continue
+        part = rel.target_part
+        if part.content_type == SVG_CONTENT_TYPE and part.blob == svg_data:
+            return rel.rId
+    return None
+
+
+def add_svg_blip(picture: Any, rel_id: str) -> None:
+    """Name the SVG part related as rel_id as the vector form of a picture"""
+    blip = picture._inline.xpath(".//a:blip")[0]
+    ext_lst = blip.find(qn("a:extLst"))
+    if ext_lst is None:
+        ext_lst = etree.SubElement(blip, qn("a:extLst"))
+    ext = etree.SubElement(ext_lst, qn("a:ext"), uri=SVG_BLIP_EXTENSION_URI)
+    svg_blip = etree.SubElement(
+        ext, f"{{{SVG_BLIP_NAMESPACE}}}svgBlip", nsmap={"asvg": SVG_BLIP_NAMESPACE}
+    )
+    svg_blip.set(qn("r:embed"), rel_id)
+
+
+def attach_svg(doc: Any, picture: Any, svg_data: bytes) -> str:
+    """Add svg_data to the package as the vector form of an inline picture
+
+    ``picture`` is the InlineShape returned by ``add_picture``; its raster
+    image stays in place as the fallback. Identical SVGs share one part.
+    Returns the relationship id of the SVG part.
+    """
+    document_part = doc.part
+    rel_id = _find_svg_rel(document_part, svg_data)
+    if rel_id is None:
+        package = document_part.package
+        svg_part = Part(
+            package.next_partname(SVG_PARTNAME_TEMPLATE),
+            SVG_CONTENT_TYPE,
+            svg_data,
+            package,
+        )
+        rel_id = document_part.relate_to(svg_part, RT.IMAGE)
+
+    add_svg_blip(picture, rel_id)
+    return rel_id
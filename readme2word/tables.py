@@ -0,0 +1,157 @@
+"""
+Table construction for README to Word Converter
+
+python-docx's ``Table.cell(row, col)`` rebuilds the list of every cell in
+the table on each call, so filling a table cell by cell takes quadratic
+time. build_table() writes the rows in a single pass instead: one empty
+row is built the way python-docx would, then copied and filled for every
+row of the source table.
+
+Tables use one of two layouts:
+
+- ``autofit`` leaves column widths to Word, which measures every cell
+  when the document is opened.
+- ``fixed`` sizes the columns from their content during conversion, so
+  the document opens without measuring huge tables.
+"""
+
+import copy
+from typing import Any, List, Sequence, Tuple
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.table import Table
+
+from .body import as_body_builder
+from .oxml import append_run
+
+# A cell's text and whether it is a header cell
+TableCell = Tuple[str, bool]
+
+TABLE_LAYOUTS = ("autofit", "fixed")
+
+_W_P = qn("w:p")
+_W_W = qn("w:w")
+_W_TYPE = qn("w:type")
+
+# Estimated width of one character of body text (11pt Calibri), and the
+# default left plus right cell margins, in twips
+CHAR_WIDTH_TWIPS = 120
+CELL_PADDING_TWIPS = 216
+# Columns get room for at least this many characters
+MIN_COLUMN_CHARS = 4
+
+
+def _text_length(text: str) -> int:
+    """Characters on the longest line of a cell"""
+    return max(len(line) for line in text.split("\n"))
+
+
+def column_widths(rows: Sequence[Sequence[TableCell]], available: int) -> List[int]:
+    """Column widths in twips for a fixed-layout table
+
+    Each column wants room for its longest cell. When the columns do not
+    fit in ``available`` twips, columns narrower than an equal share keep
+    their width and the remaining space is split between the wider ones
+    in proportion to their content.
+    """
+    cols = max((len(row) for row in rows), default=0)
+    lengths = [0] * cols
+    for row in rows:
+        for j, (text, _) in enumerate(row):
+            lengths[j] = max(lengths[j], _text_length(text))
+    natural = [
+        CELL_PADDING_TWIPS + CHAR_WIDTH_TWIPS * max(length, MIN_COLUMN_CHARS)
+        for length in lengths
+    ]
+    if sum(natural) <= available:
+        return natural
+
+    widths = list(natural)
+    remaining = available
+    wide = list(range(cols))
+    while wide:
+        share = remaining / len(wide)
+        narrow = [j for j in wide if natural[j] <= share]
+        if not narrow:
+            break
+        for j in narrow:
+            remaining -= natural[j]
+        wide = [j for j in wide if natural[j] > share]
+
+    total = sum(natural[j] for j in wide)
+    for j in wide:
+        widths[j] = remaining * natural[j] // total
+    return widths
+
+
+def _fix_layout(table: Table, widths: Sequence[int]) -> None:
+    """Give a table a fixed layout with the given column widths"""
+    tbl = table._tbl
+    table.autofit = False
+    tbl_w = tbl.tblPr.find(qn("w:tblW"))
+    tbl_w.set(_W_TYPE, "dxa")
+    tbl_w.set(_W_W, str(sum(widths)))
+    for col, width in zip(tbl.tblGrid.iterchildren(qn("w:gridCol")), widths):
+        col.set(_W_W, str(width))
+
+
+def _bold_properties() -> Any:
+    """A ``w:rPr`` that makes a run bold"""
+    properties = OxmlElement("w:rPr")
+    properties.append(OxmlElement("w:b"))
+    return properties
+
+
+def _empty_row(grid_widths: Sequence[str]) -> Any:
+    """A ``w:tr`` with one empty cell per grid column"""
+    tr = OxmlElement("w:tr")
+    for width in grid_widths:
+        tc = OxmlElement("w:tc")
+        tc_pr = OxmlElement("w:tcPr")
+        tc_w = OxmlElement("w:tcW")
+        tc_w.set(qn("w:type"), "dxa")
+        tc_w.set(_W_W, width)
+        tc_pr.append(tc_w)
+        tc.append(tc_pr)
+        tc.append(OxmlElement("w:p"))
+        tr.append(tc)
+    return tr
+
+
+def build_table(
+    doc: Any,
+    rows: Sequence[Sequence[TableCell]],
+    style: str = "Table Grid",
+    layout: str = "autofit",
+) -> Table:
+    """Add a table holding rows to doc in time linear in its size
+
+    doc is a Document or a BodyBuilder.
+
+    With the autofit layout the result is identical to creating the table
+    with ``doc.add_table``, setting each ``cell(i, j).text`` and bolding
+    the runs of header cells. Rows shorter than the widest row are padded
+    with empty cells.
+    """
+    if layout not in TABLE_LAYOUTS:
+        raise ValueError(
+            f"Unknown table layout '{layout}'. Choose from: {', '.join(TABLE_LAYOUTS)}"
+        )
+    body = as_body_builder(doc)
+    cols = max((len(row) for row in rows), default=0)
+    table = body.add_table(rows=0, cols=cols, style=style)
+    if layout == "fixed" and cols:
+        _fix_layout(table, column_widths(rows, body.block_width.twips))
+
+    tbl = table._tbl
+    grid_widths = [col.get(_W_W) for col in tbl.tblGrid.iterchildren(qn("w:gridCol"))]
+    template = _empty_row(grid_widths)
+    bold = _bold_properties()
+
+    for row in rows:
+        tr = copy.deepcopy(template)
+        tbl.append(tr)
+        for tc, (text, header) in zip(tr, row):
+            append_run(tc.find(_W_P), text, bold if header else None)
+    return table
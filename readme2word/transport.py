@@ -0,0 +1,184 @@
+"""
+HTTP transport for diagram rendering
+
+This module provides a reusable, keep-alive HTTP transport for fetching
+rendered diagrams. It owns a pooled ``requests.Session`` and retries
+transient failures (connect timeouts, connection resets, 429 and 5xx
+responses) with exponential backoff and full jitter.
+
+Read timeouts are not retried by default: a renderer that is slow to
+answer is usually slow for every attempt, and retrying would multiply the
+time one diagram can hold up a conversion.
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 15.0
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 8.0
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+USER_AGENT = "README-to-Word-Converter/1.0"
+
+
+class DiagramTransport:
+    """Pooled HTTP client with retry, backoff and split timeouts"""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        retry_statuses: Tuple[int, ...] = RETRYABLE_STATUS_CODES,
+        retry_read_timeouts: bool = False,
+    ):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_read_timeouts = retry_read_timeouts
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        # Retries are handled in get() so they can be counted and jittered
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.retries = 0
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """The (connect, read) timeout pair passed to requests"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before retry number ``attempt`` (0-based), with full jitter"""
+        if retry_after:
+            try:
+                return min(self.max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date values fall back to exponential backoff
+        ceiling = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
+    ) -> requests.Response:
+        """GET ``url``, retrying transient failures.
+
+        The final response is returned even if its status is retryable, so
+        callers can report it; the last network exception is re-raised once
+        retries are exhausted. Read timeouts are raised at once unless
+        ``retry_read_timeouts`` is set.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        retryable: Tuple[type, ...] = (requests.exceptions.ConnectionError,)
+        if self.retry_read_timeouts:
+            retryable += (requests.exceptions.Timeout,)
+
+        attempt = 0
+        while True:
+            with self._lock:
+                self.requests_sent += 1
+            try:
+                response = self.session.get(url, headers=headers, **kwargs)
+            except retryable:
+                if attempt >= self.max_retries:
+                    raise
+                self._wait_before_retry(attempt)
+                attempt += 1
+                continue
+
+            if response.status_code in self.retry_statuses and (
+                attempt < self.max_retries
+            ):
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+                self._wait_before_retry(attempt, retry_after)
+                attempt += 1
+                continue
+
+            return response
+
+    def _wait_before_retry(self, attempt: int, retry_after: Optional[str] = None):
+        """Sleep for the backoff delay and count the retry"""
+        with self._lock:
+            self.retries += 1
+        time.sleep(self.backoff_delay(attempt, retry_after))
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+    def __enter__(self) -> "DiagramTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get request and retry counters"""
+        with self._lock:
+            return {
+                "requests": self.requests_sent,
+                "retries": self.retries,
+                "pool_size": self.pool_size,
+            }
+
+
+_default_transport: Optional[DiagramTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> DiagramTransport:
+    """Get the process-wide transport shared by all converters.
+
+    Settings can be overridden with the ``README2WORD_HTTP_POOL_SIZE``,
+    ``README2WORD_HTTP_RETRIES``, ``README2WORD_CONNECT_TIMEOUT``,
+    ``README2WORD_READ_TIMEOUT`` and ``README2WORD_RETRY_READ_TIMEOUTS``
+    environment variables.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = DiagramTransport(
+                pool_size=int(
+                    os.environ.get("README2WORD_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)
+                ),
+                max_retries=int(
+                    os.environ.get("README2WORD_HTTP_RETRIES", DEFAULT_MAX_RETRIES)
+                ),
+                connect_timeout=float(
+                    os.environ.get(
+                        "README2WORD_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT
+                    )
+                ),
+                read_timeout=float(
+                    os.environ.get("README2WORD_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)
+                ),
+                retry_read_timeouts=os.environ.get(
+                    "README2WORD_RETRY_READ_TIMEOUTS", ""
+                ).lower()
+                in ("1", "true", "yes"),
+            )
+        return _default_transport
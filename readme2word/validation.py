@@ -0,0 +1,171 @@
+"""
+Local pre-flight validation of Mermaid source
+
+Catches diagrams that are certain to fail before they cost a round trip to
+the renderer: an empty body, an unknown diagram type keyword, or (for
+flowcharts) unbalanced brackets. The checks are deliberately conservative;
+anything they are unsure about is passed on to the renderer unchanged.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# First keyword of every diagram type Mermaid understands
+DIAGRAM_TYPES = frozenset(
+    {
+        "graph",
+        "flowchart",
+        "flowchart-elk",
+        "sequenceDiagram",
+        "classDiagram",
+        "classDiagram-v2",
+        "stateDiagram",
+        "stateDiagram-v2",
+        "erDiagram",
+        "journey",
+        "gantt",
+        "pie",
+        "quadrantChart",
+        "requirementDiagram",
+        "gitGraph",
+        "info",
+        "mindmap",
+        "timeline",
+        "zenuml",
+        "C4Context",
+        "C4Container",
+        "C4Component",
+        "C4Dynamic",
+        "C4Deployment",
+        "sankey-beta",
+        "xychart-beta",
+        "block-beta",
+        "packet-beta",
+        "kanban",
+        "architecture-beta",
+        "radar-beta",
+        "treemap-beta",
+    }
+)
+
+# Diagram types whose syntax keeps brackets balanced outside quoted text
+# and edge labels
+BRACKET_CHECKED_TYPES = frozenset({"graph", "flowchart", "flowchart-elk"})
+
+_CLOSING = {")": "(", "]": "[", "}": "{"}
+
+# What may precede a node id at the start of a node definition: the start
+# of a statement, "&", the end of an edge label or a complete link
+_NODE_START = re.compile(r"(?:^|[;&|]|[-=.]>|---|===|-\.-|[-=][xo])\s*$")
+
+# Edge text written inline rather than between pipes: "-- text -->",
+# "== text ==>" and "-. text .->"
+_EDGE_TEXT = re.compile(
+    r"(?:--|==|-\.)(?![-=.>]|[xo]\s).*?(?:-{2,}[>xo]?|={2,}[>xo]?|\.-+[>xo]?)"
+)
+
+
+def _opens_asymmetric_shape(text: str, index: int) -> bool:
+    """True if the ``>`` at index starts an asymmetric node (``id>text]``)"""
+    start = index
+    while start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+        start -= 1
+    # Anywhere else (e.g. "A -- score>80 --> B") it is ordinary text
+    return start < index and _NODE_START.search(text[:start]) is not None
+
+
+class ValidationIssue:
+    """Why a diagram was rejected before rendering"""
+
+    def __init__(self, reason: str, message: str):
+        self.reason = reason
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"ValidationIssue({self.reason!r}, {self.message!r})"
+
+
+def _significant_lines(source: str) -> List[Tuple[int, str]]:
+    """Return (line number, text) pairs without front matter, comments and blanks"""
+    lines = source.replace("\r\n", "\n").split("\n")
+    start = 0
+    if lines and lines[0].strip() == "---":
+        for index in range(1, len(lines)):
+            if lines[index].strip() == "---":
+                start = index + 1
+                break
+
+    result = []
+    for number, line in enumerate(lines[start:], start=start + 1):
+        text = line.strip()
+        if text and not text.startswith("%%"):
+            result.append((number, text))
+    return result
+
+
+def _check_brackets(lines: List[Tuple[int, str]]) -> Optional[str]:
+    """Return a description of the first bracket mismatch, if any
+
+    Quoted text and edge labels (``-->|label|`` and ``-- label -->``) are
+    skipped.
+    """
+    stack: List[Tuple[str, int]] = []
+    for number, text in lines:
+        in_quotes = False
+        in_label = False
+        label_end = 0
+        for index, char in enumerate(text):
+            if index < label_end:
+                pass
+            elif char == '"':
+                in_quotes = not in_quotes
+            elif in_quotes:
+                pass
+            elif char in "-=" and not in_label and not stack:
+                edge = _EDGE_TEXT.match(text, index)
+                if edge:
+                    label_end = edge.end()
+            elif char == "|" and (in_label or not stack):
+                in_label = not in_label
+            elif in_label:
+                pass
+            elif char in "([{":
+                stack.append((char, number))
+            elif char == ">" and not stack and _opens_asymmetric_shape(text, index):
+                stack.append(("[", number))
+            elif char in _CLOSING:
+                if not stack or stack[-1][0] != _CLOSING[char]:
+                    return f"unexpected '{char}' on line {number}"
+                stack.pop()
+    if stack:
+        char, number = stack[-1]
+        return f"unclosed '{char}' from line {number}"
+    return None
+
+
+def validate_mermaid(source: str) -> Optional[ValidationIssue]:
+    """Check Mermaid source for errors the renderer would certainly reject
+
+    Returns None for diagrams that should be sent to the renderer.
+    """
+    lines = _significant_lines(source)
+    if not lines:
+        return ValidationIssue("empty_diagram", "Diagram body is empty")
+
+    keyword = lines[0][1].split()[0].rstrip(";:")
+    if keyword not in DIAGRAM_TYPES:
+        return ValidationIssue(
+            "unknown_diagram_type", f"Unknown diagram type '{keyword}'"
+        )
+
+    if keyword in BRACKET_CHECKED_TYPES:
+        problem = _check_brackets(lines)
+        if problem:
+            return ValidationIssue(
+                "unbalanced_brackets", f"Unbalanced brackets: {problem}"
+            )
+
+    return None
@@ -3,12 +3,30 @@
 Web interface launcher for README to Word Converter
 
 This module provides a simple way to launch the Streamlit web interface.
+The shared conversion resources are warmed up before the server starts, so
+the health endpoint only answers once conversions are fast and the first
+user does not pay for the warmup.
 """
 
 import sys
 from pathlib import Path
 
 
+def warm_up() -> float:
+    """Warm the process-wide Markdown parser and document template
+
+    Streamlit runs app.py in this process, on a new thread for every run;
+    the parser is pooled rather than tied to a thread, so every session
+    reuses them.
+    Returns the seconds spent.
+    """
+    from .converter import ReadmeToWordConverter
+
+    converter = ReadmeToWordConverter()
+    converter.set_debug_mode(False)
+    return converter.warmup()
+
+
 def main() -> None:
     """Launch the Streamlit web interface."""
     try:
@@ -28,7 +46,8 @@ def main() -> None:
                 )
                 sys.exit(1)
 
-        # Set up Streamlit arguments
+        # Set up Streamlit arguments; extra ones (e.g. --server.address)
+        # are passed through
         sys.argv = [
             "streamlit",
             "run",
@@ -36,8 +55,12 @@ def main() -> None:
             "--server.headless=true",
             "--browser.gatherUsageStats=false",
             "--server.port=8501",
+            *sys.argv[1:],
         ]
 
+        # Warm up before the server (and its health check) comes up
+        print(f"🔥 Converter warmed up in {warm_up():.3f}s")
+
         # Launch Streamlit
         stcli.main()
 
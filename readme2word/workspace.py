@@ -0,0 +1,86 @@
+"""
+Per-conversion workspace for README to Word Converter
+
+Each call to ``ReadmeToWordConverter.convert()`` gets its own workspace: a
+uniquely named in-memory store for rendered diagram images plus a lazily
+created scratch directory. Everything is released when the conversion ends,
+so many conversions can run side by side in one process without sharing
+file names or image sources.
+"""
+
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+# Image sources for rendered diagrams held in memory rather than on disk
+DIAGRAM_IMAGE_SCHEME = "mermaid-diagram:"
+
+
+class ConversionWorkspace:
+    """Isolated scratch namespace for a single conversion"""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self._images: Dict[str, bytes] = {}
+        self._vectors: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._scratch_dir: Optional[Path] = None
+        self.closed = False
+
+    def image_src(self, diagram_number: int) -> str:
+        """Image source for a diagram, unique to this workspace"""
+        return f"{DIAGRAM_IMAGE_SCHEME}{self.id}/{diagram_number}"
+
+    def add_image(
+        self,
+        diagram_number: int,
+        image_data: bytes,
+        svg_data: Optional[bytes] = None,
+    ) -> str:
+        """Store rendered image bytes (and an optional SVG form) and return
+        the source that refers to them"""
+        src = self.image_src(diagram_number)
+        with self._lock:
+            self._images[src] = image_data
+            if svg_data is not None:
+                self._vectors[src] = svg_data
+        return src
+
+    def get_image(self, src: str) -> Optional[bytes]:
+        """Return the image bytes stored under src, if any"""
+        with self._lock:
+            return self._images.get(src)
+
+    def get_svg(self, src: str) -> Optional[bytes]:
+        """Return the SVG form of the image stored under src, if any"""
+        with self._lock:
+            return self._vectors.get(src)
+
+    @property
+    def scratch_dir(self) -> Path:
+        """Private temporary directory, created on first use"""
+        with self._lock:
+            if self._scratch_dir is None:
+                self._scratch_dir = Path(
+                    tempfile.mkdtemp(prefix=f"readme2word-{self.id[:8]}-")
+                )
+            return self._scratch_dir
+
+    def close(self) -> None:
+        """Drop stored images and remove the scratch directory"""
+        with self._lock:
+            self._images.clear()
+            self._vectors.clear()
+            scratch_dir, self._scratch_dir = self._scratch_dir, None
+            self.closed = True
+        if scratch_dir is not None:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    def __enter__(self) -> "ConversionWorkspace":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
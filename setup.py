@@ -86,6 +86,12 @@ setup(
             "kubernetes>=25.0.0",
             "pyyaml>=6.0",
         ],
+        "images": [
+            "numpy>=1.21.0",
+        ],
+        "highlight": [
+            "Pygments>=2.12.0",
+        ],
     },
     entry_points={
         "console_scripts": [
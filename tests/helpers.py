@@ -0,0 +1,87 @@
+"""
+Shared helpers for README to Word Converter tests
+
+Provides fake diagram responses, a transport that never touches the
+network, and a base test case that converts in a scratch directory.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Callable, Optional
+from unittest.mock import MagicMock
+
+from PIL import Image
+
+from readme2word.cache import DiagramCache, NegativeCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.singleflight import SingleFlight
+
+
+def make_png_bytes(size=(40, 20), color=(255, 255, 255)) -> bytes:
+    """Create a small PNG image in memory"""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_image_response(data: bytes) -> MagicMock:
+    """Create a fake successful mermaid.ink response"""
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"content-type": "image/png"}
+    response.content = data
+    response.iter_content.side_effect = lambda chunk_size=1: iter([data])
+    return response
+
+
+class FakeTransport:
+    """Stand-in for DiagramTransport that never touches the network"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append(url)
+        return self.handler(url)
+
+
+def make_converter(transport: FakeTransport, **kwargs) -> ReadmeToWordConverter:
+    """Create a quiet converter with private shared state and a fake transport"""
+    options = {
+        "diagram_cache": DiagramCache(),
+        "singleflight": SingleFlight(),
+        "negative_cache": NegativeCache(),
+    }
+    options.update(kwargs)
+    converter = ReadmeToWordConverter(transport=transport, **options)
+    converter.set_debug_mode(False)
+    return converter
+
+
+class ConverterTestCase(unittest.TestCase):
+    """Base for converter tests that run in a scratch working directory"""
+
+    transport: Optional[FakeTransport] = None
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_converter(
+        self, handler: Optional[Callable] = None, **kwargs
+    ) -> ReadmeToWordConverter:
+        """Create a converter, replacing the fake transport if handler is given"""
+        if handler is not None:
+            self.transport = FakeTransport(handler)
+        return make_converter(self.transport, **kwargs)
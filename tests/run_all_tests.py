@@ -16,10 +16,26 @@ import time
 import unittest
 from pathlib import Path
 
+from tests.test_body import run_body_tests
+from tests.test_bundle import run_bundle_tests
+from tests.test_cache import run_cache_tests
 from tests.test_converter import run_converter_tests
+from tests.test_diagram_pipeline import run_diagram_pipeline_tests
+from tests.test_disk_cache import run_disk_cache_tests
+from tests.test_highlight import run_highlight_tests
 from tests.test_integration import run_integration_tests
+from tests.test_mdtree import run_mdtree_tests
 from tests.test_mermaid import run_mermaid_tests
+from tests.test_parsers import run_parser_tests
+from tests.test_postprocess import run_postprocess_tests
+from tests.test_renderers import run_renderer_tests
+from tests.test_resources import run_resources_tests
+from tests.test_streaming import run_streaming_tests
+from tests.test_svg import run_svg_tests
+from tests.test_tables import run_table_tests
+from tests.test_transport import run_transport_tests
 from tests.test_ui import run_ui_tests
+from tests.test_validation import run_validation_tests
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -84,6 +100,22 @@ class TestRunner:
         test_suites = [
             ("Mermaid Diagram Tests", run_mermaid_tests),
             ("Converter Unit Tests", run_converter_tests),
+            ("Diagram Cache Tests", run_cache_tests),
+            ("Disk Cache Tests", run_disk_cache_tests),
+            ("Diagram Pipeline Tests", run_diagram_pipeline_tests),
+            ("Diagram Bundle Tests", run_bundle_tests),
+            ("Transport Tests", run_transport_tests),
+            ("Renderer Tests", run_renderer_tests),
+            ("SVG Diagram Tests", run_svg_tests),
+            ("Post-processing Tests", run_postprocess_tests),
+            ("Markdown Tree Engine Tests", run_mdtree_tests),
+            ("HTML Parser Tests", run_parser_tests),
+            ("Conversion Resources Tests", run_resources_tests),
+            ("Code Highlighting Tests", run_highlight_tests),
+            ("Table Construction Tests", run_table_tests),
+            ("Body Builder Tests", run_body_tests),
+            ("Streaming Output Tests", run_streaming_tests),
+            ("Validation Tests", run_validation_tests),
             ("UI Component Tests", run_ui_tests),
             ("Integration Tests", run_integration_tests),
         ]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test suite for the append-only body builder
+
+Tests cover:
+- XML identical to python-docx's Document add_* methods
+- Ordering with content added directly to the document
+- Bodies without final section properties
+- Style names resolved once per document
+"""
+
+import io
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from docx import Document
+from docx.shared import Inches
+
+from readme2word.body import BodyBuilder, as_body_builder
+from tests.helpers import make_png_bytes
+
+# Add parent directory to path to import body
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def add_content(target):
+    """Add one of each kind of block through Document-style methods"""
+    target.add_heading("Title", 0)
+    target.add_heading("Section", 2)
+    target.add_paragraph("Plain\ttext with  spaces\nand a break ")
+    target.add_paragraph("Quoted", "Quote")
+    target.add_paragraph()
+    target.add_page_break()
+    target.add_table(rows=2, cols=3, style="Table Grid")
+    target.add_picture(io.BytesIO(make_png_bytes()), width=Inches(2))
+
+
+class TestBodyBuilder(unittest.TestCase):
+    """Test cases for BodyBuilder"""
+
+    def test_matches_document_methods(self):
+        """Test that the body XML equals the python-docx result"""
+        expected = Document()
+        add_content(expected)
+        doc = Document()
+        add_content(BodyBuilder(doc))
+        self.assertEqual(doc.element.body.xml, expected.element.body.xml)
+
+    def test_interleaved_with_document(self):
+        """Test that builder and document appends keep their order"""
+        doc = Document()
+        body = BodyBuilder(doc)
+        body.add_paragraph("one")
+        doc.add_paragraph("two")
+        body.add_paragraph("three")
+
+        self.assertEqual([p.text for p in doc.paragraphs], ["one", "two", "three"])
+        self.assertEqual(doc.element.body[-1].tag, doc.element.body.sectPr.tag)
+
+    def test_body_without_section_properties(self):
+        """Test appending when the body has no final w:sectPr"""
+        doc = Document()
+        doc.element.body.remove(doc.element.body.sectPr)
+        body = BodyBuilder(doc)
+        body.add_paragraph("first")
+        body.add_paragraph("second")
+        self.assertEqual([p.text for p in doc.paragraphs], ["first", "second"])
+
+    def test_style_names_resolved_once(self):
+        """Test that each style name is looked up once per builder"""
+        doc = Document()
+        body = BodyBuilder(doc)
+        with patch.object(
+            type(doc.part), "get_style_id", wraps=doc.part.get_style_id
+        ) as lookup:
+            for _ in range(5):
+                body.add_heading("Section", 2)
+                body.add_paragraph("Quoted", "Quote")
+        self.assertEqual(lookup.call_count, 2)
+        self.assertEqual(doc.paragraphs[0].style.name, "Heading 2")
+
+        with self.assertRaises(KeyError):
+            body.add_paragraph("x", "No Such Style")
+
+    def test_as_body_builder(self):
+        """Test that existing builders are reused"""
+        doc = Document()
+        body = as_body_builder(doc)
+        self.assertIsInstance(body, BodyBuilder)
+        self.assertIs(as_body_builder(body), body)
+
+
+def run_body_tests():
+    """Run all body builder tests"""
+    print("🧪 Running Body Builder Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestBodyBuilder))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All body builder tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_body_tests()
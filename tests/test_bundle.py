@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test suite for diagram bundles and offline conversion
+
+Tests cover:
+- Saving and loading bundles
+- Prerendering unique diagrams from a tree of markdown files
+- Rendering single diagrams under the keys convert() looks up
+- Offline conversion using bundled images without network access
+- The prerender command line entry point
+"""
+
+import sys
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from readme2word.bundle import DiagramBundle
+from readme2word.cli import main
+from readme2word.prerender import prerender_diagrams
+from tests.helpers import ConverterTestCase, make_image_response, make_png_bytes
+
+# Add parent directory to path to import bundle
+sys.path.append(str(Path(__file__).parent.parent))
+
+DIAGRAM = "graph TD\n    A --> B"
+
+
+def fail_on_request(url):
+    raise AssertionError(f"Unexpected network request: {url}")
+
+
+class TestDiagramBundle(ConverterTestCase):
+    """Test cases for prerendering and offline conversion"""
+
+    def write_docs(self) -> Path:
+        """Create a small tree of markdown files sharing one diagram"""
+        docs = Path("docs")
+        (docs / "guide").mkdir(parents=True)
+        block = f"```mermaid\n{DIAGRAM}\n```\n"
+        (docs / "README.md").write_text(f"# Readme\n\n{block}")
+        (docs / "guide" / "setup.markdown").write_text(
+            f"# Setup\n\n{block}\n```mermaid\ngraph LR\n    X --> Y\n```\n"
+        )
+        (docs / "notes.txt").write_text(block)
+        return docs
+
+    def test_save_and_load_round_trip(self):
+        """Test that a saved bundle loads with the same images"""
+        bundle = DiagramBundle()
+        bundle.add("abc", b"png-bytes", "dark")
+        path = bundle.save("out/diagrams.zip")
+
+        loaded = DiagramBundle.load(path)
+        self.assertEqual(loaded.get("abc"), b"png-bytes")
+        self.assertEqual(len(loaded), 1)
+
+    def test_invalid_bundle_is_rejected(self):
+        """Test that files that are not bundles raise ValueError"""
+        Path("bogus.zip").write_text("not a zip")
+        with self.assertRaises(ValueError):
+            DiagramBundle.load("bogus.zip")
+
+        with zipfile.ZipFile("old.zip", "w") as archive:
+            archive.writestr("manifest.json", '{"version": 99, "diagrams": {}}')
+        with self.assertRaises(ValueError):
+            DiagramBundle.load("old.zip")
+
+    def test_prerender_renders_unique_diagrams(self):
+        """Test that each unique diagram in the tree is rendered once"""
+        docs = self.write_docs()
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+
+        stats = prerender_diagrams(docs, "diagrams.zip", converter=converter)
+
+        self.assertEqual(stats["files"], 2)
+        self.assertEqual(stats["diagrams"], 2)
+        self.assertEqual(stats["rendered"], 2)
+        self.assertEqual(len(self.transport.calls), 2)
+        bundle = DiagramBundle.load("diagrams.zip")
+        self.assertIn(converter._diagram_key(DIAGRAM, "default"), bundle)
+
+    def test_prerender_reports_cache_hits(self):
+        """Test that a second prerender run is served from the diagram cache"""
+        docs = self.write_docs()
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+
+        prerender_diagrams(docs, "first.zip", converter=converter)
+        stats = prerender_diagrams(docs, "second.zip", converter=converter)
+
+        self.assertEqual(stats["cache_hits"], 2)
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_rendered_keys_match_offline_conversion(self):
+        """Test that render_diagram() keys are the ones convert() looks up"""
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        key, image_data = converter.render_diagram(f"\n{DIAGRAM}\n")
+        bundle = DiagramBundle()
+        bundle.add(key, image_data)
+        bundle.save("diagrams.zip")
+
+        offline = self.make_converter(fail_on_request)
+        offline.convert(
+            f"# Doc\n\n```mermaid\n{DIAGRAM}\n```\n",
+            "offline",
+            include_toc=False,
+            diagram_bundle="diagrams.zip",
+            offline=True,
+        )
+
+        self.assertEqual(offline.get_conversion_stats()["bundle_hits"], 1)
+
+    def test_offline_conversion_uses_bundle(self):
+        """Test that offline conversion embeds bundled images without network"""
+        converter = self.make_converter(fail_on_request)
+        bundle = DiagramBundle()
+        bundle.add(converter._diagram_key(DIAGRAM, "default"), make_png_bytes())
+        bundle.save("diagrams.zip")
+        content = (
+            f"# Doc\n\n```mermaid\n{DIAGRAM}\n```\n\n```mermaid\ngraph LR\n    Q\n```\n"
+        )
+
+        converter.convert(
+            content,
+            "offline",
+            include_toc=False,
+            diagram_bundle="diagrams.zip",
+            offline=True,
+        )
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(self.transport.calls, [])
+        self.assertEqual(stats["bundle_hits"], 1)
+        self.assertEqual(stats["offline_misses"], 1)
+        self.assertEqual(stats["images"], 1)
+        self.assertEqual(stats["code_blocks"], 1)
+
+    def test_prerender_command(self):
+        """Test the prerender subcommand writes a bundle"""
+        docs = self.write_docs()
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+
+        with patch.object(
+            sys, "argv", ["readme2word", "prerender", str(docs), "-o", "out.zip"]
+        ), patch("readme2word.cli.ReadmeToWordConverter", return_value=converter):
+            main()
+
+        self.assertEqual(len(DiagramBundle.load("out.zip")), 2)
+
+
+def run_bundle_tests():
+    """Run all diagram bundle tests"""
+    print("🧪 Running Diagram Bundle Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestDiagramBundle))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All diagram bundle tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_bundle_tests()
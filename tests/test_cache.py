@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Test suite for the diagram cache
+
+Tests cover:
+- Cache key normalization
+- LRU eviction by entry count and byte size
+- Hit/miss/eviction counters
+- Negative caching of failed renders
+- Converter integration without network access
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from readme2word.cache import DiagramCache, NegativeCache, diagram_cache_key
+from readme2word.converter import ReadmeToWordConverter
+from tests.helpers import FakeTransport, make_image_response, make_png_bytes
+
+# Add parent directory to path to import converter
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class TestDiagramCache(unittest.TestCase):
+    """Test cases for DiagramCache"""
+
+    def test_key_normalizes_whitespace(self):
+        """Test that cosmetic whitespace does not change the key"""
+        key_a = diagram_cache_key("graph TD\n    A --> B\n", "default")
+        key_b = diagram_cache_key("\r\ngraph TD   \r\n    A --> B", "default")
+        self.assertEqual(key_a, key_b)
+
+    def test_key_depends_on_theme(self):
+        """Test that the theme is part of the key"""
+        self.assertNotEqual(
+            diagram_cache_key("graph TD; A-->B", "default"),
+            diagram_cache_key("graph TD; A-->B", "dark"),
+        )
+
+    def test_key_depends_on_render_options(self):
+        """Test that render options change the key and None options do not"""
+        plain = diagram_cache_key("graph TD; A-->B")
+        self.assertEqual(plain, diagram_cache_key("graph TD; A-->B", width=None))
+        self.assertNotEqual(plain, diagram_cache_key("graph TD; A-->B", width=900))
+
+    def test_hit_and_miss_counters(self):
+        """Test hit and miss accounting"""
+        cache = DiagramCache()
+        self.assertIsNone(cache.get("missing"))
+        cache.put("key", b"data")
+        self.assertEqual(cache.get("key"), b"data")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["bytes"], 4)
+
+    def test_entry_limit_evicts_least_recently_used(self):
+        """Test LRU eviction when the entry limit is reached"""
+        cache = DiagramCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", b"3")
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_byte_limit_evicts_entries(self):
+        """Test eviction when the byte limit is exceeded"""
+        cache = DiagramCache(max_entries=10, max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.put("c", b"12345")
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertLessEqual(cache.get_stats()["bytes"], 10)
+
+    def test_oversized_entry_is_not_stored(self):
+        """Test that an entry larger than the byte limit is skipped"""
+        cache = DiagramCache(max_bytes=4)
+        cache.put("big", b"12345")
+        self.assertEqual(len(cache), 0)
+
+
+class TestNegativeCache(unittest.TestCase):
+    """Test cases for the failed render cache"""
+
+    def setUp(self):
+        """Use a controllable clock"""
+        self.now = 0.0
+        self.cache = NegativeCache(ttl=60, transient_ttl=5, clock=lambda: self.now)
+
+    def test_failure_is_remembered_until_ttl(self):
+        """Test that a failure is reported until its TTL expires"""
+        self.cache.put("key", "http_400")
+        self.now = 59
+        self.assertEqual(self.cache.get("key"), "http_400")
+        self.now = 60
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_transient_failures_expire_sooner(self):
+        """Test that transient failures use the shorter TTL"""
+        self.cache.put("key", "timeout", transient=True)
+        self.now = 4
+        self.assertEqual(self.cache.get("key"), "timeout")
+        self.now = 5
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of zero stores nothing"""
+        cache = NegativeCache(ttl=0)
+        cache.put("key", "http_400")
+        self.assertIsNone(cache.get("key"))
+
+    def test_entry_limit(self):
+        """Test that the oldest failures are dropped past the entry limit"""
+        cache = NegativeCache(max_entries=2, clock=lambda: self.now)
+        for key in ("a", "b", "c"):
+            cache.put(key, "http_400")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), "http_400")
+
+
+class TestConverterDiagramCache(unittest.TestCase):
+    """Test converter integration with the diagram cache"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_shared_between_converters(self):
+        """Test that a second converter reuses the first converter's render"""
+        transport = FakeTransport(lambda url: make_image_response(make_png_bytes()))
+        cache = DiagramCache()
+        content = "# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n"
+
+        first = ReadmeToWordConverter(
+            diagram_cache=cache, transport=transport, negative_cache=NegativeCache()
+        )
+        first.set_debug_mode(False)
+        first.convert(content, "first", include_toc=False)
+
+        second = ReadmeToWordConverter(
+            diagram_cache=cache, transport=transport, negative_cache=NegativeCache()
+        )
+        second.set_debug_mode(False)
+        second.convert(content, "second", include_toc=False)
+
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(second.get_conversion_stats()["diagram_cache_hits"], 1)
+        self.assertEqual(second.get_conversion_stats()["images"], 1)
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_failed_render_is_not_retried(self):
+        """Test that a recently failed diagram skips the renderer"""
+
+        def handler(url):
+            response = make_image_response(b"")
+            response.status_code = 400
+            return response
+
+        transport = FakeTransport(handler)
+        negative_cache = NegativeCache()
+        content = "# Doc\n\n```mermaid\ngraph TD\n    A -->\n```\n"
+
+        for name in ("first", "second"):
+            converter = ReadmeToWordConverter(
+                diagram_cache=DiagramCache(),
+                transport=transport,
+                negative_cache=negative_cache,
+            )
+            converter.set_debug_mode(False)
+            converter.convert(content, name, include_toc=False)
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(stats["negative_cache_hits"], 1)
+        self.assertEqual(stats["code_blocks"], 1)
+
+
+def run_cache_tests():
+    """Run all diagram cache tests"""
+    print("🧪 Running Diagram Cache Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestDiagramCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestNegativeCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterDiagramCache))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All diagram cache tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_cache_tests()
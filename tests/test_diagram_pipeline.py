@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Diagram pipeline test suite
+
+Tests cover the Mermaid rendering pipeline without network access:
+- Concurrent rendering and document-order splicing
+- Fallback to code blocks when rendering fails
+- Embedding rendered images without touching the disk
+- Isolated workspaces for concurrent conversions
+- Deduplication of identical diagrams within a document
+- Coalescing of concurrent renders across conversions
+- Whole-document diagram time budget
+- Fetching diagrams at the target resolution
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+from readme2word.cache import DiagramCache, NegativeCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.singleflight import SingleFlight
+from readme2word.workspace import ConversionWorkspace
+from tests.helpers import (
+    ConverterTestCase,
+    FakeTransport,
+    make_image_response,
+    make_png_bytes,
+)
+
+# Add parent directory to path to import converter
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def make_diagram_document(count: int) -> str:
+    """Build a markdown document with ``count`` distinct diagrams"""
+    sections = ["# Diagram Document\n"]
+    for index in range(count):
+        sections.append(
+            f"## Section {index}\n\n```mermaid\ngraph TD\n    A{index} --> B{index}\n```\n"
+        )
+    return "\n".join(sections)
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    """Poll until condition() is true or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestDiagramPipeline(ConverterTestCase):
+    """Test cases for the Mermaid rendering pipeline"""
+
+    def test_concurrent_rendering_keeps_document_order(self):
+        """Test that concurrent renders are spliced back in order"""
+        # Every worker must be in flight at once for the barrier to release
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handler(url):
+            barrier.wait()
+            return make_image_response(make_png_bytes())
+
+        self.converter = self.make_converter(handler)
+        result = self.converter._process_mermaid_diagrams(
+            make_diagram_document(3), max_workers=3
+        )
+
+        positions = [result.index(f"Mermaid Diagram {n}]") for n in (1, 2, 3)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertLess(result.index("Section 0"), positions[0])
+        self.assertLess(positions[0], result.index("Section 1"))
+        self.assertEqual(self.converter.stats["mermaid_diagrams"], 3)
+
+    def test_failed_render_falls_back_to_code_block(self):
+        """Test that a failing render becomes a plain code block"""
+        responses = iter(
+            [
+                make_image_response(make_png_bytes()),
+                make_image_response(b"not an image"),
+            ]
+        )
+        self.converter = self.make_converter(lambda url: next(responses))
+
+        result = self.converter._process_mermaid_diagrams(
+            make_diagram_document(2), max_workers=1
+        )
+
+        self.assertIn("Mermaid Diagram 1]", result)
+        self.assertIn("```\ngraph TD\n    A1 --> B1\n```", result)
+        self.assertEqual(self.converter.stats["mermaid_diagrams"], 1)
+
+    def test_convert_with_diagram_workers(self):
+        """Test the max_diagram_workers option end to end"""
+        self.converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+
+        output_path = self.converter.convert(
+            make_diagram_document(4),
+            "workers",
+            include_toc=False,
+            max_diagram_workers=4,
+        )
+
+        self.assertTrue(os.path.exists(output_path))
+        stats = self.converter.get_conversion_stats()
+        self.assertEqual(stats["mermaid_diagrams"], 4)
+        self.assertEqual(stats["images"], 4)
+
+    def test_diagrams_are_embedded_from_memory(self):
+        """Test that rendering leaves nothing but the output document on disk"""
+        self.converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+
+        self.converter.convert(make_diagram_document(2), "in_memory", include_toc=False)
+
+        self.assertEqual(os.listdir(self.temp_dir), ["in_memory.docx"])
+        self.assertEqual(self.converter.get_conversion_stats()["images"], 2)
+
+    def test_concurrent_conversions_share_one_converter(self):
+        """Test that parallel convert() calls on one instance stay isolated"""
+        self.converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        barrier = threading.Barrier(2, timeout=5)
+        results = {}
+
+        def run(name: str, diagram_count: int):
+            barrier.wait()
+            self.converter.convert(
+                make_diagram_document(diagram_count), name, include_toc=False
+            )
+            results[name] = self.converter.get_conversion_stats()
+
+        threads = [
+            threading.Thread(target=run, args=("two", 2)),
+            threading.Thread(target=run, args=("five", 5)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results["two"]["images"], 2)
+        self.assertEqual(results["five"]["images"], 5)
+
+    def test_stats_visible_from_other_threads(self):
+        """Test that a conversion on a worker thread reports to the caller"""
+        self.converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        worker = threading.Thread(
+            target=self.converter.convert,
+            args=(make_diagram_document(2), "worker"),
+            kwargs={"include_toc": False},
+        )
+        worker.start()
+        worker.join()
+
+        self.assertEqual(self.converter.get_conversion_stats()["images"], 2)
+
+    def test_other_threads_cannot_change_finished_stats(self):
+        """Test that a thread that did not convert writes to its own stats"""
+        self.converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        worker = threading.Thread(
+            target=self.converter.convert,
+            args=(make_diagram_document(2), "worker"),
+            kwargs={"include_toc": False},
+        )
+        worker.start()
+        worker.join()
+
+        self.converter.get_conversion_stats()["images"] = 99
+        self.converter._increment_stat("images")
+
+        self.assertEqual(self.converter.get_conversion_stats()["images"], 2)
+        self.assertEqual(self.converter.stats["images"], 1)
+
+    def test_duplicate_diagrams_render_once(self):
+        """Test that repeated diagrams are fetched once and reused"""
+        self.converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        diagram = "```mermaid\ngraph TD\n    A --> B\n```\n"
+        content = f"# Doc\n\n{diagram}\nText\n\n{diagram}\n## Again\n\n{diagram}"
+
+        self.converter.convert(content, "duplicates", include_toc=False)
+
+        stats = self.converter.get_conversion_stats()
+        self.assertEqual(len(self.transport.calls), 1)
+        self.assertEqual(stats["duplicate_diagrams_skipped"], 2)
+        self.assertEqual(stats["mermaid_diagrams"], 3)
+        self.assertEqual(stats["images"], 3)
+
+    def test_workspace_cleanup(self):
+        """Test that closing a workspace drops images and scratch files"""
+        workspace = ConversionWorkspace()
+        src = workspace.add_image(1, b"png")
+        scratch_dir = workspace.scratch_dir
+        self.assertTrue(scratch_dir.is_dir())
+        self.assertNotEqual(src, ConversionWorkspace().image_src(1))
+
+        workspace.close()
+
+        self.assertIsNone(workspace.get_image(src))
+        self.assertFalse(scratch_dir.exists())
+
+    def test_concurrent_conversions_coalesce_renders(self):
+        """Test that simultaneous conversions share one in-flight render"""
+        release = threading.Event()
+
+        def handler(url):
+            release.wait(timeout=5)
+            return make_image_response(make_png_bytes())
+
+        transport = FakeTransport(handler)
+        cache = DiagramCache()
+        group = SingleFlight()
+        negative_cache = NegativeCache()
+        content = make_diagram_document(1)
+        results = []
+
+        def run(index: int):
+            converter = ReadmeToWordConverter(
+                diagram_cache=cache,
+                transport=transport,
+                singleflight=group,
+                negative_cache=negative_cache,
+            )
+            converter.set_debug_mode(False)
+            converter.convert(content, f"burst_{index}", include_toc=False)
+            results.append(converter.get_conversion_stats())
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        # Release the render once both followers are waiting on the leader
+        wait_for(lambda: group.get_stats()["shared"] == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(sum(stats["coalesced_renders"] for stats in results), 2)
+        self.assertEqual(sum(stats["images"] for stats in results), 3)
+
+    def test_budget_falls_back_to_code_blocks(self):
+        """Test that diagrams unrendered when the budget runs out stay code"""
+        release = threading.Event()
+
+        def handler(url):
+            release.wait(timeout=5)
+            return make_image_response(make_png_bytes())
+
+        converter = self.make_converter(handler)
+        started = time.monotonic()
+        try:
+            converter.convert(
+                make_diagram_document(3),
+                "budget",
+                include_toc=False,
+                diagram_budget_seconds=0.2,
+            )
+        finally:
+            release.set()
+
+        stats = converter.get_conversion_stats()
+        self.assertLess(time.monotonic() - started, 3)
+        self.assertEqual(stats["mermaid_diagrams"], 0)
+        self.assertEqual(stats["diagrams_over_budget"], 3)
+        self.assertEqual(stats["diagram_budget_remaining"], 0)
+        self.assertEqual(stats["code_blocks"], 3)
+
+    def test_budget_still_uses_cached_diagrams(self):
+        """Test that cache hits are embedded even with no budget left"""
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        converter.convert(make_diagram_document(3), "warm", include_toc=False)
+
+        converter.convert(
+            make_diagram_document(3),
+            "budget",
+            include_toc=False,
+            diagram_budget_seconds=0,
+        )
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["mermaid_diagrams"], 3)
+        self.assertEqual(stats["diagram_cache_hits"], 3)
+        self.assertEqual(stats["diagrams_over_budget"], 0)
+        self.assertEqual(len(self.transport.calls), 3)
+
+    def test_abandoned_renders_leave_conversion_alone(self):
+        """Test that renders finishing after the budget change nothing"""
+        release = threading.Event()
+
+        def handler(url):
+            release.wait(timeout=5)
+            return make_image_response(make_png_bytes())
+
+        converter = self.make_converter(handler)
+        converter.convert(
+            make_diagram_document(2),
+            "budget",
+            include_toc=False,
+            max_diagram_workers=2,
+            diagram_budget_seconds=0.2,
+        )
+        stats = converter.get_conversion_stats()
+        workers = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "readme2word-diagram"
+        ]
+
+        # Daemon workers are not joined at exit, so they cannot delay it
+        self.assertTrue(workers)
+        self.assertTrue(all(thread.daemon for thread in workers))
+        release.set()
+        for thread in workers:
+            thread.join(timeout=5)
+
+        self.assertEqual(converter.get_conversion_stats(), stats)
+        self.assertEqual(stats["diagrams_over_budget"], 2)
+
+    def test_budget_reports_remaining_time(self):
+        """Test that a generous budget renders everything and reports slack"""
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes())
+        )
+        converter.convert(
+            make_diagram_document(2),
+            "budget",
+            include_toc=False,
+            max_diagram_workers=2,
+            diagram_budget_seconds=30,
+        )
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["mermaid_diagrams"], 2)
+        self.assertEqual(stats["diagrams_over_budget"], 0)
+        self.assertGreater(stats["diagram_budget_remaining"], 0)
+
+    def test_diagrams_fetched_at_target_width(self):
+        """Test that the DPI setting sets the requested and stored width"""
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes(size=(2000, 500)))
+        )
+        converter.diagram_dpi = 100
+        image = converter._mermaid_to_image("graph TD\n    A --> B", "default", 1)
+
+        self.assertIn("&width=600", self.transport.calls[0])
+        with Image.open(io.BytesIO(image)) as img:
+            self.assertEqual(img.size, (600, 150))
+
+    def test_dpi_zero_keeps_natural_size(self):
+        """Test that a DPI of 0 requests and keeps the natural size"""
+        converter = self.make_converter(
+            lambda url: make_image_response(make_png_bytes(size=(2000, 500)))
+        )
+        converter.diagram_dpi = 0
+        image = converter._mermaid_to_image("graph TD\n    A --> B", "default", 1)
+
+        self.assertNotIn("width", self.transport.calls[0])
+        with Image.open(io.BytesIO(image)) as img:
+            self.assertEqual(img.width, 2000)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for SingleFlight request coalescing"""
+
+    def test_sequential_calls_do_not_share(self):
+        """Test that calls which do not overlap each execute"""
+        group = SingleFlight()
+        self.assertEqual(group.do("key", lambda: 1), (1, False))
+        self.assertEqual(group.do("key", lambda: 2), (2, False))
+        self.assertEqual(group.get_stats()["executions"], 2)
+
+    def test_followers_receive_leader_error(self):
+        """Test that waiting callers get the leader's exception"""
+        group = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def failing():
+            release.wait(timeout=5)
+            raise ValueError("render failed")
+
+        def call(fn):
+            try:
+                group.do("key", fn)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call, args=(failing,))
+        leader.start()
+        wait_for(lambda: group.in_flight() == 1)
+        follower = threading.Thread(target=call, args=(lambda: "unused",))
+        follower.start()
+        wait_for(lambda: group.get_stats()["shared"] == 1)
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(len(errors), 2)
+        self.assertIs(errors[0], errors[1])
+        self.assertEqual(group.in_flight(), 0)
+
+
+def run_diagram_pipeline_tests():
+    """Run all diagram pipeline tests"""
+    print("🧪 Running Diagram Pipeline Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestDiagramPipeline))
+    suite.addTests(loader.loadTestsFromTestCase(TestSingleFlight))
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All diagram pipeline tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_diagram_pipeline_tests()
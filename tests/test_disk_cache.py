@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Test suite for the persistent SQLite diagram cache
+
+Tests cover:
+- Entries surviving a new cache instance (process restart)
+- TTL expiry and total-size eviction
+- Concurrent use of one database file from several instances
+- Corrupt or unwritable cache files falling back to memory-only caching
+- Memory cache backed by the disk cache
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from readme2word.cache import DiagramCache, NegativeCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.diskcache import SQLiteDiagramCache, create_disk_cache_from_env
+from tests.helpers import FakeTransport, make_image_response, make_png_bytes
+
+# Add parent directory to path to import diskcache
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class TestSQLiteDiagramCache(unittest.TestCase):
+    """Test cases for SQLiteDiagramCache"""
+
+    def setUp(self):
+        """Create a cache file in a scratch directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "cache" / "diagrams.sqlite3"
+        self.now = 1000.0
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_cache(self, **kwargs) -> SQLiteDiagramCache:
+        cache = SQLiteDiagramCache(self.path, clock=lambda: self.now, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_entries_survive_reopen(self):
+        """Test that a new instance sees entries written by another"""
+        self.make_cache().put("key", b"diagram")
+        reopened = self.make_cache()
+        self.assertEqual(reopened.get("key"), b"diagram")
+        self.assertEqual(reopened.get_stats()["hits"], 1)
+
+    def test_uses_wal_journal(self):
+        """Test that the database runs in WAL mode"""
+        self.make_cache().put("key", b"diagram")
+        with sqlite3.connect(str(self.path)) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are misses"""
+        cache = self.make_cache(ttl=60)
+        cache.put("key", b"diagram")
+        self.now += 59
+        self.assertEqual(cache.get("key"), b"diagram")
+        self.now += 1
+        self.assertIsNone(cache.get("key"))
+
+    def test_size_eviction_drops_least_recently_used(self):
+        """Test that the oldest entries go once the size limit is exceeded"""
+        cache = self.make_cache(max_bytes=10)
+        cache.put("a", b"12345")
+        self.now += 100
+        cache.put("b", b"12345")
+        self.now += 100
+        cache.get("a")  # refresh "a" so "b" is the oldest
+        cache.put("c", b"12345")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"12345")
+        self.assertLessEqual(cache.get_stats()["bytes"], 10)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_concurrent_instances(self):
+        """Test several writers and readers sharing one file"""
+        self.make_cache()
+        errors = []
+
+        def worker(index: int):
+            cache = SQLiteDiagramCache(self.path)
+            try:
+                for n in range(20):
+                    cache.put(f"{index}-{n}", b"x" * 100)
+                    if cache.get(f"{index}-{n}") is None:
+                        errors.append((index, n))
+            finally:
+                errors.extend(["error"] * cache.get_stats()["errors"])
+                cache.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.make_cache()), 80)
+
+    def test_unreadable_database_is_a_miss(self):
+        """Test that database errors degrade to cache misses"""
+        cache = self.make_cache()
+        cache._connect().execute("DROP TABLE diagrams")
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", b"diagram")
+        self.assertEqual(cache.get_stats()["errors"], 2)
+
+    def test_corrupt_database_disables_cache(self):
+        """Test that a file that is not a database is treated as an empty cache"""
+        self.path.parent.mkdir(parents=True)
+        self.path.write_bytes(b"not a database" * 100)
+
+        cache = self.make_cache()
+        self.assertFalse(cache.available)
+        cache.put("key", b"diagram")
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_stats()["errors"], 1)
+
+        with patch.dict(os.environ, {"README2WORD_DISK_CACHE": str(self.path)}):
+            with patch("sys.stderr"):
+                self.assertIsNone(create_disk_cache_from_env())
+
+    def test_unwritable_directory_disables_cache(self):
+        """Test that a cache directory that cannot be created is not fatal"""
+        blocker = Path(self.temp_dir) / "cache"
+        blocker.write_text("a file where the directory should be")
+
+        cache = self.make_cache()
+        self.assertFalse(cache.available)
+        self.assertIsNone(cache.get("key"))
+
+        with patch.dict(os.environ, {"README2WORD_DISK_CACHE": str(self.path)}):
+            with patch("sys.stderr"):
+                self.assertIsNone(create_disk_cache_from_env())
+                memory = DiagramCache(backing=create_disk_cache_from_env())
+        memory.put("key", b"diagram")
+        self.assertEqual(memory.get("key"), b"diagram")
+
+    def test_environment_configuration(self):
+        """Test that the disk cache is only enabled by its environment variable"""
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(create_disk_cache_from_env())
+
+        with patch.dict(
+            os.environ,
+            {
+                "README2WORD_DISK_CACHE": str(self.path),
+                "README2WORD_DISK_CACHE_TTL": "30",
+            },
+        ):
+            cache = create_disk_cache_from_env()
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.ttl, 30)
+
+
+class TestBackedDiagramCache(unittest.TestCase):
+    """Test the memory cache backed by a disk cache"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.path = Path(self.temp_dir) / "diagrams.sqlite3"
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_memory_miss_is_promoted_from_disk(self):
+        """Test that disk hits are copied into memory"""
+        disk = SQLiteDiagramCache(self.path)
+        self.addCleanup(disk.close)
+        disk.put("key", b"diagram")
+
+        cache = DiagramCache(backing=disk)
+        self.assertEqual(cache.get("key"), b"diagram")
+        self.assertIn("key", cache)
+        self.assertEqual(cache.get_stats()["backing"]["hits"], 1)
+
+    def test_cold_process_starts_warm(self):
+        """Test that a fresh memory cache reuses diagrams stored on disk"""
+        transport = FakeTransport(lambda url: make_image_response(make_png_bytes()))
+        content = "# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n"
+
+        for name in ("first", "restarted"):
+            disk = SQLiteDiagramCache(self.path)
+            self.addCleanup(disk.close)
+            converter = ReadmeToWordConverter(
+                diagram_cache=DiagramCache(backing=disk),
+                transport=transport,
+                negative_cache=NegativeCache(),
+            )
+            converter.set_debug_mode(False)
+            converter.convert(content, name, include_toc=False)
+
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(converter.get_conversion_stats()["diagram_cache_hits"], 1)
+
+
+def run_disk_cache_tests():
+    """Run all disk cache tests"""
+    print("🧪 Running Disk Cache Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestSQLiteDiagramCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestBackedDiagramCache))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All disk cache tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_disk_cache_tests()
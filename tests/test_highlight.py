@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Test suite for code block rendering
+
+Tests cover:
+- Language detection on soup tags and Markdown tree nodes
+- Fast mode: plain text, with line breaks for very large blocks
+- Highlight mode: colored runs, falling back to plain text
+- Lexer and run property caches
+- Code mode selection and validation
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+from xml.etree.ElementTree import Element, SubElement
+
+from bs4 import BeautifulSoup
+from docx import Document
+from docx.oxml.ns import qn
+
+from readme2word import highlight
+from readme2word.cache import DiagramCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.highlight import (
+    LARGE_CODE_BLOCK_LINES,
+    CodeHighlighter,
+    add_code_lines,
+    code_language,
+)
+from readme2word.mdtree import TreeNode
+
+# Add parent directory to path to import highlight
+sys.path.append(str(Path(__file__).parent.parent))
+
+PYTHON_SOURCE = 'def greet(name):\n\t# say hello\n    return "hi " + name\n'
+
+
+def paragraph_text(paragraph) -> str:
+    """Text of a paragraph with breaks and tabs spelled out"""
+    parts = []
+    for child in paragraph._p.iter(qn("w:t"), qn("w:br"), qn("w:tab")):
+        if child.tag == qn("w:t"):
+            parts.append(child.text)
+        else:
+            parts.append("\n" if child.tag == qn("w:br") else "\t")
+    return "".join(parts)
+
+
+class TestCodeLanguage(unittest.TestCase):
+    """Test cases for reading the language off a fenced block"""
+
+    def test_soup_elements(self):
+        """Test language detection on pre and code tags"""
+        soup = BeautifulSoup(
+            '<pre><code class="language-python">x</code></pre><pre><code>y</code></pre>',
+            "html.parser",
+        )
+        pre, plain = soup.find_all("pre")
+        self.assertEqual(code_language(pre), "python")
+        self.assertEqual(code_language(pre.code), "python")
+        self.assertIsNone(code_language(plain))
+
+    def test_tree_nodes(self):
+        """Test language detection on Markdown tree nodes"""
+        pre = Element("pre")
+        SubElement(pre, "code", {"class": "language-rust"})
+        self.assertEqual(code_language(TreeNode(pre)), "rust")
+        self.assertIsNone(code_language(TreeNode(Element("pre"))))
+
+
+@unittest.skipUnless(highlight.HAS_PYGMENTS, "Pygments is not installed")
+class TestCodeHighlighter(unittest.TestCase):
+    """Test cases for CodeHighlighter"""
+
+    def test_highlight_writes_colored_runs(self):
+        """Test that tokens become formatted runs with the text intact"""
+        paragraph = Document().add_paragraph()
+        self.assertTrue(CodeHighlighter().highlight(paragraph, PYTHON_SOURCE, "python"))
+
+        self.assertEqual(paragraph_text(paragraph), PYTHON_SOURCE)
+        self.assertGreater(len(paragraph.runs), 3)
+        self.assertTrue(any(run.font.color.rgb for run in paragraph.runs))
+        self.assertTrue(any(run.bold for run in paragraph.runs))
+
+    def test_unknown_language(self):
+        """Test that an unknown language leaves the paragraph untouched"""
+        paragraph = Document().add_paragraph()
+        highlighter = CodeHighlighter()
+        self.assertFalse(highlighter.highlight(paragraph, "x", "no-such-language"))
+        self.assertEqual(len(paragraph.runs), 0)
+
+    def test_caches(self):
+        """Test that lexers and run properties are built once"""
+        highlighter = CodeHighlighter()
+        with patch.object(
+            highlight, "get_lexer_by_name", wraps=highlight.get_lexer_by_name
+        ) as lookup:
+            highlighter.lexer("Python")
+            highlighter.lexer("python")
+            highlighter.lexer("no-such-language")
+            highlighter.lexer("no-such-language")
+        self.assertEqual(lookup.call_count, 2)
+
+        from pygments.token import Keyword, Text
+
+        properties = highlighter.run_properties(Keyword)
+        self.assertIs(highlighter.run_properties(Keyword), properties)
+        self.assertIsNone(highlighter.run_properties(Text))
+
+
+class TestPlainCode(unittest.TestCase):
+    """Test cases for fast mode output"""
+
+    def test_small_block_is_one_run(self):
+        """Test that ordinary blocks are a single run"""
+        paragraph = Document().add_paragraph()
+        add_code_lines(paragraph, "a = 1\nb = 2\n")
+        self.assertEqual(len(paragraph.runs), 1)
+        self.assertEqual(paragraph.runs[0].text, "a = 1\nb = 2\n")
+
+    def test_large_block_is_split_into_lines(self):
+        """Test that huge blocks get a run per line joined by breaks"""
+        lines = [f"\tline {n}" for n in range(LARGE_CODE_BLOCK_LINES * 2)]
+        code_text = "\n".join(lines) + "\n"
+        paragraph = Document().add_paragraph()
+        add_code_lines(paragraph, code_text)
+
+        self.assertEqual(len(paragraph.runs), len(lines))
+        self.assertEqual(paragraph_text(paragraph), code_text)
+        self.assertEqual(len(paragraph._p.findall(".//" + qn("w:br"))), len(lines))
+
+
+class TestConverterCodeModes(unittest.TestCase):
+    """Test code mode selection in the converter"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def convert(self, content, **options):
+        """Convert content and return the converter and document XML"""
+        converter = ReadmeToWordConverter(diagram_cache=DiagramCache(), **options)
+        converter.set_debug_mode(False)
+        with zipfile.ZipFile(converter.convert(content, "code")) as docx:
+            return converter, docx.read("word/document.xml")
+
+    def test_mode_selection(self):
+        """Test the default, environment override and validation"""
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(ReadmeToWordConverter(DiagramCache()).code_mode, "fast")
+        with patch.dict(os.environ, {"README2WORD_CODE_MODE": "highlight"}):
+            converter = ReadmeToWordConverter(DiagramCache())
+            self.assertEqual(converter.code_mode, "highlight")
+        with self.assertRaises(ValueError):
+            ReadmeToWordConverter(DiagramCache(), code_mode="rainbow")
+
+    def test_fast_mode_skips_highlighting(self):
+        """Test that fast mode never asks the highlighter"""
+        content = f"```python\n{PYTHON_SOURCE}```\n"
+        with patch.object(CodeHighlighter, "highlight") as highlight_block:
+            converter, _ = self.convert(content, code_mode="fast")
+        highlight_block.assert_not_called()
+        self.assertEqual(converter.stats["highlighted_code_blocks"], 0)
+        self.assertEqual(converter.stats["code_blocks"], 1)
+
+    @unittest.skipUnless(highlight.HAS_PYGMENTS, "Pygments is not installed")
+    def test_highlight_mode(self):
+        """Test that labelled blocks are highlighted and others stay plain"""
+        content = f"```python\n{PYTHON_SOURCE}```\n\n```\nplain text\n```\n"
+        converter, xml = self.convert(content, code_mode="highlight")
+        self.assertEqual(converter.stats["highlighted_code_blocks"], 1)
+        self.assertEqual(converter.stats["code_blocks"], 2)
+        self.assertIn(b"<w:color ", xml)
+
+        for engine in ("html", "ast"):
+            with self.subTest(engine=engine):
+                _, other = self.convert(content, code_mode="highlight", engine=engine)
+                self.assertEqual(other, xml)
+
+
+def run_highlight_tests():
+    """Run all code block rendering tests"""
+    print("🧪 Running Code Highlighting Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestCodeLanguage))
+    suite.addTests(loader.loadTestsFromTestCase(TestCodeHighlighter))
+    suite.addTests(loader.loadTestsFromTestCase(TestPlainCode))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterCodeModes))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All code highlighting tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_highlight_tests()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Markdown element tree engine
+
+Tests cover:
+- TreeNode's BeautifulSoup-compatible view of tree elements
+- Block iteration with raw HTML fragments parsed like the html engine
+- Identical documents from the html and ast engines
+- Engine selection and validation
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import markdown
+
+from readme2word.cache import DiagramCache, NegativeCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.mdtree import TreeNode, iter_markdown_blocks, parse_markdown_tree
+from readme2word.resources import MARKDOWN_EXTENSIONS
+from tests.helpers import FakeTransport, make_image_response, make_png_bytes
+
+# Add parent directory to path to import mdtree
+sys.path.append(str(Path(__file__).parent.parent))
+
+SAMPLE = """# Title
+
+Intro with **bold**, *italic*, `code`, [a link](http://x.com?a=1&b=2),
+AT&T < 3 &copy; and <b>inline html</b>.
+
+## Lists
+- one
+- two **b**
+  - nested
+
+1. first
+2. second
+
+> quoted *text*
+
+| A | B |
+|---|---|
+| 1 | 2 & 3 |
+| <i>x</i> | y |
+
+```python
+def f(x):
+    return x < 1
+```
+
+    indented code
+
+<div class="note">
+<p>raw block</p>
+</div>
+
+```mermaid
+graph TD
+    A --> B
+```
+
+Escaped \\*stars\\* and an autolink <me@example.com>.
+
+### End
+Line one
+line two
+"""
+
+
+def make_markdown() -> markdown.Markdown:
+    return markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+
+
+class TestTreeNode(unittest.TestCase):
+    """Test cases for TreeNode and block iteration"""
+
+    def test_tree_node_api(self):
+        """Test children, text, attributes and descendant search"""
+        root = parse_markdown_tree(
+            make_markdown(), "Some **bold** and ![alt](pic.png) text"
+        )
+        paragraph = TreeNode(root[0])
+
+        self.assertEqual(paragraph.name, "p")
+        self.assertEqual(paragraph.get_text(), "Some bold and  text")
+        children = list(paragraph.children)
+        self.assertEqual(children[0], "Some ")
+        self.assertEqual(children[1].name, "strong")
+        self.assertEqual(children[2], " and ")
+        images = paragraph.find_all("img")
+        self.assertEqual(len(images), 1)
+        self.assertEqual(images[0].get("src"), "pic.png")
+        self.assertEqual(images[0].get("title", ""), "")
+        self.assertEqual(paragraph.find_all(["strong", "img"])[0].name, "strong")
+
+    def test_blank_document(self):
+        """Test that a blank document has no blocks"""
+        self.assertIsNone(parse_markdown_tree(make_markdown(), "  \n"))
+        self.assertEqual(list(iter_markdown_blocks(make_markdown(), "")), [])
+
+    def test_raw_html_blocks_are_parsed(self):
+        """Test that only blocks holding stashed HTML become soup tags"""
+        source = "Plain *text*\n\n```\ncode\n```\n\nAn &copy; entity"
+        blocks = list(iter_markdown_blocks(make_markdown(), source))
+        tags = [block for block in blocks if getattr(block, "name", None)]
+
+        self.assertIsInstance(blocks[0], TreeNode)
+        self.assertEqual(tags[1].name, "pre")
+        self.assertEqual(tags[1].get_text(), "code\n")
+        self.assertEqual(tags[-1].get_text(), "An © entity")
+        self.assertNotIsInstance(tags[-1], TreeNode)
+
+
+class TestEngines(unittest.TestCase):
+    """Test cases comparing the conversion engines"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def convert(self, engine: str, content: str):
+        converter = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(),
+            transport=FakeTransport(lambda url: make_image_response(make_png_bytes())),
+            negative_cache=NegativeCache(),
+            engine=engine,
+        )
+        converter.set_debug_mode(False)
+        output = converter.convert(content, engine)
+        with zipfile.ZipFile(output) as docx:
+            document = docx.read("word/document.xml")
+        return document, converter.get_conversion_stats()
+
+    def test_engines_produce_identical_documents(self):
+        """Test that the ast engine reproduces the html engine's document"""
+        html_document, html_stats = self.convert("html", SAMPLE)
+        ast_document, ast_stats = self.convert("ast", SAMPLE)
+
+        self.assertEqual(ast_document, html_document)
+        self.assertEqual(ast_stats, html_stats)
+        self.assertEqual(ast_stats["images"], 1)
+        self.assertEqual(ast_stats["tables"], 1)
+
+    def test_engine_selection(self):
+        """Test the default engine, the environment and invalid names"""
+        self.assertEqual(ReadmeToWordConverter(DiagramCache()).engine, "html")
+        with patch.dict(os.environ, {"README2WORD_ENGINE": "ast"}):
+            self.assertEqual(ReadmeToWordConverter(DiagramCache()).engine, "ast")
+        with self.assertRaises(ValueError):
+            ReadmeToWordConverter(DiagramCache(), engine="regex")
+
+
+def run_mdtree_tests():
+    """Run all Markdown tree engine tests"""
+    print("🧪 Running Markdown Tree Engine Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestTreeNode))
+    suite.addTests(loader.loadTestsFromTestCase(TestEngines))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All Markdown tree engine tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_mdtree_tests()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test suite for HTML parser backend selection
+
+Tests cover:
+- Default selection of the fastest installed parser
+- Environment override and validation of parser names
+- Identical top-level nodes and documents from every installed parser
+- Known differences between parsers on malformed raw HTML
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import markdown
+from docx.oxml.ns import qn
+from lxml import etree
+
+from readme2word import parsers
+from readme2word.cache import DiagramCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.parsers import (
+    available_html_parsers,
+    get_default_html_parser,
+    parse_html_blocks,
+    resolve_html_parser,
+)
+from readme2word.resources import MARKDOWN_EXTENSIONS
+from tests.test_mdtree import SAMPLE
+
+# Add parent directory to path to import parsers
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Raw HTML that the parsers repair differently
+MALFORMED_HTML = (
+    "# Raw HTML\n\n"
+    "<table><tr><td>a<td>b</tr></table>\n\n"
+    "Text with a stray </div> end tag.\n"
+)
+
+# Document text for MALFORMED_HTML: lxml closes the open cell like a
+# browser; html.parser nests the second cell in the first and splits the
+# text around the stray end tag
+MALFORMED_HTML_TEXT = {
+    "lxml": ["Raw HTML", "a", "b", "Text with a stray  end tag."],
+    "html.parser": ["Raw HTML", "ab", "b", "Text with a stray ", " end tag."],
+}
+
+
+def document_text(path: str) -> List[str]:
+    """Text of every run in a converted document, in order"""
+    with zipfile.ZipFile(path) as docx:
+        root = etree.fromstring(docx.read("word/document.xml"))
+    return [node.text or "" for node in root.iter(qn("w:t"))]
+
+
+class TestParserSelection(unittest.TestCase):
+    """Test cases for choosing a parser backend"""
+
+    def test_default_prefers_lxml(self):
+        """Test that lxml is chosen when installed, else html.parser"""
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(get_default_html_parser(), "lxml")
+            with patch.object(
+                parsers, "html_parser_available", lambda name: name != "lxml"
+            ):
+                self.assertEqual(get_default_html_parser(), "html.parser")
+
+    def test_environment_override(self):
+        """Test that README2WORD_HTML_PARSER selects the parser"""
+        with patch.dict(os.environ, {"README2WORD_HTML_PARSER": "html.parser"}):
+            self.assertEqual(resolve_html_parser(), "html.parser")
+            self.assertEqual(
+                ReadmeToWordConverter(DiagramCache()).html_parser, "html.parser"
+            )
+
+    def test_invalid_parsers_are_rejected(self):
+        """Test that unknown and uninstalled parsers raise ValueError"""
+        with self.assertRaises(ValueError):
+            resolve_html_parser("regex")
+        with patch.object(parsers, "html_parser_available", lambda name: False):
+            with self.assertRaises(ValueError):
+                resolve_html_parser("html5lib")
+
+    def test_html_parser_always_available(self):
+        """Test that the built-in parser is always listed"""
+        self.assertIn("html.parser", available_html_parsers())
+
+
+class TestParserEquivalence(unittest.TestCase):
+    """Test that every installed parser gives the converter the same input"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_same_top_level_nodes(self):
+        """Test that fragments are unwrapped from <html><body>"""
+        md = markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+        html = md.convert(SAMPLE)
+        expected = [str(node) for node in parse_html_blocks(html, "html.parser")]
+        for parser in available_html_parsers():
+            with self.subTest(parser=parser):
+                nodes = [str(node) for node in parse_html_blocks(html, parser)]
+                self.assertEqual(nodes, expected)
+
+    def test_same_document(self):
+        """Test that the converted document does not depend on the parser"""
+        documents = {}
+        for parser in available_html_parsers():
+            converter = ReadmeToWordConverter(
+                diagram_cache=DiagramCache(), renderer=None, html_parser=parser
+            )
+            converter.set_debug_mode(False)
+            content = SAMPLE.replace("```mermaid", "```text")
+            output = converter.convert(content, parser.replace(".", "_"))
+            with zipfile.ZipFile(output) as docx:
+                documents[parser] = docx.read("word/document.xml")
+
+        self.assertEqual(len(set(documents.values())), 1)
+
+    def test_malformed_raw_html_differences(self):
+        """Test the known differences between parsers on malformed raw HTML"""
+        for parser, expected in MALFORMED_HTML_TEXT.items():
+            if parser not in available_html_parsers():
+                continue
+            with self.subTest(parser=parser):
+                converter = ReadmeToWordConverter(
+                    diagram_cache=DiagramCache(), renderer=None, html_parser=parser
+                )
+                converter.set_debug_mode(False)
+                output = converter.convert(
+                    MALFORMED_HTML, parser.replace(".", "_"), include_toc=False
+                )
+                self.assertEqual(document_text(output), expected)
+
+
+def run_parser_tests():
+    """Run all HTML parser backend tests"""
+    print("🧪 Running HTML Parser Backend Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestParserSelection))
+    suite.addTests(loader.loadTestsFromTestCase(TestParserEquivalence))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All HTML parser backend tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_parser_tests()
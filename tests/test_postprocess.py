@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test suite for diagram post-processing
+
+Tests cover:
+- Border trimming with and without NumPy
+- Adaptive palette quantization, lossless for flat-color diagrams
+- Optimized PNG output that is never larger than the input
+- Per-conversion opt-in with bytes saved reported in the stats
+"""
+
+import io
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image, ImageDraw
+
+from readme2word import postprocess
+from readme2word.postprocess import content_bbox, optimize_png, trim_image
+from tests.helpers import ConverterTestCase, FakeTransport, make_image_response
+
+# Add parent directory to path to import postprocess
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def make_diagram(size=(600, 400), mode="RGB") -> Image.Image:
+    """A flat-color box with an outline in the middle of a white margin"""
+    img = Image.new(mode, size, "white")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((200, 100, 399, 249), fill=(200, 220, 255), outline="black")
+    return img
+
+
+def to_png(img: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class TestPostprocess(unittest.TestCase):
+    """Test cases for the image post-processing functions"""
+
+    def test_content_bbox(self):
+        """Test that the box surrounds the non-background pixels"""
+        self.assertEqual(content_bbox(make_diagram()), (200, 100, 400, 250))
+        self.assertIsNone(content_bbox(Image.new("RGB", (50, 50), "white")))
+
+    def test_content_bbox_without_numpy(self):
+        """Test that the Pillow fallback finds the same box"""
+        img = make_diagram()
+        with patch.object(postprocess, "HAS_NUMPY", False):
+            self.assertEqual(content_bbox(img), (200, 100, 400, 250))
+            self.assertEqual(content_bbox(img.convert("RGBA")), (200, 100, 400, 250))
+
+    def test_trim_keeps_padding(self):
+        """Test that trimming leaves a small margin around the content"""
+        trimmed = trim_image(make_diagram(), padding=8)
+        self.assertEqual(trimmed.size, (216, 166))
+        self.assertEqual(trim_image(make_diagram(), padding=500).size, (600, 400))
+
+    def test_optimize_png(self):
+        """Test that a diagram becomes a smaller, trimmed palette PNG"""
+        original = to_png(make_diagram())
+        optimized = optimize_png(original)
+
+        self.assertLess(len(optimized), len(original))
+        with Image.open(io.BytesIO(optimized)) as img:
+            self.assertEqual(img.mode, "P")
+            self.assertEqual(img.size, (216, 166))
+            # Three flat colors fit in the palette, so nothing is lost
+            colors = {color for _, color in img.convert("RGB").getcolors()}
+            self.assertEqual(colors, {(255, 255, 255), (0, 0, 0), (200, 220, 255)})
+
+    def test_optimize_png_with_alpha(self):
+        """Test that transparent diagrams keep their transparency"""
+        img = Image.new("RGBA", (300, 200), (0, 0, 0, 0))
+        ImageDraw.Draw(img).rectangle((100, 50, 199, 149), fill=(255, 0, 0, 255))
+        with Image.open(io.BytesIO(optimize_png(to_png(img)))) as result:
+            rgba = result.convert("RGBA")
+            self.assertEqual(rgba.getpixel((0, 0))[3], 0)
+            self.assertEqual(rgba.getpixel((50, 50)), (255, 0, 0, 255))
+
+    def test_never_larger_than_input(self):
+        """Test that the original bytes are kept when optimizing does not help"""
+        original = to_png(Image.new("RGB", (1, 1), "white"))
+        self.assertEqual(optimize_png(original), original)
+
+
+class TestConverterPostprocess(ConverterTestCase):
+    """Test converter integration of diagram post-processing"""
+
+    def setUp(self):
+        """Run each test in a scratch directory with a fake transport"""
+        super().setUp()
+        self.diagram = to_png(make_diagram())
+        self.transport = FakeTransport(lambda url: make_image_response(self.diagram))
+
+    def test_optimization_is_opt_in(self):
+        """Test that diagrams are left untouched by default"""
+        converter = self.make_converter(diagram_dpi=0)
+        converter.convert("# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n", "plain")
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["optimized_diagrams"], 0)
+        self.assertEqual(stats["diagram_bytes_saved"], 0)
+
+    def test_per_conversion_optimization(self):
+        """Test that convert() enables optimization and reports bytes saved"""
+        converter = self.make_converter(diagram_dpi=0)
+        content = "# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n"
+        converter.convert(content, "optimized", optimize_diagrams=True)
+
+        stats = converter.get_conversion_stats()
+        expected = len(self.diagram) - len(optimize_png(self.diagram))
+        self.assertEqual(stats["optimized_diagrams"], 1)
+        self.assertEqual(stats["diagram_bytes_saved"], expected)
+        self.assertGreater(expected, 0)
+
+        # Optimized and original images are cached under different keys
+        converter.convert(content, "plain", optimize_diagrams=False)
+        self.assertEqual(len(self.transport.calls), 2)
+        converter.convert(content, "again", optimize_diagrams=True)
+        self.assertEqual(len(self.transport.calls), 2)
+        self.assertEqual(converter.get_conversion_stats()["diagram_cache_hits"], 1)
+
+    def test_environment_default(self):
+        """Test that README2WORD_OPTIMIZE_DIAGRAMS enables optimization"""
+        with patch.dict(os.environ, {"README2WORD_OPTIMIZE_DIAGRAMS": "true"}):
+            converter = self.make_converter(diagram_dpi=0)
+        self.assertTrue(converter.optimize_diagrams)
+        converter.convert("# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n", "env")
+        self.assertEqual(converter.get_conversion_stats()["optimized_diagrams"], 1)
+
+
+def run_postprocess_tests():
+    """Run all diagram post-processing tests"""
+    print("🧪 Running Diagram Post-processing Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestPostprocess))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterPostprocess))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All post-processing tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_postprocess_tests()
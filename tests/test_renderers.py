@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Test suite for diagram renderer backends
+
+Tests cover:
+- URL construction for mermaid.ink and custom endpoints
+- Plain base64 and compressed pako source encodings
+- Renderer selection by name and environment variables
+- Error reporting for failed renders
+- The code-block-only backend
+"""
+
+import base64
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest.mock import patch
+
+from readme2word.cache import DiagramCache, NegativeCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.renderers import (
+    CodeBlockRenderer,
+    DiagramRenderError,
+    MermaidInkRenderer,
+    create_renderer,
+)
+from tests.helpers import FakeTransport, make_image_response, make_png_bytes
+
+# Add parent directory to path to import renderers
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class TestRenderers(unittest.TestCase):
+    """Test cases for renderer backends"""
+
+    def test_mermaid_ink_url(self):
+        """Test URL construction for the public service"""
+        renderer = MermaidInkRenderer(transport=FakeTransport(None))
+        url = renderer.build_url("graph TD; A-->B", "dark")
+        encoded = base64.urlsafe_b64encode(b"graph TD; A-->B").decode("ascii")
+        self.assertEqual(url, f"https://mermaid.ink/img/{encoded}?theme=dark")
+
+    def test_pako_encoding_round_trips(self):
+        """Test that the pako form inflates back to the diagram source"""
+        renderer = MermaidInkRenderer(transport=FakeTransport(None), encoding="pako")
+        url = renderer.build_url("graph TD; A-->B", "forest")
+        encoded = url.split("/img/pako:")[1].split("?")[0]
+        padded = encoded + "=" * (-len(encoded) % 4)
+        state = json.loads(zlib.decompress(base64.urlsafe_b64decode(padded)))
+        self.assertEqual(state["code"], "graph TD; A-->B")
+        self.assertEqual(state["mermaid"]["theme"], "forest")
+
+    def test_auto_encoding_picks_shorter_form(self):
+        """Test that small diagrams use base64 and large ones use pako"""
+        renderer = MermaidInkRenderer(transport=FakeTransport(None))
+        self.assertNotIn("pako:", renderer.build_url("graph TD"))
+
+        large = "sequenceDiagram\n" + "\n".join(
+            f"    Alice->>Bob: Message number {i}" for i in range(200)
+        )
+        url = renderer.build_url(large)
+        self.assertIn("/img/pako:", url)
+        base64_url = MermaidInkRenderer(
+            transport=FakeTransport(None), encoding="base64"
+        ).build_url(large)
+        self.assertLess(len(url), len(base64_url) / 5)
+
+    def test_width_is_requested(self):
+        """Test that a target width is passed to the service"""
+        renderer = MermaidInkRenderer(transport=FakeTransport(None))
+        self.assertTrue(
+            renderer.build_url("graph TD", width=900).endswith("&width=900")
+        )
+        self.assertNotIn("width", renderer.build_url("graph TD"))
+
+    def test_svg_endpoint(self):
+        """Test that SVG renders use the svg endpoint"""
+        renderer = MermaidInkRenderer(transport=FakeTransport(None))
+        url = renderer.build_url("graph TD", image_format="svg")
+        self.assertTrue(url.startswith("https://mermaid.ink/svg/"))
+
+    def test_unknown_encoding(self):
+        """Test that unknown encodings are rejected"""
+        with self.assertRaises(ValueError):
+            MermaidInkRenderer(transport=FakeTransport(None), encoding="gzip")
+
+    def test_unknown_theme_falls_back_to_default(self):
+        """Test that unsupported themes map to the default theme"""
+        renderer = MermaidInkRenderer(transport=FakeTransport(None))
+        self.assertTrue(renderer.build_url("graph TD", "pink").endswith("default"))
+
+    def test_custom_base_url(self):
+        """Test that a custom endpoint replaces the public host"""
+        renderer = create_renderer(
+            "custom", "http://mermaid.internal:3000/", FakeTransport(None)
+        )
+        self.assertEqual(renderer.name, "custom")
+        self.assertTrue(
+            renderer.build_url("graph TD").startswith(
+                "http://mermaid.internal:3000/img/"
+            )
+        )
+
+    def test_custom_requires_url(self):
+        """Test that the custom backend refuses to start without a URL"""
+        with patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(ValueError):
+                create_renderer("custom")
+
+    def test_environment_selection(self):
+        """Test renderer selection from environment variables"""
+        with patch.dict(os.environ, {"README2WORD_RENDERER": "none"}):
+            self.assertIsInstance(create_renderer(), CodeBlockRenderer)
+
+        with patch.dict(
+            os.environ,
+            {"README2WORD_RENDERER_URL": "http://localhost:3000"},
+            clear=True,
+        ):
+            renderer = create_renderer(transport=FakeTransport(None))
+            self.assertEqual(renderer.base_url, "http://localhost:3000")
+
+    def test_unknown_renderer(self):
+        """Test that unknown backend names are rejected"""
+        with self.assertRaises(ValueError):
+            create_renderer("graphviz")
+
+    def test_error_status_raises(self):
+        """Test that an API error is reported as DiagramRenderError"""
+        response = make_image_response(b"")
+        response.status_code = 400
+        renderer = MermaidInkRenderer(transport=FakeTransport(lambda url: response))
+        with self.assertRaises(DiagramRenderError):
+            renderer.render("graph TD")
+
+    def test_error_class_and_transience(self):
+        """Test that render errors carry a reason and a transient flag"""
+        for status, transient in ((400, False), (503, True)):
+            response = make_image_response(b"")
+            response.status_code = status
+            renderer = MermaidInkRenderer(transport=FakeTransport(lambda url: response))
+            with self.assertRaises(DiagramRenderError) as context:
+                renderer.render("graph TD")
+            self.assertEqual(context.exception.error_class, f"http_{status}")
+            self.assertEqual(context.exception.transient, transient)
+
+    def test_response_size_is_capped(self):
+        """Test that oversized responses are rejected while streaming"""
+        response = make_image_response(b"x" * 100)
+        renderer = MermaidInkRenderer(
+            transport=FakeTransport(lambda url: response), max_response_bytes=50
+        )
+        with self.assertRaises(DiagramRenderError):
+            renderer.render("graph TD")
+        response.close.assert_called_once()
+
+
+class TestConverterRendererInjection(unittest.TestCase):
+    """Test renderer dependency injection into the converter"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.content = "# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n"
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_injected_renderer_is_used(self):
+        """Test that the converter renders through the injected backend"""
+        transport = FakeTransport(lambda url: make_image_response(make_png_bytes()))
+        renderer = MermaidInkRenderer("http://stub", transport=transport)
+        converter = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(),
+            renderer=renderer,
+            negative_cache=NegativeCache(),
+        )
+        converter.set_debug_mode(False)
+        converter.convert(self.content, "injected", include_toc=False)
+
+        self.assertTrue(transport.calls[0].startswith("http://stub/img/"))
+        self.assertEqual(converter.get_conversion_stats()["mermaid_diagrams"], 1)
+
+    def test_code_block_renderer_skips_diagrams(self):
+        """Test that the no-op backend leaves diagrams as code blocks"""
+        converter = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(), renderer=CodeBlockRenderer()
+        )
+        converter.set_debug_mode(False)
+        converter.convert(self.content, "code_only", include_toc=False)
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["mermaid_diagrams"], 0)
+        self.assertEqual(stats["code_blocks"], 1)
+
+
+def run_renderer_tests():
+    """Run all renderer tests"""
+    print("🧪 Running Renderer Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestRenderers))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterRendererInjection))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All renderer tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_renderer_tests()
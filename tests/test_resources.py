@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test suite for warm conversion resources
+
+Tests cover:
+- Pooled Markdown instances reset between uses and shared across threads
+- Styled template built once and copied per document
+- warmup() and readiness waiting
+- Warmup by the web launcher before the server starts
+- Converter output unchanged when resources are reused
+"""
+
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from docx import Document
+
+from readme2word import resources, web
+from readme2word.cache import DiagramCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.resources import ConversionResources, apply_document_styles
+
+# Add parent directory to path to import resources
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def document_parts(doc) -> dict:
+    """Body and styles XML of a saved document"""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as docx:
+        return {
+            name: docx.read(name) for name in ("word/document.xml", "word/styles.xml")
+        }
+
+
+class TestConversionResources(unittest.TestCase):
+    """Test cases for ConversionResources"""
+
+    def test_markdown_reused_and_reset(self):
+        """Test that borrowed Markdown instances are reused with fresh state"""
+        resources = ConversionResources()
+        with resources.borrow_markdown() as md:
+            md.convert("[ref]: https://example.com\n\nSee [it][ref]")
+            self.assertTrue(md.references)
+            with resources.borrow_markdown() as busy:
+                self.assertIsNot(busy, md)
+
+        with resources.borrow_markdown() as again:
+            self.assertIn(again, (md, busy))
+            self.assertFalse(again.references)
+
+    def test_warm_markdown_used_by_other_threads(self):
+        """Test that a conversion on a new thread gets the warmed-up instance"""
+        resources = ConversionResources()
+        resources.warmup()
+        with resources.borrow_markdown() as warm:
+            pass
+
+        borrowed = []
+
+        def convert():
+            with resources.borrow_markdown() as md:
+                borrowed.append(md)
+                md.convert("# Request thread")
+
+        thread = threading.Thread(target=convert)
+        thread.start()
+        thread.join()
+        self.assertIs(borrowed[0], warm)
+
+    def test_template_built_once_and_copied(self):
+        """Test that documents are independent copies of one template"""
+        calls = []
+
+        def setup(doc):
+            calls.append(doc)
+            apply_document_styles(doc)
+
+        resources = ConversionResources(setup=setup)
+        first = resources.new_document()
+        first.add_paragraph("only in the first document")
+        second = resources.new_document()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(second.paragraphs), 0)
+        self.assertIn("Code Block", [style.name for style in second.styles])
+
+    def test_template_matches_fresh_document(self):
+        """Test that a copied template saves like a freshly styled document"""
+        fresh = Document()
+        apply_document_styles(fresh)
+        copied = ConversionResources().new_document()
+        self.assertEqual(document_parts(copied), document_parts(fresh))
+
+    def test_warmup(self):
+        """Test that warmup() marks the resources ready"""
+        resources = ConversionResources()
+        self.assertFalse(resources.is_warm)
+        self.assertFalse(resources.wait_until_warm(timeout=0))
+
+        self.assertGreaterEqual(resources.warmup(), 0)
+        self.assertTrue(resources.is_warm)
+        self.assertTrue(resources.wait_until_warm(timeout=0))
+
+
+class TestConverterResources(unittest.TestCase):
+    """Test converter use of shared resources"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_conversion_on_new_thread_after_warmup(self):
+        """Test that a request thread converts without building a new parser"""
+        converter = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(), resources=ConversionResources()
+        )
+        converter.set_debug_mode(False)
+        converter.warmup()
+
+        outputs = []
+        with patch("markdown.Markdown", side_effect=AssertionError("cold parser")):
+            thread = threading.Thread(
+                target=lambda: outputs.append(converter.convert("# Doc\n", "doc"))
+            )
+            thread.start()
+            thread.join()
+        self.assertIsNotNone(outputs[0])
+        self.assertTrue(os.path.exists(outputs[0]))
+
+    def test_reused_resources_give_identical_documents(self):
+        """Test that warm and cold conversions write the same document"""
+        content = (
+            "# Doc\n\nSee [the site][site].\n\n[site]: https://example.com\n\n"
+            "| a | b |\n|---|---|\n| 1 | 2 |\n\n```\ncode\n```\n"
+        )
+        warm = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(), resources=ConversionResources()
+        )
+        warm.set_debug_mode(False)
+        warm.warmup()
+        documents = []
+        for name in ("first", "second"):
+            with zipfile.ZipFile(warm.convert(content, name)) as docx:
+                documents.append(docx.read("word/document.xml"))
+
+        cold = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(), resources=ConversionResources()
+        )
+        cold.set_debug_mode(False)
+        with zipfile.ZipFile(cold.convert(content, "cold")) as docx:
+            documents.append(docx.read("word/document.xml"))
+
+        self.assertEqual(len(set(documents)), 1)
+
+
+class TestWebLauncher(unittest.TestCase):
+    """Test that the web launcher warms up before serving"""
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("streamlit"), "Streamlit is not installed"
+    )
+    def test_warm_before_server_starts(self):
+        """Test that shared resources are warm when Streamlit starts"""
+        seen = []
+
+        def start_server():
+            seen.append((resources.get_default_resources().is_warm, list(sys.argv)))
+
+        with patch.object(resources, "_default_resources", None), patch(
+            "streamlit.web.cli.main", side_effect=start_server
+        ), patch.object(sys, "argv", ["readme2word-web", "--server.port=9000"]):
+            web.main()
+
+        self.assertEqual(len(seen), 1)
+        warm, argv = seen[0]
+        self.assertTrue(warm)
+        self.assertEqual(argv[:2], ["streamlit", "run"])
+        self.assertEqual(argv[-1], "--server.port=9000")
+
+
+def run_resources_tests():
+    """Run all conversion resources tests"""
+    print("🧪 Running Conversion Resources Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestConversionResources))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterResources))
+    suite.addTests(loader.loadTestsFromTestCase(TestWebLauncher))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All conversion resources tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_resources_tests()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Test suite for the streaming output backend
+
+Tests cover:
+- Documents equivalent to the in-memory backend, with images and SVGs
+- Blocks written out of the tree as soon as they are complete
+- No partial output left behind by failed conversions
+- Output backend selection and validation, including from the command line
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from docx import Document
+from lxml import etree
+
+from readme2word.cache import DiagramCache, NegativeCache
+from readme2word.cli import convert_file, main
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.resources import ConversionResources
+from readme2word.streaming import StreamingBodyBuilder
+from tests.helpers import FakeTransport, make_png_bytes
+from tests.test_svg import svg_or_png_handler
+
+# Add parent directory to path to import streaming
+sys.path.append(str(Path(__file__).parent.parent))
+
+CONTENT = """# Streaming
+
+Intro with **bold** and `code`.
+
+![first](one.png)
+
+## Details
+
+| Name | Value |
+|------|-------|
+| a | 1 |
+
+- item
+- another
+
+> quoted
+
+![again](one.png)
+
+![second](two.png)
+
+```python
+print("done")
+```
+"""
+
+
+def docx_parts(path) -> dict:
+    """Every part of a .docx, XML parts in exclusive canonical form"""
+    parts = {}
+    with zipfile.ZipFile(path) as docx:
+        for name in docx.namelist():
+            data = docx.read(name)
+            if name.endswith((".xml", ".rels")):
+                data = etree.tostring(
+                    etree.fromstring(data), method="c14n", exclusive=True
+                )
+            parts[name] = data
+    return parts
+
+
+class TestStreamingBackend(unittest.TestCase):
+    """Test cases for streaming conversion output"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def convert_both(self, content, **options):
+        """Convert with each backend and return their outputs"""
+        outputs = {}
+        for backend in ("docx", "stream"):
+            converter = ReadmeToWordConverter(output_backend=backend, **options)
+            converter.set_debug_mode(False)
+            outputs[backend] = converter.convert(content, backend, include_toc=True)
+        return outputs
+
+    def assert_equivalent(self, outputs):
+        """The two outputs hold the same parts with the same content"""
+        expected = docx_parts(outputs["docx"])
+        streamed = docx_parts(outputs["stream"])
+        self.assertEqual(sorted(streamed), sorted(expected))
+        for name in expected:
+            if name != "[Content_Types].xml":
+                self.assertEqual(streamed[name], expected[name], name)
+
+    def test_matches_docx_backend(self):
+        """Test that text, tables and deduplicated images match"""
+        Path("one.png").write_bytes(make_png_bytes(size=(120, 60)))
+        Path("two.png").write_bytes(make_png_bytes(size=(60, 120)))
+        outputs = self.convert_both(CONTENT, diagram_cache=DiagramCache())
+        self.assert_equivalent(outputs)
+
+        doc = Document(outputs["stream"])
+        self.assertEqual(len(doc.inline_shapes), 3)
+        self.assertEqual(len(doc.tables), 1)
+        self.assertIn("Details", [p.text for p in doc.paragraphs])
+        self.assertFalse(list(Path(self.temp_dir).glob("*.part")))
+
+    def test_svg_diagrams_match(self):
+        """Test that SVG diagrams and their fallbacks stream the same way"""
+        content = (
+            "# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n\n"
+            "```mermaid\ngraph TD\n    A --> C\n```\n"
+        )
+        outputs = self.convert_both(
+            content,
+            diagram_cache=DiagramCache(),
+            transport=FakeTransport(svg_or_png_handler),
+            negative_cache=NegativeCache(),
+            diagram_format="svg",
+        )
+        self.assert_equivalent(outputs)
+        with zipfile.ZipFile(outputs["stream"]) as docx:
+            content_types = docx.read("[Content_Types].xml").decode("utf-8")
+            svgs = [name for name in docx.namelist() if name.endswith(".svg")]
+        self.assertEqual(len(svgs), 1)
+        self.assertIn('Extension="svg"', content_types)
+
+    def test_blocks_leave_the_tree(self):
+        """Test that only the block being built stays in memory"""
+        doc = ConversionResources().new_document()
+        body = StreamingBodyBuilder(doc, "blocks.docx", Path(self.temp_dir))
+        for n in range(200):
+            body.add_paragraph(f"paragraph {n}")
+            # The newest paragraph and the section properties
+            self.assertLessEqual(len(doc.element.body), 2)
+        body.add_table(rows=2, cols=2, style="Table Grid").cell(0, 0).text = "cell"
+        body.save("blocks.docx")
+
+        saved = Document("blocks.docx")
+        self.assertEqual(len(saved.paragraphs), 200)
+        self.assertEqual(saved.paragraphs[-1].text, "paragraph 199")
+        self.assertEqual(saved.tables[0].cell(0, 0).text, "cell")
+        with self.assertRaises(ValueError):
+            body.add_paragraph("too late")
+
+    def test_save_requires_streamed_path(self):
+        """Test that the document can only be saved where it is streamed"""
+        doc = ConversionResources().new_document()
+        body = StreamingBodyBuilder(doc, "here.docx", Path(self.temp_dir))
+        with self.assertRaises(ValueError):
+            body.save("elsewhere.docx")
+        body.discard()
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_failed_conversion_leaves_nothing(self):
+        """Test that an error mid-conversion removes the partial file"""
+        converter = ReadmeToWordConverter(
+            diagram_cache=DiagramCache(), output_backend="stream"
+        )
+        converter.set_debug_mode(False)
+        with patch.object(converter, "_convert_list", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                converter.convert(CONTENT, "failed")
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_backend_selection(self):
+        """Test the default, environment override and validation"""
+        with patch.dict(os.environ, {}, clear=True):
+            converter = ReadmeToWordConverter(DiagramCache())
+            self.assertEqual(converter.output_backend, "docx")
+        with patch.dict(os.environ, {"README2WORD_OUTPUT_BACKEND": "stream"}):
+            converter = ReadmeToWordConverter(DiagramCache())
+            self.assertEqual(converter.output_backend, "stream")
+        with self.assertRaises(ValueError):
+            ReadmeToWordConverter(DiagramCache(), output_backend="pdf")
+
+    def test_command_line_backend(self):
+        """Test that main() passes options to convert_file by keyword"""
+        Path("README.md").write_text(CONTENT, encoding="utf-8")
+        argv = ["readme2word", "README.md", "--output-backend", "stream"]
+        argv += ["--renderer", "none", "--no-toc"]
+        with patch.object(sys, "argv", argv), patch("sys.stdout"):
+            with self.assertRaises(SystemExit) as exit_info:
+                main()
+        self.assertEqual(exit_info.exception.code, 0)
+        self.assertTrue(zipfile.is_zipfile("README.docx"))
+
+        with self.assertRaises(TypeError):
+            convert_file(Path("README.md"), "README.docx", "default", False, True)
+
+
+def run_streaming_tests():
+    """Run all streaming output tests"""
+    print("🧪 Running Streaming Output Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestStreamingBackend))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All streaming output tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_streaming_tests()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test suite for SVG diagram embedding
+
+Tests cover:
+- SVG verification
+- Fetching SVG and a small PNG fallback from the renderer
+- Vector embedding with a raster fallback in the saved .docx
+- Falling back to PNG for SVGs with HTML labels Word cannot draw
+"""
+
+import io
+import sys
+import unittest
+import zipfile
+from pathlib import Path
+
+from PIL import Image
+
+from readme2word.cache import DiagramCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.svg import SVG_BLIP_EXTENSION_URI, has_html_labels, verify_svg
+from tests.helpers import ConverterTestCase, make_image_response, make_png_bytes
+
+# Add parent directory to path to import svg
+sys.path.append(str(Path(__file__).parent.parent))
+
+SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="50">'
+    b'<rect width="100" height="50"/></svg>'
+)
+HTML_LABEL_SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="50">'
+    b'<g class="label"><foreignObject width="40" height="20">'
+    b'<div xmlns="http://www.w3.org/1999/xhtml">Start</div>'
+    b"</foreignObject></g></svg>"
+)
+
+
+def svg_or_png_handler(url):
+    """Serve SVG from /svg/ URLs and a large PNG from /img/ URLs"""
+    if "/svg/" in url:
+        response = make_image_response(SVG)
+        response.headers["content-type"] = "image/svg+xml"
+        return response
+    return make_image_response(make_png_bytes(size=(2000, 1000)))
+
+
+class TestSvgDiagrams(ConverterTestCase):
+    """Test cases for SVG diagram mode"""
+
+    def test_verify_svg(self):
+        """Test that only well-formed SVG documents are accepted"""
+        self.assertEqual(verify_svg(SVG), SVG)
+        self.assertIsNone(verify_svg(b"<html><body/></html>"))
+        self.assertIsNone(verify_svg(b"<svg"))
+
+    def test_unknown_format_is_rejected(self):
+        """Test that unsupported diagram formats raise ValueError"""
+        with self.assertRaises(ValueError):
+            ReadmeToWordConverter(diagram_cache=DiagramCache(), diagram_format="gif")
+
+    def test_svg_embedded_with_png_fallback(self):
+        """Test that the document holds the SVG part and a small PNG fallback"""
+        content = (
+            "# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n\n"
+            "```mermaid\ngraph TD\n    A --> B\n```\n"
+        )
+        converter = self.make_converter(svg_or_png_handler, diagram_format="svg")
+        output = converter.convert(content, "vector", include_toc=False)
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["vector_diagrams"], 2)
+        self.assertEqual(stats["svg_renders"], 1)
+        self.assertTrue(any("/svg/" in url for url in self.transport.calls))
+
+        with zipfile.ZipFile(output) as docx:
+            names = docx.namelist()
+            document = docx.read("word/document.xml").decode("utf-8")
+            content_types = docx.read("[Content_Types].xml").decode("utf-8")
+            pngs = [name for name in names if name.endswith(".png")]
+            svgs = [name for name in names if name.endswith(".svg")]
+            self.assertEqual(len(svgs), 1)
+            self.assertEqual(docx.read(svgs[0]), SVG)
+            with Image.open(io.BytesIO(docx.read(pngs[0]))) as fallback:
+                self.assertEqual(fallback.width, 432)
+
+        self.assertEqual(document.count(SVG_BLIP_EXTENSION_URI), 2)
+        self.assertIn("image/svg+xml", content_types)
+
+    def test_failed_svg_keeps_png(self):
+        """Test that a diagram whose SVG fails is still embedded as PNG"""
+
+        def handler(url):
+            if "/svg/" in url:
+                return make_image_response(b"<not-svg/>")
+            return make_image_response(make_png_bytes())
+
+        converter = self.make_converter(handler, diagram_format="svg")
+        converter.convert("# Doc\n\n```mermaid\ngraph TD\n    A --> B\n```\n", "raster")
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["images"], 1)
+        self.assertEqual(stats["vector_diagrams"], 0)
+
+    def test_html_labels_fall_back_to_png(self):
+        """Test that SVGs with foreignObject labels are not embedded"""
+        self.assertTrue(has_html_labels(HTML_LABEL_SVG))
+        self.assertFalse(has_html_labels(SVG))
+
+        def handler(url):
+            if "/svg/" in url:
+                response = make_image_response(HTML_LABEL_SVG)
+                response.headers["content-type"] = "image/svg+xml"
+                return response
+            return make_image_response(make_png_bytes())
+
+        converter = self.make_converter(handler, diagram_format="svg")
+        content = "# Doc\n\n```mermaid\ngraph TD\n    A[Start] --> B\n```\n"
+        output = converter.convert(content, "labels", include_toc=False)
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(stats["images"], 1)
+        self.assertEqual(stats["vector_diagrams"], 0)
+        self.assertEqual(stats["svg_renders"], 1)
+        self.assertEqual(stats["svg_html_label_fallbacks"], 1)
+        with zipfile.ZipFile(output) as docx:
+            self.assertFalse(any(name.endswith(".svg") for name in docx.namelist()))
+
+        # The rejected SVG is remembered, so converting again fetches nothing
+        calls = len(self.transport.calls)
+        converter.convert(content, "labels", include_toc=False)
+        self.assertEqual(len(self.transport.calls), calls)
+
+
+def run_svg_tests():
+    """Run all SVG diagram tests"""
+    print("🧪 Running SVG Diagram Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestSvgDiagrams))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All SVG diagram tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_svg_tests()
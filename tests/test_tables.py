@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Test suite for table construction
+
+Tests cover:
+- Output identical to filling python-docx cells one by one
+- Bold header cells, ragged rows, tabs and line breaks in cells
+- Large tables through the converter with both engines
+- Fixed layout with column widths sized from content and capped to the page
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from docx import Document
+from docx.oxml.ns import qn
+from docx.shared import Emu
+
+from readme2word.cache import DiagramCache
+from readme2word.converter import ReadmeToWordConverter
+from readme2word.tables import (
+    CELL_PADDING_TWIPS,
+    CHAR_WIDTH_TWIPS,
+    MIN_COLUMN_CHARS,
+    build_table,
+    column_widths,
+)
+
+# Add parent directory to path to import tables
+sys.path.append(str(Path(__file__).parent.parent))
+
+ROWS = [
+    [("Name", True), ("Value", True), ("Notes", True)],
+    [("alpha", False), ("1", False), (" padded ", False)],
+    [("beta", False), ("a\tb\nc", False)],
+    [("", False), ("", False), ("last", False)],
+]
+
+
+def build_cell_by_cell(doc, rows):
+    """Fill a table the way python-docx's cell API does"""
+    table = doc.add_table(rows=len(rows), cols=max(len(row) for row in rows))
+    table.style = "Table Grid"
+    for i, row in enumerate(rows):
+        for j, (text, header) in enumerate(row):
+            table.cell(i, j).text = text
+            if header:
+                for run in table.cell(i, j).paragraphs[0].runs:
+                    run.bold = True
+    return table
+
+
+class TestBuildTable(unittest.TestCase):
+    """Test cases for build_table"""
+
+    def test_matches_cell_by_cell_construction(self):
+        """Test that the XML equals the cell-by-cell result"""
+        expected = build_cell_by_cell(Document(), ROWS)
+        table = build_table(Document(), ROWS)
+        self.assertEqual(table._tbl.xml, expected._tbl.xml)
+
+    def test_table_contents(self):
+        """Test headers, padding of short rows and cell text"""
+        table = build_table(Document(), ROWS)
+        self.assertEqual(len(table.rows), 4)
+        self.assertEqual(len(table.columns), 3)
+        self.assertTrue(table.cell(0, 0).paragraphs[0].runs[0].bold)
+        self.assertIsNone(table.cell(1, 0).paragraphs[0].runs[0].bold)
+        self.assertEqual(table.cell(1, 2).text, " padded ")
+        self.assertEqual(table.cell(2, 1).text, "a\tb\nc")
+        self.assertEqual(table.cell(2, 2).text, "")
+
+    def test_empty_table(self):
+        """Test that a table without rows is still valid"""
+        table = build_table(Document(), [])
+        self.assertEqual(len(table.rows), 0)
+
+
+class TestFixedLayout(unittest.TestCase):
+    """Test cases for fixed-layout tables"""
+
+    def test_natural_widths(self):
+        """Test that narrow tables get room for their longest lines"""
+        rows = [[("Name", True), ("x", True)], [("first\nlonger line", False)]]
+        self.assertEqual(
+            column_widths(rows, 8640),
+            [
+                CELL_PADDING_TWIPS + CHAR_WIDTH_TWIPS * len("longer line"),
+                CELL_PADDING_TWIPS + CHAR_WIDTH_TWIPS * MIN_COLUMN_CHARS,
+            ],
+        )
+
+    def test_widths_capped_to_available(self):
+        """Test that wide columns share what narrow columns leave"""
+        rows = [[("id", False), ("a" * 300, False), ("b" * 100, False)]]
+        widths = column_widths(rows, 8640)
+        self.assertLessEqual(sum(widths), 8640)
+        self.assertEqual(
+            widths[0], CELL_PADDING_TWIPS + CHAR_WIDTH_TWIPS * MIN_COLUMN_CHARS
+        )
+        self.assertGreater(widths[1], widths[2])
+
+    def test_fixed_table(self):
+        """Test that the grid, cells and table width use the computed widths"""
+        doc = Document()
+        rows = [[("Name", True), ("Description", True)]]
+        rows += [[(f"item{n}", False), ("text " * 50, False)] for n in range(3)]
+        table = build_table(doc, rows, layout="fixed")
+        section = doc.sections[-1]
+        page = Emu(
+            section.page_width - section.left_margin - section.right_margin
+        ).twips
+
+        tbl = table._tbl
+        self.assertFalse(table.autofit)
+        grid = [int(col.get(qn("w:w"))) for col in tbl.tblGrid]
+        self.assertEqual(grid, column_widths(rows, page))
+        self.assertLessEqual(sum(grid), page)
+        self.assertEqual(int(tbl.tblPr.find(qn("w:tblW")).get(qn("w:w"))), sum(grid))
+        for row in table.rows:
+            self.assertEqual([cell.width.twips for cell in row.cells], grid)
+
+    def test_invalid_layout(self):
+        """Test that unknown layouts raise ValueError"""
+        with self.assertRaises(ValueError):
+            build_table(Document(), ROWS, layout="stretchy")
+        with self.assertRaises(ValueError):
+            ReadmeToWordConverter(DiagramCache(), table_layout="stretchy")
+
+
+class TestConverterTables(unittest.TestCase):
+    """Test tables converted from Markdown"""
+
+    def setUp(self):
+        """Run each test in a scratch working directory"""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        """Restore the working directory and clean up"""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_large_table(self):
+        """Test that a thousands-row table converts with every row intact"""
+        lines = ["| Endpoint | Method |", "|---|---|"]
+        lines += [f"| /api/{n} | GET |" for n in range(3000)]
+        content = "# API\n\n" + "\n".join(lines) + "\n"
+
+        documents = []
+        for engine in ("html", "ast"):
+            converter = ReadmeToWordConverter(
+                diagram_cache=DiagramCache(), engine=engine
+            )
+            converter.set_debug_mode(False)
+            output = converter.convert(content, engine)
+            self.assertEqual(converter.stats["tables"], 1)
+
+            table = Document(output).tables[0]
+            self.assertEqual(len(table.rows), 3001)
+            self.assertEqual(table.rows[-1].cells[0].text, "/api/2999")
+            self.assertTrue(table.rows[0].cells[1].paragraphs[0].runs[0].bold)
+            with zipfile.ZipFile(output) as docx:
+                documents.append(docx.read("word/document.xml"))
+
+        self.assertEqual(documents[0], documents[1])
+
+    def test_table_layout_option(self):
+        """Test that the converter defaults to autofit and honors the setting"""
+        content = "| a | b |\n|---|---|\n| 1 | 2 |\n"
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(
+                ReadmeToWordConverter(DiagramCache()).table_layout, "autofit"
+            )
+        with patch.dict(os.environ, {"README2WORD_TABLE_LAYOUT": "fixed"}):
+            converter = ReadmeToWordConverter(diagram_cache=DiagramCache())
+            converter.set_debug_mode(False)
+            output = converter.convert(content, "fixed")
+        self.assertFalse(Document(output).tables[0].autofit)
+
+
+def run_table_tests():
+    """Run all table construction tests"""
+    print("🧪 Running Table Construction Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestBuildTable))
+    suite.addTests(loader.loadTestsFromTestCase(TestFixedLayout))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterTables))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All table construction tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_table_tests()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test suite for the diagram HTTP transport
+
+Tests cover:
+- Connection pool and timeout configuration
+- Retry of transient errors and retryable status codes
+- Read timeouts raised without retrying unless enabled
+- Backoff limits and Retry-After handling
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from readme2word.transport import DiagramTransport
+
+# Add parent directory to path to import transport
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def make_response(status_code: int, headers=None) -> MagicMock:
+    """Create a fake HTTP response"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestDiagramTransport(unittest.TestCase):
+    """Test cases for DiagramTransport"""
+
+    def setUp(self):
+        """Create a transport that never sleeps between retries"""
+        self.transport = DiagramTransport(max_retries=2, connect_timeout=1.0)
+        sleep_patcher = patch("readme2word.transport.time.sleep")
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+        self.addCleanup(self.transport.close)
+
+    def test_session_uses_sized_pool(self):
+        """Test that the session adapter is sized to the pool setting"""
+        transport = DiagramTransport(pool_size=7)
+        adapter = transport.session.get_adapter("https://mermaid.ink/img/x")
+        self.assertEqual(adapter._pool_maxsize, 7)
+        transport.close()
+
+    def test_split_timeouts_are_passed(self):
+        """Test that connect and read timeouts are sent separately"""
+        with patch.object(
+            self.transport.session, "get", return_value=make_response(200)
+        ) as mock_get:
+            self.transport.get("https://example.com")
+
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], (1.0, 15.0))
+
+    def test_retries_transient_status(self):
+        """Test that 503 responses are retried until success"""
+        responses = [make_response(503), make_response(200)]
+        with patch.object(self.transport.session, "get", side_effect=responses):
+            response = self.transport.get("https://example.com")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.transport.get_stats()["retries"], 1)
+        self.mock_sleep.assert_called_once()
+
+    def test_does_not_retry_client_errors(self):
+        """Test that a 400 response is returned immediately"""
+        with patch.object(
+            self.transport.session, "get", return_value=make_response(400)
+        ) as mock_get:
+            response = self.transport.get("https://example.com")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_reraises_after_retries_exhausted(self):
+        """Test that the last connect timeout is raised after all retries"""
+        with patch.object(
+            self.transport.session,
+            "get",
+            side_effect=requests.exceptions.ConnectTimeout("unreachable"),
+        ) as mock_get:
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                self.transport.get("https://example.com")
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.transport.get_stats()["retries"], 2)
+
+    def test_read_timeouts_not_retried_by_default(self):
+        """Test that a slow renderer costs one read timeout, not one per retry"""
+        with patch.object(
+            self.transport.session,
+            "get",
+            side_effect=requests.exceptions.ReadTimeout("slow"),
+        ) as mock_get:
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                self.transport.get("https://example.com")
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.transport.get_stats()["retries"], 0)
+
+        self.transport.retry_read_timeouts = True
+        with patch.object(
+            self.transport.session,
+            "get",
+            side_effect=requests.exceptions.ReadTimeout("slow"),
+        ) as mock_get:
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                self.transport.get("https://example.com")
+
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_backoff_is_capped(self):
+        """Test exponential backoff with jitter stays under the cap"""
+        transport = DiagramTransport(backoff_factor=1.0, max_backoff=3.0)
+        for attempt in range(6):
+            delay = transport.backoff_delay(attempt)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, 3.0)
+        self.assertEqual(transport.backoff_delay(0, retry_after="2"), 2.0)
+        transport.close()
+
+
+def run_transport_tests():
+    """Run all transport tests"""
+    print("🧪 Running Transport Tests")
+    print("=" * 50)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDiagramTransport)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All transport tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_transport_tests()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test suite for local Mermaid validation
+
+Tests cover:
+- Acceptance of valid diagrams, directives, comments and front matter
+- Edge labels and link text containing brackets or '>'
+- Inline edge text ("-- text -->", "== text ==>") with unbalanced brackets
+- Rejection of empty bodies, unknown diagram types and unbalanced brackets
+- Converter fallback without a network call, with the reason in the stats
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from readme2word.validation import validate_mermaid
+from tests.helpers import (
+    ConverterTestCase,
+    FakeTransport,
+    make_image_response,
+    make_png_bytes,
+)
+
+# Add parent directory to path to import validation
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class TestMermaidValidation(unittest.TestCase):
+    """Test cases for validate_mermaid"""
+
+    def assertReason(self, source: str, reason: str):
+        issue = validate_mermaid(source)
+        self.assertIsNotNone(issue, source)
+        self.assertEqual(issue.reason, reason)
+
+    def test_valid_diagrams_pass(self):
+        """Test that well-formed diagrams of several types pass"""
+        diagrams = [
+            "graph TD\n    A[Start] --> B{Choice}\n    B -->|Yes| C((Done))",
+            "flowchart LR\n    A>Flag] --> B[(Database)]\n    B --> C{{Hex}}",
+            'graph TD\n    A["Quoted ( text"] --> B',
+            "sequenceDiagram\n    Alice->>Bob: Hi :)",
+            "erDiagram\n    CUSTOMER ||--o{ ORDER : places",
+            'pie title Pets\n    "Dogs" : 386',
+            "stateDiagram-v2\n    [*] --> Still",
+            "info",
+        ]
+        for source in diagrams:
+            with self.subTest(source=source):
+                self.assertIsNone(validate_mermaid(source))
+
+    def test_edge_text_is_not_a_bracket(self):
+        """Test that ">" in edge labels and link text is not a node shape"""
+        diagrams = [
+            "graph TD\n A -->|score>80| B",
+            "flowchart LR\n A -->|<b>yes</b>| B",
+            "graph TD\n A -- score>80 --> B",
+            "graph LR\n A -->|ok| B>Flag] & C>Other]",
+            "graph TD\n A[a|b] --> B",
+        ]
+        for source in diagrams:
+            with self.subTest(source=source):
+                self.assertIsNone(validate_mermaid(source))
+
+    def test_inline_edge_text_is_skipped(self):
+        """Test that brackets in "-- text -->" style edge text are ignored"""
+        diagrams = [
+            "graph TD\n A -- smile :) --> B",
+            "graph TD\n A -- see (note --> B",
+            "flowchart LR\n A == [draft ==> B",
+            "flowchart LR\n A -. maybe } .-> B",
+            "graph TD\n A -- open ( --- B[Done]",
+        ]
+        for source in diagrams:
+            with self.subTest(source=source):
+                self.assertIsNone(validate_mermaid(source))
+
+    def test_directives_comments_and_front_matter_are_skipped(self):
+        """Test that the type keyword is found after preamble lines"""
+        source = (
+            "---\ntitle: Example\n---\n"
+            "%%{init: {'theme': 'dark'}}%%\n"
+            "%% a comment\n\n"
+            "graph TD\n    A --> B"
+        )
+        self.assertIsNone(validate_mermaid(source))
+
+    def test_empty_body(self):
+        """Test that blank or comment-only diagrams are rejected"""
+        self.assertReason("", "empty_diagram")
+        self.assertReason("  \n%% only a comment\n", "empty_diagram")
+
+    def test_unknown_diagram_type(self):
+        """Test that a misspelled type keyword is rejected"""
+        self.assertReason("grpah TD\n    A --> B", "unknown_diagram_type")
+
+    def test_unbalanced_brackets(self):
+        """Test that unclosed and stray brackets in flowcharts are rejected"""
+        self.assertReason("graph TD\n    A[Start --> B", "unbalanced_brackets")
+        self.assertReason("flowchart LR\n    A --> B)", "unbalanced_brackets")
+        self.assertReason("graph TD\n    A[Start) --> B", "unbalanced_brackets")
+        self.assertReason("graph TD\n    A --> B>Flag", "unbalanced_brackets")
+        self.assertReason("graph TD\n    A -- text --> B(Done", "unbalanced_brackets")
+        self.assertReason("graph TD\n    A --x B(Done", "unbalanced_brackets")
+
+
+class TestConverterValidation(ConverterTestCase):
+    """Test converter behaviour for diagrams that fail validation"""
+
+    def setUp(self):
+        """Run each test in a scratch directory with a fake transport"""
+        super().setUp()
+        self.transport = FakeTransport(
+            lambda url: make_image_response(make_png_bytes())
+        )
+
+    def test_invalid_diagram_skips_renderer(self):
+        """Test that an invalid diagram falls back without a network call"""
+        content = (
+            "# Doc\n\n```mermaid\ngrpah TD\n    A --> B\n```\n\n"
+            "```mermaid\ngraph TD\n    A --> B\n```\n"
+        )
+        converter = self.make_converter()
+        converter.convert(content, "validated", include_toc=False)
+
+        stats = converter.get_conversion_stats()
+        self.assertEqual(len(self.transport.calls), 1)
+        self.assertEqual(stats["invalid_diagrams"], 1)
+        self.assertEqual(stats["mermaid_diagrams"], 1)
+        self.assertIn("unknown_diagram_type", stats["validation_errors"][0])
+
+    def test_validation_can_be_disabled(self):
+        """Test that disabled validation sends every diagram to the renderer"""
+        content = "# Doc\n\n```mermaid\ngrpah TD\n    A --> B\n```\n"
+        converter = self.make_converter(validate_diagrams=False)
+        converter.convert(content, "unvalidated", include_toc=False)
+
+        self.assertEqual(len(self.transport.calls), 1)
+        self.assertEqual(converter.get_conversion_stats()["invalid_diagrams"], 0)
+
+
+def run_validation_tests():
+    """Run all Mermaid validation tests"""
+    print("🧪 Running Mermaid Validation Tests")
+    print("=" * 50)
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromTestCase(TestMermaidValidation))
+    suite.addTests(loader.loadTestsFromTestCase(TestConverterValidation))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 50)
+    if result.wasSuccessful():
+        print("✅ All validation tests passed!")
+    else:
+        print(
+            f"❌ {len(result.failures)} test(s) failed, {len(result.errors)} error(s)"
+        )
+
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    run_validation_tests()